@@ -11,6 +11,7 @@ from pytz import UTC
 from contentstore.courseware_index import CoursewareSearchIndexer, LibrarySearchIndexer
 from contentstore.proctoring import register_special_exams
 from lms.djangoapps.grades.tasks import compute_all_grades_for_course
+from openedx.core.djangoapps.contentserver.caching import invalidate_assets_version
 from openedx.core.djangoapps.credit.signals import on_course_publish
 from openedx.core.lib.gating import api as gating_api
 from track.event_transaction_utils import get_event_transaction_id, get_event_transaction_type
@@ -56,12 +57,19 @@ def listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=
     # to perform any 'on_publish' workflow
     on_course_publish(course_key)
 
+    # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
+    from contentstore.tasks import update_search_index, update_transcript_availability_index
+
+    # Rebuild the index used by the video module to look up transcript assets
+    update_transcript_availability_index.delay(unicode(course_key))
+
+    # Assets saved without going through the asset views, as by course
+    # imports, don't invalidate the html rewritten with their urls.
+    invalidate_assets_version(course_key)
+
     # Finally call into the course search subsystem
     # to kick off an indexing action
     if CoursewareSearchIndexer.indexing_is_enabled():
-        # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
-        from contentstore.tasks import update_search_index
-
         update_search_index.delay(unicode(course_key), datetime.now(UTC).isoformat())
 
 
@@ -47,6 +47,7 @@ from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import DuplicateCourseError, ItemNotFoundError
 from xmodule.modulestore.xml_exporter import export_course_to_xml, export_library_to_xml
 from xmodule.modulestore.xml_importer import import_course_from_xml, import_library_from_xml
+from xmodule.video_module.transcripts_utils import build_transcript_availability_index
 
 LOGGER = get_task_logger(__name__)
 FILE_READ_CHUNK = 1024  # bytes
@@ -172,6 +173,12 @@ def update_search_index(course_id, triggered_time_isoformat):
         LOGGER.debug(u'Search indexing successful for complete course %s', course_id)
 
 
+@task()
+def update_transcript_availability_index(course_id):
+    """ Rebuilds the index of the transcript assets stored for the course. """
+    build_transcript_availability_index(CourseKey.from_string(course_id))
+
+
 @task()
 def update_library_index(library_id, triggered_time_isoformat):
     """ Updates course search index. """
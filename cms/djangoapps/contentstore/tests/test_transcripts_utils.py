@@ -14,6 +14,7 @@ from mock import Mock, patch
 from nose.plugins.skip import SkipTest
 
 from contentstore.tests.utils import mock_requests_get
+from request_cache.middleware import RequestCache
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
 from xmodule.exceptions import NotFoundError
@@ -173,6 +174,99 @@ class TestSaveSubsToStore(SharedModuleStoreTestCase):
             contentstore().find(self.content_location_unjsonable)
 
 
+@override_settings(CONTENTSTORE=TEST_DATA_CONTENTSTORE)
+class TestTranscriptAvailabilityIndex(SharedModuleStoreTestCase):
+    """Tests for the transcript availability index and the converted transcripts cache."""
+    ENABLED_CACHES = ['default']
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestTranscriptAvailabilityIndex, cls).setUpClass()
+        cls.course = CourseFactory.create()
+        cls.video_location = cls.course.id.make_usage_key('video', 'test_video')
+        cls.subs = {'start': [100], 'end': [200], 'text': ['subs #1']}
+
+    def setUp(self):
+        super(TestTranscriptAvailabilityIndex, self).setUp()
+        self.subs_id = uuid4().hex
+        self.subs_location = transcripts_utils.save_subs_to_store(self.subs, self.subs_id, self.course)
+        self.addCleanup(contentstore().delete, self.subs_location)
+
+    def test_build_index(self):
+        content = StaticContent(
+            StaticContent.compute_location(self.course.id, 'image.png'), 'image.png', 'image/png', 'data'
+        )
+        contentstore().save(content)
+        self.addCleanup(contentstore().delete, content.location)
+
+        index = transcripts_utils.get_transcript_availability_index(self.course.id)
+        self.assertIn(self.subs_location.path, index)
+        self.assertNotIn(content.location.path, index)
+
+    def test_save_invalidates_index(self):
+        index = transcripts_utils.get_transcript_availability_index(self.course.id)
+        other_location = transcripts_utils.save_subs_to_store(self.subs, uuid4().hex, self.course)
+        self.addCleanup(contentstore().delete, other_location)
+
+        self.assertNotIn(other_location.path, index)
+        self.assertIn(other_location.path, transcripts_utils.get_transcript_availability_index(self.course.id))
+
+    def test_asset_exists(self):
+        self.assertTrue(transcripts_utils.Transcript.asset_exists(self.video_location, self.subs_id))
+        self.assertFalse(transcripts_utils.Transcript.asset_exists(self.video_location, uuid4().hex))
+        self.assertFalse(
+            transcripts_utils.Transcript.asset_exists(self.video_location, transcripts_utils.NON_EXISTENT_TRANSCRIPT)
+        )
+
+    def test_index_read_once_per_request(self):
+        index = transcripts_utils.get_transcript_availability_index(self.course.id)
+        with patch.object(transcripts_utils.cache, 'get') as mock_get:
+            self.assertIs(transcripts_utils.get_transcript_availability_index(self.course.id), index)
+        self.assertFalse(mock_get.called)
+
+        # Saving a transcript invalidates the index of the current request too.
+        other_location = transcripts_utils.save_subs_to_store(self.subs, uuid4().hex, self.course)
+        self.addCleanup(contentstore().delete, other_location)
+        self.assertIn(other_location.path, transcripts_utils.get_transcript_availability_index(self.course.id))
+
+    @patch.object(transcripts_utils, 'TRANSCRIPT_AVAILABILITY_INDEX_MAX_SIZE', 0)
+    def test_index_too_large(self):
+        transcripts_utils.invalidate_transcript_availability_index(self.course.id)
+        self.assertIsNone(transcripts_utils.get_transcript_availability_index(self.course.id))
+
+        # The index isn't built again, and the contentstore is queried instead.
+        RequestCache.clear_request_cache()
+        with patch.object(contentstore(), 'get_all_content_for_course') as mock_get_all_content:
+            self.assertTrue(transcripts_utils.Transcript.asset_exists(self.video_location, self.subs_id))
+            self.assertFalse(transcripts_utils.Transcript.asset_exists(self.video_location, uuid4().hex))
+        self.assertFalse(mock_get_all_content.called)
+
+    def test_asset_exists_reads_index_only(self):
+        transcripts_utils.get_transcript_availability_index(self.course.id)
+        with patch.object(transcripts_utils.Transcript, 'get_asset') as mock_get_asset:
+            self.assertTrue(transcripts_utils.Transcript.asset_exists(self.video_location, self.subs_id))
+            self.assertFalse(transcripts_utils.Transcript.asset_exists(self.video_location, uuid4().hex))
+        self.assertFalse(mock_get_asset.called)
+
+    def test_converted_asset_is_cached(self):
+        filename = transcripts_utils.subs_filename(self.subs_id)
+        with patch.object(
+            transcripts_utils.Transcript, 'get_asset', wraps=transcripts_utils.Transcript.get_asset
+        ) as mock_get_asset:
+            for __ in range(2):
+                content = transcripts_utils.Transcript.converted_asset(
+                    self.video_location, filename, 'en', 'sjson', 'txt'
+                )
+                self.assertEqual(content, 'subs #1')
+            self.assertEqual(mock_get_asset.call_count, 1)
+
+    def test_converted_asset_not_found(self):
+        with self.assertRaises(NotFoundError):
+            transcripts_utils.Transcript.converted_asset(
+                self.video_location, transcripts_utils.subs_filename(uuid4().hex), 'en', 'sjson', 'srt'
+            )
+
+
 class TestYoutubeSubsBase(SharedModuleStoreTestCase):
     """
     Base class for tests of Youtube subs.  Using override_settings and
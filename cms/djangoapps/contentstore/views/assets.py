@@ -17,6 +17,7 @@ from xmodule.contentstore.django import contentstore
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
+from xmodule.video_module.transcripts_utils import invalidate_transcript_availability_index
 
 from contentstore.config.models import NewAssetsPageFlag
 from contentstore.utils import reverse_course_url
@@ -365,6 +366,7 @@ def update_course_run_asset(course_key, upload_file):
 
     contentstore().save(content)
     del_cached_content(content.location)
+    invalidate_transcript_availability_index(course_key)
 
     return content
 
@@ -526,6 +528,7 @@ def delete_asset(course_key, asset_key):
     _delete_thumbnail(content.thumbnail_location, course_key, asset_key)
     contentstore().delete(content.get_id())
     del_cached_content(content.location)
+    invalidate_transcript_availability_index(course_key)
 
 
 def _check_existence_and_get_asset_content(asset_key):
@@ -215,6 +215,9 @@ COURSES_WITH_UNSAFE_CODE = ENV_TOKENS.get("COURSES_WITH_UNSAFE_CODE", [])
 
 ASSET_IGNORE_REGEX = ENV_TOKENS.get('ASSET_IGNORE_REGEX', ASSET_IGNORE_REGEX)
 
+MAKO_MODULE_DIR = ENV_TOKENS.get('MAKO_MODULE_DIR', MAKO_MODULE_DIR)
+MAKO_PRELOAD_TEMPLATES = ENV_TOKENS.get('MAKO_PRELOAD_TEMPLATES', MAKO_PRELOAD_TEMPLATES)
+
 COMPREHENSIVE_THEME_DIRS = ENV_TOKENS.get('COMPREHENSIVE_THEME_DIRS', COMPREHENSIVE_THEME_DIRS) or []
 
 # COMPREHENSIVE_THEME_LOCALE_PATHS contain the paths to themes locale directories e.g.
@@ -318,6 +318,9 @@ GEOIPV6_PATH = REPO_ROOT / "common/static/data/geoip/GeoIPv6.dat"
 # Mako templating
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_cms')
+# Load the templates precompiled into MAKO_MODULE_DIR by the compile_mako_templates
+# management command at startup, instead of on first use in each process.
+MAKO_PRELOAD_TEMPLATES = False
 MAKO_TEMPLATE_DIRS_BASE = [
     PROJECT_ROOT / 'templates',
     COMMON_ROOT / 'templates',
@@ -3,7 +3,7 @@ Configuration for the edxmako Django application.
 """
 from django.apps import AppConfig
 from django.conf import settings
-from . import add_lookup, clear_lookups
+from . import add_lookup, clear_lookups, preload_templates
 
 
 class EdxMakoConfig(AppConfig):
@@ -28,3 +28,5 @@ class EdxMakoConfig(AppConfig):
             clear_lookups(namespace)
             for directory in directories:
                 add_lookup(namespace, directory)
+            if getattr(settings, 'MAKO_PRELOAD_TEMPLATES', False):
+                preload_templates(namespace)
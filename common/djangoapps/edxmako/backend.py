@@ -4,6 +4,8 @@ Django template system engine for Mako templates.
 from __future__ import absolute_import, unicode_literals
 
 import logging
+import time
+from functools import wraps
 
 from django.template import TemplateDoesNotExist, TemplateSyntaxError
 from django.template.backends.base import BaseEngine
@@ -12,6 +14,7 @@ from django.utils.functional import cached_property
 from django.utils.module_loading import import_string
 from mako.exceptions import MakoException, TopLevelLookupException, text_error_template
 
+from openedx.core.djangoapps import monitoring_utils
 from openedx.core.djangoapps.theming.helpers import get_template_path
 
 from .paths import lookup_template
@@ -64,4 +67,25 @@ class Mako(BaseEngine):
         """
         context_processors = _builtin_context_processors
         context_processors += tuple(self.context_processors)
-        return tuple(import_string(path) for path in context_processors)
+        return tuple(_instrumented(path, import_string(path)) for path in context_processors)
+
+
+def _instrumented(path, processor):
+    """
+    Wraps the context processor imported from path, so that the time spent in
+    it is reported as a custom metric of the request.
+    """
+    metric_name = u'edxmako.context_processors.{}.ms'.format(path)
+
+    @wraps(processor)
+    def instrumented_processor(request):
+        """
+        Runs the context processor and accumulates its duration.
+        """
+        start = time.time()
+        try:
+            return processor(request)
+        finally:
+            monitoring_utils.accumulate(metric_name, (time.time() - start) * 1000)
+
+    return instrumented_processor
@@ -0,0 +1,91 @@
+"""
+Microbenchmark of the time taken by a new process to load the template of
+each page type, e.g.
+
+    ./manage.py lms benchmark_mako_startup --template dashboard.html --template courseware/courseware.html
+
+Each template is loaded by a fresh template lookup, as a newly started process
+would, when it has to be compiled and when it was precompiled. A fresh lookup
+also preloads the precompiled template, as a process started with
+MAKO_PRELOAD_TEMPLATES would at startup, before the template is looked up.
+"""
+import shutil
+import tempfile
+import timeit
+from functools import partial
+from textwrap import dedent
+
+from django.core.management.base import BaseCommand
+from mako.exceptions import TopLevelLookupException
+
+from edxmako import LOOKUP
+from edxmako.paths import DynamicTemplateLookup
+
+DEFAULT_TEMPLATES = (
+    'main.html',
+    'index.html',
+    'dashboard.html',
+    'courseware/courseware.html',
+    'courseware/progress.html',
+    'login.html',
+    'course_outline.html',
+    'container.html',
+)
+
+
+def _new_lookup(lookup, module_directory):
+    """
+    Returns a new lookup of the same directories as the given lookup,
+    compiling templates into module_directory.
+    """
+    new_lookup = DynamicTemplateLookup(**dict(lookup.template_args, module_directory=module_directory))
+    for directory in lookup.directories:
+        new_lookup.add_directory(directory)
+    return new_lookup
+
+
+class Command(BaseCommand):
+    help = dedent(__doc__).strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--namespace',
+            default='main',
+            help='Template namespace of the templates.',
+        )
+        parser.add_argument(
+            '--template',
+            action='append',
+            dest='templates',
+            help='Template of a page type; may be repeated. Defaults to common LMS and Studio pages.',
+        )
+
+    def handle(self, *args, **options):
+        lookup = LOOKUP[options['namespace']]
+        templates = options['templates'] or DEFAULT_TEMPLATES
+        module_directory = tempfile.mkdtemp()
+        try:
+            for uri in templates:
+                compile_lookup = _new_lookup(lookup, module_directory)
+                try:
+                    compile_seconds = timeit.timeit(partial(compile_lookup.get_template, uri), number=1)
+                except TopLevelLookupException:
+                    continue
+
+                precompiled_lookup = _new_lookup(lookup, module_directory)
+                load_seconds = timeit.timeit(partial(precompiled_lookup.get_template, uri), number=1)
+
+                preloaded_lookup = _new_lookup(lookup, module_directory)
+                preloaded_lookup.write_manifest([uri])
+                preload_seconds = timeit.timeit(preloaded_lookup.preload_templates, number=1)
+                preloaded_seconds = timeit.timeit(partial(preloaded_lookup.get_template, uri), number=1)
+
+                self.stdout.write(
+                    u'{}: compiled {:.2f} ms, precompiled {:.2f} ms, '
+                    u'preloaded {:.3f} ms after preloading at startup for {:.2f} ms'.format(
+                        uri, compile_seconds * 1000, load_seconds * 1000, preloaded_seconds * 1000,
+                        preload_seconds * 1000,
+                    )
+                )
+        finally:
+            shutil.rmtree(module_directory)
@@ -0,0 +1,27 @@
+"""
+Precompile all the Mako templates of every template namespace, including the
+templates of the themes, into MAKO_MODULE_DIR, e.g.
+
+    ./manage.py lms compile_mako_templates
+
+Processes started with MAKO_PRELOAD_TEMPLATES set load the precompiled
+templates at startup.
+"""
+from textwrap import dedent
+
+from django.core.management.base import BaseCommand
+
+from edxmako import LOOKUP
+
+
+class Command(BaseCommand):
+    help = dedent(__doc__).strip()
+
+    def handle(self, *args, **options):
+        for namespace, lookup in sorted(LOOKUP.items()):
+            compiled, failed = lookup.compile_templates()
+            self.stdout.write(u'{}: compiled {} templates into {}'.format(
+                namespace, len(compiled), lookup.template_args['module_directory']
+            ))
+            for uri in failed:
+                self.stdout.write(u'{}: unable to compile {}'.format(namespace, uri))
@@ -4,6 +4,8 @@ Set up lookup paths for mako templates.
 
 import contextlib
 import hashlib
+import json
+import logging
 import os
 
 import pkg_resources
@@ -17,6 +19,15 @@ from openedx.core.djangoapps.theming.helpers import get_template_path_with_theme
 
 from . import LOOKUP
 
+log = logging.getLogger(__name__)
+
+# Extensions of the files of the lookup directories that are precompiled as templates.
+TEMPLATE_EXTENSIONS = ('.html', '.xml', '.txt')
+
+# Name of the file listing the templates of a namespace precompiled in a lookup's
+# module directory, which may be shared by the lookups of several namespaces.
+COMPILED_TEMPLATES_MANIFEST = 'compiled_templates.{}.json'
+
 
 class TopLevelTemplateURI(unicode):
     """
@@ -31,8 +42,12 @@ class DynamicTemplateLookup(TemplateLookup):
     """
     A specialization of the standard mako `TemplateLookup` class which allows
     for adding directories progressively.
+
+    The optional `namespace` argument names the manifest of the templates
+    precompiled by the lookup.
     """
     def __init__(self, *args, **kwargs):
+        self.namespace = kwargs.pop('namespace', None) or 'default'
         super(DynamicTemplateLookup, self).__init__(*args, **kwargs)
         self.__original_module_directory = self.template_args['module_directory']
 
@@ -110,6 +125,88 @@ class DynamicTemplateLookup(TemplateLookup):
 
         return template
 
+    def get_template_uris(self):
+        """
+        Returns the sorted URIs of all the templates in the lookup directories,
+        including the templates of the themes found in them.
+        """
+        uris = set()
+        for directory in self.directories:
+            for dir_path, dir_names, file_names in os.walk(directory, followlinks=True):
+                # The static assets of themes are not templates.
+                dir_names[:] = [dir_name for dir_name in dir_names if dir_name != 'static']
+                for file_name in file_names:
+                    if os.path.splitext(file_name)[1] in TEMPLATE_EXTENSIONS:
+                        relative_path = os.path.relpath(os.path.join(dir_path, file_name), directory)
+                        uris.add(relative_path.replace(os.sep, '/'))
+        return sorted(uris)
+
+    def compile_templates(self):
+        """
+        Compiles all the templates of the lookup directories into the lookup's module
+        directory, and records them in its manifest for `preload_templates`.
+
+        Returns:
+            (list, list): the URIs of the compiled templates, and of the templates that failed to compile
+        """
+        compiled, failed = [], []
+        for uri in self.get_template_uris():
+            try:
+                super(DynamicTemplateLookup, self).get_template(uri)
+            except Exception:  # pylint: disable=broad-except
+                # Not every file in the template directories is a Mako template.
+                log.debug(u'Unable to compile %s', uri, exc_info=True)
+                failed.append(uri)
+            else:
+                compiled.append(uri)
+
+        self.write_manifest(compiled)
+        return compiled, failed
+
+    def write_manifest(self, uris):
+        """
+        Records the given URIs of compiled templates in the lookup's manifest.
+        """
+        module_directory = self.template_args['module_directory']
+        if not os.path.isdir(module_directory):
+            os.makedirs(module_directory)
+        with open(self._manifest_path(), 'w') as manifest:
+            json.dump(uris, manifest)
+
+    def _manifest_path(self):
+        """
+        Returns the path of the lookup's manifest in its module directory.
+        """
+        return os.path.join(self.template_args['module_directory'], COMPILED_TEMPLATES_MANIFEST.format(self.namespace))
+
+    def preload_templates(self):
+        """
+        Loads the templates listed in the lookup's manifest, so that no request
+        has to load them. Templates whose source changed since they were compiled
+        are compiled again. Does nothing if the templates were not precompiled.
+
+        Returns:
+            int: the number of loaded templates
+        """
+        try:
+            with open(self._manifest_path()) as manifest:
+                uris = json.load(manifest)
+        except (IOError, ValueError):
+            log.info(u'No precompiled templates in %s', self.template_args['module_directory'])
+            return 0
+
+        loaded = 0
+        for uri in uris:
+            try:
+                template = super(DynamicTemplateLookup, self).get_template(uri)
+            except Exception:  # pylint: disable=broad-except
+                log.warning(u'Unable to preload template %s', uri, exc_info=True)
+                continue
+            # Templates are also looked up by absolute URI when inherited or included.
+            self._collection.setdefault('/' + uri, template)
+            loaded += 1
+        return loaded
+
     def _get_toplevel_template(self, uri):
         """
         Lookup a default/toplevel template, ignoring current theme.
@@ -137,17 +234,30 @@ def add_lookup(namespace, directory, package=None, prepend=False):
     templates = LOOKUP.get(namespace)
     if not templates:
         LOOKUP[namespace] = templates = DynamicTemplateLookup(
+            namespace=namespace,
             module_directory=settings.MAKO_MODULE_DIR,
             output_encoding='utf-8',
             input_encoding='utf-8',
             default_filters=['decode.utf8'],
             encoding_errors='replace',
+            # Only check whether templates changed on disk in development, so that
+            # looking up an already compiled template does not stat its file.
+            filesystem_checks=settings.DEBUG,
         )
     if package:
         directory = pkg_resources.resource_filename(package, directory)
     templates.add_directory(directory, prepend=prepend)
 
 
+def preload_templates(namespace):
+    """
+    Loads the precompiled Mako templates of the given namespace.
+    """
+    if namespace in LOOKUP:
+        loaded = LOOKUP[namespace].preload_templates()
+        log.info(u'Preloaded %d templates for the %s template namespace', loaded, namespace)
+
+
 @request_cached
 def lookup_template(namespace, name):
     """
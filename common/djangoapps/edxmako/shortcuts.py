@@ -19,6 +19,8 @@ from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.http import HttpResponse
 from django.template import engines
+from django.utils.functional import lazy
+from six import text_type
 
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
 from openedx.core.djangoapps.theming.helpers import is_request_in_themed_site
@@ -95,6 +97,9 @@ def is_marketing_link_set(name):
         return name in settings.MKTG_URL_LINK_MAP
 
 
+lazy_marketing_link = lazy(marketing_link, text_type)  # pylint: disable=invalid-name
+
+
 def marketing_link_context_processor(request):
     """
     A django context processor to give templates access to marketing URLs
@@ -102,7 +107,8 @@ def marketing_link_context_processor(request):
     Returns a dict whose keys are the marketing link names usable with the
     marketing_link method (e.g. 'ROOT', 'CONTACT', etc.) prefixed with
     'MKTG_URL_' and whose values are the corresponding URLs as computed by the
-    marketing_link method.
+    marketing_link method. The URLs are computed lazily, only for the links that
+    are rendered.
     """
     marketing_urls = configuration_helpers.get_value(
         'MKTG_URLS',
@@ -111,7 +117,7 @@ def marketing_link_context_processor(request):
 
     return dict(
         [
-            ("MKTG_URL_" + k, marketing_link(k))
+            ("MKTG_URL_" + k, lazy_marketing_link(k))
             for k in (
                 settings.MKTG_URL_LINK_MAP.viewkeys() |
                 marketing_urls.viewkeys()
@@ -17,6 +17,9 @@ from django.template import Context, engines
 from mako.template import Template as MakoTemplate
 from six import text_type
 
+import request_cache
+from openedx.core.djangoapps import monitoring_utils
+
 from . import Engines, LOOKUP
 from .request_context import get_template_request_context
 from .shortcuts import is_any_marketing_link_set, is_marketing_link_set, marketing_link
@@ -73,9 +76,23 @@ class Template(object):
     def _get_context_processors_output_dict(self, context_object):
         """
         Run the context processors for the given context and get the output as a new dictionary.
+
+        The output for the context of a request is computed once per request, template engine
+        and user, and shared by all the templates rendered during the request.
         """
-        with context_object.bind_template(self):
-            return context_object.flatten()
+        request = getattr(context_object, 'request', None)
+        if request is None:
+            with context_object.bind_template(self):
+                return context_object.flatten()
+
+        request_cache_dict = request_cache.get_cache('edxmako')
+        # The user changes when logging in or out during the request.
+        cache_key = ('context_processors_output', self.engine.name, id(getattr(request, 'user', None)))
+        if cache_key not in request_cache_dict:
+            with context_object.bind_template(self):
+                request_cache_dict[cache_key] = context_object.flatten()
+            monitoring_utils.increment('edxmako.context_processors.runs')
+        return dict(request_cache_dict[cache_key])
 
     @staticmethod
     def _add_core_context(context_dictionary):
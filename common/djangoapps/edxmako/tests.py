@@ -1,3 +1,4 @@
+import os
 import unittest
 
 import ddt
@@ -9,9 +10,11 @@ from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from mock import Mock, patch
 
-from edxmako import LOOKUP, add_lookup
+from edxmako import LOOKUP, add_lookup, clear_lookups
 from edxmako.request_context import get_template_request_context
 from edxmako.shortcuts import is_any_marketing_link_set, is_marketing_link_set, marketing_link, render_to_string
+from edxmako.template import Template
+from openedx.core.lib.tempdir import mkdtemp_clean
 from request_cache.middleware import RequestCache
 from student.tests.factories import UserFactory
 from util.testing import UrlResetMixin
@@ -76,6 +79,75 @@ class AddLookupTests(TestCase):
         self.assertTrue(dirs[0].endswith('management'))
 
 
+class PrecompiledTemplatesTests(TestCase):
+    """
+    Test the precompilation and preloading of the templates of a lookup.
+    """
+    def setUp(self):
+        super(PrecompiledTemplatesTests, self).setUp()
+        self.template_dir = mkdtemp_clean()
+        os.makedirs(os.path.join(self.template_dir, 'static'))
+        for path, source in (
+                ('page.html', u'${1 + 1}'),
+                ('broken.html', u'${'),
+                ('static/asset.html', u'${1 + 1}'),
+                ('view.underscore', u'<%= name %>'),
+        ):
+            with open(os.path.join(self.template_dir, path), 'w') as template_file:
+                template_file.write(source)
+
+        patcher = patch.dict('edxmako.LOOKUP', clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        settings_override = override_settings(MAKO_MODULE_DIR=mkdtemp_clean())
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_template_uris(self):
+        add_lookup('test', self.template_dir)
+        self.assertEqual(LOOKUP['test'].get_template_uris(), ['broken.html', 'page.html'])
+
+    def test_compile_and_preload(self):
+        add_lookup('test', self.template_dir)
+        self.assertEqual(LOOKUP['test'].compile_templates(), (['page.html'], ['broken.html']))
+
+        # A new process would create new lookups.
+        clear_lookups('test')
+        add_lookup('test', self.template_dir)
+        self.assertEqual(LOOKUP['test'].preload_templates(), 1)
+        with patch('mako.template._compile_module_file') as mock_compile_text:
+            self.assertEqual(LOOKUP['test'].get_template('page.html').render_unicode(), u'2')
+            self.assertEqual(LOOKUP['test'].get_template('/page.html').render_unicode(), u'2')
+        self.assertFalse(mock_compile_text.called)
+
+    def test_namespaces_sharing_module_directory(self):
+        other_template_dir = mkdtemp_clean()
+        with open(os.path.join(other_template_dir, 'other.html'), 'w') as template_file:
+            template_file.write(u'${2 + 2}')
+        add_lookup('test', self.template_dir)
+        add_lookup('other', self.template_dir)
+        add_lookup('other', other_template_dir)
+
+        # The lookups of both namespaces compile into the same directory.
+        LOOKUP['test'].template_args['module_directory'] = LOOKUP['other'].template_args['module_directory']
+        LOOKUP['other'].compile_templates()
+        LOOKUP['test'].compile_templates()
+
+        # A new process would create new lookups.
+        clear_lookups('other')
+        add_lookup('other', self.template_dir)
+        add_lookup('other', other_template_dir)
+        self.assertEqual(LOOKUP['other'].preload_templates(), 2)
+        with patch('mako.template._compile_module_file') as mock_compile_text:
+            self.assertEqual(LOOKUP['other'].get_template('other.html').render_unicode(), u'4')
+        self.assertFalse(mock_compile_text.called)
+
+    def test_preload_without_precompiled_templates(self):
+        add_lookup('test', self.template_dir)
+        self.assertEqual(LOOKUP['test'].preload_templates(), 0)
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
@@ -134,6 +206,29 @@ class MakoRequestContextTest(TestCase):
             # requestcontext should be None, because the cache isn't filled
             self.assertIsNone(get_template_request_context())
 
+    def test_context_processors_run_once_per_request(self):
+        """
+        Test that the output of the context processors is shared by the templates rendered during a request.
+        """
+        template = Template(u'${user.username}')
+        with patch('edxmako.template.monitoring_utils') as mock_monitoring_utils:
+            for __ in range(3):
+                self.assertEqual(template.render(request=self.request), self.user.username)
+            mock_monitoring_utils.increment.assert_called_once_with('edxmako.context_processors.runs')
+
+            RequestCache.clear_request_cache()
+            template.render(request=self.request)
+            self.assertEqual(mock_monitoring_utils.increment.call_count, 2)
+
+    def test_context_processors_run_again_for_new_user(self):
+        """
+        Test that the context processors are run again when the user changes during a request.
+        """
+        template = Template(u'${user.username}')
+        self.assertEqual(template.render(request=self.request), self.user.username)
+        self.request.user = UserFactory.create()
+        self.assertEqual(template.render(request=self.request), self.request.user.username)
+
     @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
     def test_render_to_string_when_no_global_context_lms(self):
         """
@@ -800,6 +800,8 @@ def dashboard(request):
     urls, program_data = {}, {}
     bundles_on_dashboard_flag = WaffleFlag(WaffleFlagNamespace(name=u'student.experiments'), u'bundles_on_dashboard')
 
+    # The bundle needs serialized course lists rather than the counts kept in
+    # the ProgramProgress record, so progress is computed here when enabled.
     if (bundles_on_dashboard_flag.is_enabled()):
         programs_data = meter.programs
         if programs_data:
@@ -4,6 +4,7 @@ xModule implementation of a learning sequence
 
 # pylint: disable=abstract-method
 import collections
+import hashlib
 import json
 import logging
 from datetime import datetime
@@ -205,9 +206,43 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
             else:
                 self.position = 1
             return json.dumps({'success': True})
+        elif dispatch == 'render_unit':
+            return json.dumps(self._render_unit_on_demand(data))
 
         raise NotFoundError('Unexpected dispatch type')
 
+    def _render_unit_on_demand(self, data):
+        """
+        Returns the content and the resources of the rendered student view
+        of the display item at the requested position, for units that are
+        not rendered with the student view of the sequence.
+        """
+        if self._hidden_content_student_view({}) or self._special_exam_student_view():
+            raise NotFoundError('The content of this sequence is not available')
+        display_items = self.get_display_items()
+        position = data.get('position', u'')
+        if not position.isdigit() or not 1 <= int(position) <= len(display_items):
+            raise NotFoundError('Unexpected position')
+
+        item = display_items[int(position) - 1]
+        context = {
+            'username': self.runtime.service(self, 'user').get_current_user().opt_attrs.get(
+                'edx-platform.username'),
+            'show_bookmark_button': True,
+            'bookmarked': self.runtime.service(self, 'bookmarks').is_bookmarked(usage_key=item.scope_ids.usage_id),
+        }
+        rendered_item = item.render(STUDENT_VIEW, context)
+
+        # As with the XBlock view endpoint, the resources are keyed by their
+        # hash, so that the page loads each of them once.
+        hashed_resources = collections.OrderedDict()
+        for resource in rendered_item.resources:
+            hashed_resources[hashlib.md5(repr(tuple(resource))).hexdigest()] = resource._asdict()
+        return {
+            'html': rendered_item.content,
+            'resources': hashed_resources.items(),
+        }
+
     @classmethod
     def verify_current_content_visibility(cls, date, hide_after_date):
         """
@@ -231,6 +266,9 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
             banner_text, special_html = special_html_view
             if special_html and not masquerading_as_specific_student:
                 return Fragment(special_html)
+            # The units of a sequence that is hidden from the learner are
+            # not available on demand, so they are all rendered.
+            context = dict(context, render_units_on_demand=False)
         else:
             banner_text = self._gated_content_staff_banner()
         return self._student_view(context, banner_text)
@@ -299,6 +337,13 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
         # NOTE (CCB): We default to true to maintain the behavior in place prior to allowing anonymous access access.
         return context.get('user_authenticated', True)
 
+    def _renders_units_on_demand(self, context):
+        """
+        Returns whether only the unit at the position of the sequence is
+        rendered with its student view for the given context.
+        """
+        return self.is_user_authenticated(context) and context.get('render_units_on_demand', False)
+
     def _student_view(self, context, banner_text=None):
         """
         Returns the rendered student view of the content of this
@@ -323,7 +368,10 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
         }
         fragment.add_content(self.system.render_template("seq_module.html", params))
 
-        self._capture_full_seq_item_metrics(display_items)
+        # The sequence as a whole is not examined when units are rendered on
+        # demand, so that the items of the other units are not bound.
+        if not self._renders_units_on_demand(context):
+            self._capture_full_seq_item_metrics(display_items)
         self._capture_current_unit_metrics(display_items)
 
         return fragment
@@ -348,14 +396,33 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
         elif self.position is None or self.position > number_of_display_items:
             self.position = 1
 
+    def get_active_display_item(self, context):
+        """
+        Returns the display item at the position of the sequence for the
+        given context, which is the item rendered by its student view, or
+        None if the sequence has no display items.
+        """
+        display_items = self.get_display_items()
+        self._update_position(context, len(display_items))
+        return display_items[self.position - 1] if display_items else None
+
     def _render_student_view_for_items(self, context, display_items, fragment):
         """
         Updates the given fragment with rendered student views of the given
         display_items.  Returns a list of dict objects with information about
         the given display_items.
+
+        If the context sets render_units_on_demand, only the display item at
+        the position of the sequence is rendered for authenticated users, and
+        the content of the other items is None. They are rendered when the
+        learner navigates to them, with the render_unit dispatch.
         """
         is_user_authenticated = self.is_user_authenticated(context)
-        bookmarks_service = self.runtime.service(self, 'bookmarks')
+        render_units_on_demand = self._renders_units_on_demand(context)
+        if is_user_authenticated:
+            bookmarked_items = self.runtime.service(self, 'bookmarks').are_bookmarked(
+                [item.scope_ids.usage_id for item in display_items]
+            )
         context['username'] = self.runtime.service(self, 'user').get_current_user().opt_attrs.get(
             'edx-platform.username')
         display_names = [
@@ -363,9 +430,10 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
             self.display_name_with_default
         ]
         contents = []
-        for item in display_items:
+        for position, item in enumerate(display_items, start=1):
+            is_rendered = not render_units_on_demand or position == self.position
             # NOTE (CCB): This seems like a hack, but I don't see a better method of determining the type/category.
-            item_type = item.get_icon_class()
+            item_type = item.get_icon_class() if is_rendered else self._get_unrendered_icon_class(item)
             usage_id = item.scope_ids.usage_id
 
             if item_type == 'problem' and not is_user_authenticated:
@@ -380,16 +448,20 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
 
             if is_user_authenticated:
                 show_bookmark_button = True
-                is_bookmarked = bookmarks_service.is_bookmarked(usage_key=usage_id)
+                is_bookmarked = bookmarked_items[usage_id]
 
             context['show_bookmark_button'] = show_bookmark_button
             context['bookmarked'] = is_bookmarked
 
-            rendered_item = item.render(STUDENT_VIEW, context)
-            fragment.add_frag_resources(rendered_item)
+            if is_rendered:
+                rendered_item = item.render(STUDENT_VIEW, context)
+                fragment.add_frag_resources(rendered_item)
+                content = rendered_item.content
+            else:
+                content = None
 
             iteminfo = {
-                'content': rendered_item.content,
+                'content': content,
                 'page_title': getattr(item, 'tooltip_title', ''),
                 'type': item_type,
                 'id': text_type(usage_id),
@@ -401,6 +473,22 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
 
         return contents
 
+    def _get_unrendered_icon_class(self, item):
+        """
+        Returns the icon class of the given display item, as judged by the
+        block types of its children, so that they are not bound for a unit
+        that is not rendered. Unlike get_icon_class, it does not look into
+        containers such as split_test or conditional blocks.
+        """
+        if not item.has_children:
+            return item.get_icon_class()
+        child_classes = set(child.block_type for child in item.children)
+        new_class = 'other'
+        for c in class_priority:
+            if c in child_classes:
+                new_class = c
+        return new_class
+
     def _locations_in_subtree(self, node):
         """
         The usage keys for all descendants of an XBlock/XModule as a flat list.
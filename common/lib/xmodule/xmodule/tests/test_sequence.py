@@ -2,10 +2,12 @@
 Tests for sequence module.
 """
 # pylint: disable=no-member
+import json
 from datetime import timedelta
 from django.utils.timezone import now
 from freezegun import freeze_time
 from mock import Mock, patch
+from xmodule.exceptions import NotFoundError
 from xmodule.seq_module import SequenceModule
 from xmodule.tests import get_test_system
 from xmodule.tests.helpers import StubUserService
@@ -71,7 +73,9 @@ class SequenceBlockTestCase(XModuleXmlImportTest):
 
         self._set_up_module_system(block)
 
-        block.xmodule_runtime._services['bookmarks'] = Mock()  # pylint: disable=protected-access
+        block.xmodule_runtime._services['bookmarks'] = Mock(  # pylint: disable=protected-access
+            are_bookmarked=lambda usage_keys: dict.fromkeys(usage_keys, False),
+        )
         block.xmodule_runtime._services['user'] = StubUserService()  # pylint: disable=protected-access
         block.xmodule_runtime.xmodule_instance = getattr(block, '_xmodule', None)  # pylint: disable=protected-access
         block.parent = parent.location
@@ -134,6 +138,51 @@ class SequenceBlockTestCase(XModuleXmlImportTest):
         for child in self.sequence_3_1.children:
             self.assertIn("'page_title': '{}'".format(child.name), html)
 
+    def test_render_units_on_demand(self):
+        html = self._get_rendered_student_view(
+            self.sequence_3_1,
+            requested_child='last',
+            extra_context=dict(render_units_on_demand=True),
+        )
+        self._assert_view_at_position(html, expected_position=3)
+        self.assertEqual(html.count('vert_module.html'), 1)
+        self.assertEqual(html.count("'content': None"), 2)
+
+    def test_render_units_on_demand_anonymous(self):
+        html = self._get_rendered_student_view(
+            self.sequence_3_1,
+            extra_context=dict(render_units_on_demand=True, user_authenticated=False),
+        )
+        self.assertEqual(html.count('vert_module.html'), 3)
+        self.assertNotIn("'content': None", html)
+
+    def _handle_render_unit(self, sequence, position):
+        """
+        Returns the response of the render_unit dispatch of the given
+        sequence for the given position.
+        """
+        with patch.object(SequenceModule, '_get_course') as mock_course:
+            mock_course.return_value = self.course
+            return json.loads(sequence._xmodule.handle_ajax('render_unit', {'position': position}))
+
+    def test_render_unit(self):
+        response = self._handle_render_unit(self.sequence_3_1, u'2')
+        self.assertIn('vert_module.html', response['html'])
+        self.assertIn(unicode(self.sequence_3_1.get_children()[1].location), response['html'])
+        for resource_hash, resource in response['resources']:
+            self.assertTrue(resource_hash)
+            self.assertIn('mimetype', resource)
+
+    def test_render_unit_invalid_position(self):
+        for position in (u'', u'0', u'4', u'one'):
+            with self.assertRaises(NotFoundError):
+                self._handle_render_unit(self.sequence_3_1, position)
+
+    def test_render_unit_hidden_content(self):
+        with freeze_time(COURSE_END_DATE):
+            with self.assertRaises(NotFoundError):
+                self._handle_render_unit(self.sequence_4_1, u'1')
+
     def test_hidden_content_before_due(self):
         html = self._get_rendered_student_view(self.sequence_4_1)
         self.assertIn("seq_module.html", html)
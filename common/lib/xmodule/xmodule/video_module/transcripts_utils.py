@@ -3,11 +3,13 @@ Utility functions for transcripts.
 ++++++++++++++++++++++++++++++++++
 """
 from django.conf import settings
+from django.core.cache import cache
 import os
 import copy
 import json
 import requests
 import logging
+import cPickle as pickle
 from pysrt import SubRipTime, SubRipItem, SubRipFile
 from pysrt.srtexc import Error
 from lxml import etree
@@ -24,11 +26,38 @@ try:
 except ImportError:
     edxval_api = None
 
+try:
+    # We may not always have the request_cache module available
+    from request_cache.middleware import RequestCache
+except ImportError:
+    RequestCache = None
+
 
 log = logging.getLogger(__name__)
 
 NON_EXISTENT_TRANSCRIPT = 'non_existent_dummy_file_name'
 
+# Cache key of the index of the transcript assets stored in a course's contentstore,
+# mapping each asset's name to the digest of its content.
+TRANSCRIPT_AVAILABILITY_INDEX_KEY_TPL = u'transcripts.availability.{course_key}'
+
+# Name of the request cache holding the transcript availability indexes read in a request.
+TRANSCRIPT_AVAILABILITY_INDEX_NAMESPACE = u'transcripts.availability'
+
+# Largest pickled size, in bytes, of the transcript availability indexes that are cached,
+# keeping within memcached's default item size limit. Larger indexes are not used; this
+# marker is cached in their place.
+TRANSCRIPT_AVAILABILITY_INDEX_MAX_SIZE = 1000 * 1000
+TRANSCRIPT_AVAILABILITY_INDEX_TOO_LARGE = u'too_large'
+
+# Cache key of a transcript converted to another format.
+CONVERTED_TRANSCRIPT_KEY_TPL = u'transcripts.converted.{location}.{lang}.{output_format}.{digest}'
+
+# File extensions of the assets recorded in the transcript availability index.
+TRANSCRIPT_FILE_EXTENSIONS = ('.srt', '.sjson')
+
+TRANSCRIPT_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 class TranscriptException(Exception):  # pylint: disable=missing-docstring
     pass
@@ -84,6 +113,7 @@ def save_to_store(content, name, mime_type, location):
     content_location = Transcript.asset_location(location, name)
     content = StaticContent(content_location, name, mime_type, content)
     contentstore().save(content)
+    invalidate_transcript_availability_index(location.course_key)
     return content_location
 
 
@@ -447,6 +477,75 @@ def subs_filename(subs_id, lang='en'):
         return u'{0}_subs_{1}.srt.sjson'.format(lang, subs_id)
 
 
+def build_transcript_availability_index(course_key):
+    """
+    Builds and caches the index of the transcript assets stored for the given course.
+
+    Returns:
+        A dict mapping the name of each transcript asset to the digest of its content,
+        or None if it is too large to be cached.
+    """
+    assets, __ = contentstore().get_all_content_for_course(course_key)
+    index = {
+        asset['asset_key'].path: asset.get('md5', '')
+        for asset in assets
+        if os.path.splitext(asset['asset_key'].path)[1] in TRANSCRIPT_FILE_EXTENSIONS
+    }
+    cache_key = TRANSCRIPT_AVAILABILITY_INDEX_KEY_TPL.format(course_key=course_key)
+    index_size = len(pickle.dumps(index, pickle.HIGHEST_PROTOCOL))
+    if index_size > TRANSCRIPT_AVAILABILITY_INDEX_MAX_SIZE:
+        # Cache a marker instead, so that the index isn't built again on every request.
+        log.warning(
+            u'Transcript availability index of %s is too large to be cached: %d bytes.', course_key, index_size
+        )
+        cache.set(cache_key, TRANSCRIPT_AVAILABILITY_INDEX_TOO_LARGE, TRANSCRIPT_CACHE_TIMEOUT)
+        return None
+    cache.set(cache_key, index, TRANSCRIPT_CACHE_TIMEOUT)
+    return index
+
+
+def _get_transcript_availability_index_request_cache():
+    """
+    Returns the request cache of the transcript availability indexes, or None if there is no request cache.
+    """
+    if RequestCache is None:
+        return None
+    return RequestCache.get_request_cache(TRANSCRIPT_AVAILABILITY_INDEX_NAMESPACE)
+
+
+def get_transcript_availability_index(course_key):
+    """
+    Returns the transcript availability index of the given course, building it if it isn't cached,
+    or None if it is too large to be cached.
+
+    The index is read from the cache at most once per request.
+    """
+    request_cache = _get_transcript_availability_index_request_cache()
+    if request_cache is not None and course_key in request_cache:
+        return request_cache[course_key]
+
+    index = cache.get(TRANSCRIPT_AVAILABILITY_INDEX_KEY_TPL.format(course_key=course_key))
+    if index is None:
+        index = build_transcript_availability_index(course_key)
+    elif index == TRANSCRIPT_AVAILABILITY_INDEX_TOO_LARGE:
+        index = None
+
+    if request_cache is not None:
+        request_cache[course_key] = index
+    return index
+
+
+def invalidate_transcript_availability_index(course_key):
+    """
+    Removes the cached transcript availability index of the given course.
+    Needs to be called whenever a transcript asset of the course is saved or deleted.
+    """
+    cache.delete(TRANSCRIPT_AVAILABILITY_INDEX_KEY_TPL.format(course_key=course_key))
+    request_cache = _get_transcript_availability_index_request_cache()
+    if request_cache is not None:
+        request_cache.pop(course_key, None)
+
+
 def generate_sjson_for_all_speeds(item, user_filename, result_subs_dict, lang):
     """
     Generates sjson from srt for given lang.
@@ -642,6 +741,61 @@ class Transcript(object):
         asset_filename = subs_filename(subs_id, lang) if not filename else filename
         return Transcript.get_asset(location, asset_filename)
 
+    @staticmethod
+    def asset_exists(location, subs_id, lang='en', filename=None):
+        """
+        Returns whether the asset built from subs_id and lang, or given by filename, is in the contentstore.
+
+        Only the course's transcript availability index is checked, which is built from the
+        contentstore if it isn't cached, so that the contentstore isn't queried for each asset.
+        The contentstore is only queried for courses whose index is too large to be cached.
+        """
+        if NON_EXISTENT_TRANSCRIPT in [subs_id, filename]:
+            return False
+
+        asset_filename = subs_filename(subs_id, lang) if not filename else filename
+        asset_location = Transcript.asset_location(location, asset_filename)
+        index = get_transcript_availability_index(location.course_key)
+        if index is not None:
+            return asset_location.path in index
+
+        try:
+            Transcript.get_asset(location, asset_filename)
+        except NotFoundError:
+            return False
+        return True
+
+    @staticmethod
+    def converted_asset(location, filename, lang, input_format, output_format):
+        """
+        Returns the content of the transcript asset `filename`, converted from `input_format`
+        to `output_format`.
+
+        Converted transcripts are cached by video, language, format and the digest of the
+        asset's content recorded in the course's transcript availability index, so they are
+        only read from the contentstore and converted again when the asset changes.
+
+        Raises:
+            NotFoundError if the asset is not in the contentstore.
+        """
+        if NON_EXISTENT_TRANSCRIPT in filename:
+            raise NotFoundError
+
+        asset_location = Transcript.asset_location(location, filename)
+        index = get_transcript_availability_index(location.course_key)
+        digest = index.get(asset_location.path) if index is not None else None
+        if not digest:
+            return Transcript.convert(Transcript.get_asset(location, filename).data, input_format, output_format)
+
+        cache_key = CONVERTED_TRANSCRIPT_KEY_TPL.format(
+            location=location, lang=lang, output_format=output_format, digest=digest
+        )
+        content = cache.get(cache_key)
+        if content is None:
+            content = Transcript.convert(Transcript.get_asset(location, filename).data, input_format, output_format)
+            cache.set(cache_key, content, TRANSCRIPT_CACHE_TIMEOUT)
+        return content
+
     @staticmethod
     def get_asset(location, filename):
         """
@@ -669,6 +823,7 @@ class Transcript(object):
             log.info("Transcript asset %s was removed from store.", filename)
         except NotFoundError:
             pass
+        invalidate_transcript_availability_index(location.course_key)
         return StaticContent.compute_location(location.course_key, filename)
 
 
@@ -718,25 +873,13 @@ class VideoTranscriptsMixin(object):
             )
 
         if sub:  # check if sjson exists for 'en'.
-            try:
-                Transcript.asset(self.location, sub, 'en')
-            except NotFoundError:
-                try:
-                    Transcript.asset(self.location, None, None, sub)
-                except NotFoundError:
-                    pass
-                else:
-                    translations.append('en')
-            else:
+            if (Transcript.asset_exists(self.location, sub, 'en') or
+                    Transcript.asset_exists(self.location, None, None, sub)):
                 translations.append('en')
 
         for lang in other_langs:
-            try:
-                Transcript.asset(self.location, None, None, other_langs[lang])
-            except NotFoundError:
-                continue
-
-            translations.append(lang)
+            if Transcript.asset_exists(self.location, None, None, other_langs[lang]):
+                translations.append(lang)
 
         # to clean redundant language codes.
         return list(set(translations))
@@ -770,13 +913,13 @@ class VideoTranscriptsMixin(object):
                 log.debug("No subtitles for 'en' language")
                 raise ValueError
 
-            data = Transcript.asset(self.location, transcript_name, lang).data
+            content = Transcript.converted_asset(
+                self.location, subs_filename(transcript_name, lang), lang, 'sjson', transcript_format
+            )
             filename = u'{}.{}'.format(transcript_name, transcript_format)
-            content = Transcript.convert(data, 'sjson', transcript_format)
         else:
-            data = Transcript.asset(self.location, None, None, other_lang[lang]).data
+            content = Transcript.converted_asset(self.location, other_lang[lang], lang, 'srt', transcript_format)
             filename = u'{}.{}'.format(os.path.splitext(other_lang[lang])[0], transcript_format)
-            content = Transcript.convert(data, 'srt', transcript_format)
 
         if not content:
             log.debug('no subtitles produced in get_transcript')
@@ -4,17 +4,28 @@ by the individual custom courses feature.
 """
 import json
 import logging
+from uuid import uuid4
 
 from ccx_keys.locator import CCXBlockUsageLocator, CCXLocator
+from django.core.cache import cache
 from django.db import transaction
 from opaque_keys.edx.keys import CourseKey, UsageKey
 
 import request_cache
-from courseware.field_overrides import FieldOverrideProvider
+from courseware.field_overrides import FieldOverrideProvider, clear_inherited_overrides
 from lms.djangoapps.ccx.models import CcxFieldOverride, CustomCourseForEdX
 
 log = logging.getLogger(__name__)
 
+# The decoded field overrides of a CCX are cached across requests under the
+# current version of the CCX's overrides, which changes whenever they are written.
+# The version changes before the write is committed, so a concurrent request may
+# cache the overrides from before the write under the new version. The timeout
+# bounds how long they may then be stale.
+CCX_OVERRIDES_VERSION_KEY_TPL = u'ccx.overrides.version.{ccx_id}'
+CCX_OVERRIDES_KEY_TPL = u'ccx.overrides.{ccx_id}.{version}'
+CCX_OVERRIDES_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+
 
 class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
     """
@@ -115,65 +126,99 @@ def _clean_ccx_key(block_location):
     return clean_key.version_agnostic().for_branch(None)
 
 
+def _get_overrides_version(ccx):
+    """
+    Returns the current version of the field overrides of the given CCX, or
+    None if the cache doesn't keep it.
+    """
+    version_key = CCX_OVERRIDES_VERSION_KEY_TPL.format(ccx_id=ccx.id)
+    # Add rather than set, so that a version set concurrently by an
+    # invalidation is not overwritten.
+    cache.add(version_key, uuid4().hex, CCX_OVERRIDES_CACHE_TIMEOUT)
+    return cache.get(version_key)
+
+
+def invalidate_overrides_for_ccx(ccx_id):
+    """
+    Invalidates the field overrides of the CCX with the given id that are
+    cached across requests.
+    """
+    cache.set(CCX_OVERRIDES_VERSION_KEY_TPL.format(ccx_id=ccx_id), uuid4().hex, CCX_OVERRIDES_CACHE_TIMEOUT)
+
+
 def _get_overrides_for_ccx(ccx):
     """
-    Returns a dictionary mapping field name to overriden value for any
-    overrides set on this block for this CCX.
+    Returns a dictionary mapping each overridden block's location to a
+    dictionary of its overridden fields' JSON values, and the ids of the
+    corresponding CcxFieldOverride rows under the field names suffixed by
+    "_id".
     """
     overrides_cache = request_cache.get_cache('ccx-overrides')
 
     if ccx not in overrides_cache:
-        overrides = {}
-        query = CcxFieldOverride.objects.filter(
-            ccx=ccx,
-        )
+        version = _get_overrides_version(ccx)
+        cache_key = CCX_OVERRIDES_KEY_TPL.format(ccx_id=ccx.id, version=version)
+        overrides = cache.get(cache_key) if version else None
+
+        if overrides is None:
+            overrides = {}
+            query = CcxFieldOverride.objects.filter(
+                ccx=ccx,
+            )
+
+            for override in query:
+                block_overrides = overrides.setdefault(override.location, {})
+                block_overrides[override.field] = json.loads(override.value)
+                block_overrides[override.field + "_id"] = override.id
 
-        for override in query:
-            block_overrides = overrides.setdefault(override.location, {})
-            block_overrides[override.field] = json.loads(override.value)
-            block_overrides[override.field + "_id"] = override.id
-            block_overrides[override.field + "_instance"] = override
+            if version:
+                cache.set(cache_key, overrides, CCX_OVERRIDES_CACHE_TIMEOUT)
 
         overrides_cache[ccx] = overrides
 
     return overrides_cache[ccx]
 
 
-@transaction.atomic
 def override_field_for_ccx(ccx, block, name, value):
     """
     Overrides a field for the `ccx`.  `block` and `name` specify the block
     and the name of the field on that block to override.  `value` is the
     value to set for the given field.
     """
+    _override_field_for_ccx(ccx, block, name, value)
+    # Invalidate once the override is saved. Within an atomic request, it is
+    # not committed yet; see CCX_OVERRIDES_CACHE_TIMEOUT.
+    invalidate_overrides_for_ccx(ccx.id)
+
+
+@transaction.atomic
+def _override_field_for_ccx(ccx, block, name, value):
+    """
+    Saves the override of a field for the `ccx`, and updates the overrides
+    of the current request.
+
+    The override is compared with its row in the database rather than with
+    the overrides cached across requests, which may be stale.
+    """
     field = block.fields[name]
     value_json = field.to_json(value)
     serialized_value = json.dumps(value_json)
-    override_has_changes = False
     clean_ccx_key = _clean_ccx_key(block.location)
 
-    override = get_override_for_ccx(ccx, block, name + "_instance")
-    if override:
-        override_has_changes = serialized_value != override.value
-
-    if not override:
-        override, created = CcxFieldOverride.objects.get_or_create(
-            ccx=ccx,
-            location=block.location,
-            field=name,
-            defaults={'value': serialized_value},
-        )
-        if created:
-            _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_id"] = override.id
-        else:
-            override_has_changes = serialized_value != override.value
-
-    if override_has_changes:
+    override, created = CcxFieldOverride.objects.get_or_create(
+        ccx=ccx,
+        location=block.location,
+        field=name,
+        defaults={'value': serialized_value},
+    )
+    if not created and serialized_value != override.value:
         override.value = serialized_value
         override.save()
 
-    _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name] = value_json
-    _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_instance"] = override
+    block_overrides = _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})
+    block_overrides[name] = value_json
+    block_overrides[name + "_id"] = override.id
+    clear_inherited_overrides()
 
 
 def clear_override_for_ccx(ccx, block, name):
@@ -190,6 +235,7 @@ def clear_override_for_ccx(ccx, block, name):
             field=name).delete()
 
         clear_ccx_field_info_from_ccx_map(ccx, block, name)
+        invalidate_overrides_for_ccx(ccx.id)
 
     except CcxFieldOverride.DoesNotExist:
         pass
@@ -204,9 +250,9 @@ def clear_ccx_field_info_from_ccx_map(ccx, block, name):  # pylint: disable=inva
         ccx_override_map = _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})
         ccx_override_map.pop(name)
         ccx_override_map.pop(name + "_id")
-        ccx_override_map.pop(name + "_instance")
     except KeyError:
         pass
+    clear_inherited_overrides()
 
 
 def bulk_delete_ccx_override_fields(ccx, ids):
@@ -217,3 +263,4 @@ def bulk_delete_ccx_override_fields(ccx, ids):
     ids = list(set(ids))
     if ids:
         CcxFieldOverride.objects.filter(ccx=ccx, id__in=ids).delete()
+        invalidate_overrides_for_ccx(ccx.id)
@@ -11,6 +11,7 @@ from opaque_keys.edx.locator import CourseLocator
 
 from lms import CELERY_APP
 from lms.djangoapps.ccx.models import CustomCourseForEdX
+from lms.djangoapps.ccx.overrides import invalidate_overrides_for_ccx
 from xmodule.modulestore.django import SignalHandler
 
 log = logging.getLogger("edx.ccx")
@@ -19,9 +20,12 @@ log = logging.getLogger("edx.ccx")
 @receiver(SignalHandler.course_published)
 def course_published_handler(sender, course_key, **kwargs):  # pylint: disable=unused-argument
     """
-    Consume signals that indicate course published. If course already a CCX, do nothing.
+    Consume signals that indicate course published. If course already a CCX,
+    only invalidate its cached field overrides.
     """
-    if not isinstance(course_key, CCXLocator):
+    if isinstance(course_key, CCXLocator):
+        invalidate_overrides_for_ccx(course_key.ccx)
+    else:
         send_ccx_course_published.delay(unicode(course_key))
 
 
@@ -3,6 +3,7 @@
 tests for overrides
 """
 import datetime
+import json
 
 import mock
 import pytz
@@ -13,8 +14,8 @@ from nose.plugins.attrib import attr
 from courseware.courses import get_course_by_id
 from courseware.field_overrides import OverrideFieldData
 from courseware.testutils import FieldOverrideTestMixin
-from lms.djangoapps.ccx.models import CustomCourseForEdX
-from lms.djangoapps.ccx.overrides import override_field_for_ccx
+from lms.djangoapps.ccx.models import CcxFieldOverride, CustomCourseForEdX
+from lms.djangoapps.ccx.overrides import clear_override_for_ccx, get_override_for_ccx, override_field_for_ccx
 from lms.djangoapps.ccx.tests.utils import flatten, iter_blocks
 from lms.djangoapps.courseware.tests.test_field_overrides import inject_field_overrides
 from request_cache.middleware import RequestCache
@@ -121,17 +122,18 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
         new_ccx_start = datetime.datetime(2015, 12, 25, 00, 00, tzinfo=pytz.UTC)
         chapter = self.ccx_course.get_children()[0]
         override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
-        with self.assertNumQueries(3):
+        # One SAVEPOINT/RELEASE SAVEPOINT pair, one SELECT and one UPDATE.
+        with self.assertNumQueries(4):
             override_field_for_ccx(self.ccx, chapter, 'start', new_ccx_start)
 
     def test_override_num_queries_field_value_not_changed(self):
         """
-        Test that if value of field does not changed no query execute.
+        Test that if value of field does not changed only the override is fetched.
         """
         ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
         chapter = self.ccx_course.get_children()[0]
         override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
-        with self.assertNumQueries(2):      # 2 savepoints
+        with self.assertNumQueries(3):      # 2 savepoints and 1 SELECT
             override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
 
     def test_overriden_field_access_produces_no_extra_queries(self):
@@ -170,3 +172,71 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
         override_field_for_ccx(self.ccx, chapter, 'due', ccx_due)
         vertical = chapter.get_children()[0].get_children()[0]
         self.assertEqual(vertical.due, ccx_due)
+
+
+@attr(shard=1)
+@override_settings(
+    XBLOCK_FIELD_DATA_WRAPPERS=['lms.djangoapps.courseware.field_overrides:OverrideModulestoreFieldData.wrap'],
+    MODULESTORE_FIELD_OVERRIDE_PROVIDERS=['ccx.overrides.CustomCoursesForEdxOverrideProvider'],
+)
+class TestCachedFieldOverrides(TestFieldOverrides):
+    """
+    Make sure field overrides cached across requests behave in the expected manner.
+    """
+    ENABLED_CACHES = ['default']
+
+    def test_overrides_cached_across_requests(self):
+        """
+        Test that the overrides are not queried again in later requests.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+
+        RequestCache.clear_request_cache()
+        get_override_for_ccx(self.ccx, chapter, 'start')
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(0):
+            self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), ccx_start)
+
+    def test_override_invalidates_cached_overrides(self):
+        """
+        Test that later requests see the overrides written after they were cached.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        new_ccx_start = datetime.datetime(2015, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), ccx_start)
+        override_field_for_ccx(self.ccx, chapter, 'start', new_ccx_start)
+
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), new_ccx_start)
+
+    def test_override_written_despite_stale_cached_overrides(self):
+        """
+        Test that overrides changed or deleted by another request are written,
+        even while the overrides cached across requests still hold the value.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        other_ccx_start = datetime.datetime(2015, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        serialized_start, other_serialized_start = [
+            json.dumps(chapter.fields['start'].to_json(start)) for start in (ccx_start, other_ccx_start)
+        ]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        overrides = CcxFieldOverride.objects.filter(ccx=self.ccx, location=chapter.location, field='start')
+
+        overrides.update(value=other_serialized_start)
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        self.assertEquals(overrides.get().value, serialized_start)
+
+        overrides.delete()
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        self.assertEquals(overrides.get().value, serialized_start)
+
+        clear_override_for_ccx(self.ccx, chapter, 'start')
+        RequestCache.clear_request_cache()
+        self.assertIsNone(get_override_for_ccx(self.ccx, chapter, 'start'))
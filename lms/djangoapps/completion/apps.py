@@ -14,4 +14,4 @@ class CompletionAppConfig(AppConfig):
     verbose_name = 'Completion'
 
     def ready(self):
-        from . import handlers  # pylint: disable=unused-variable
+        from . import batching, handlers  # pylint: disable=unused-variable
@@ -0,0 +1,83 @@
+"""
+Buffered submission of completions.
+
+When the completion.enable_completion_buffering switch is active, the
+completions submitted while handling a request are aggregated per user and
+course, keeping the highest completion value of each block, and submitted as
+batches by a celery task once the request is finished. Since the tasks of
+different requests may run in any order, a batch only ever raises the
+completions of its blocks.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+from collections import OrderedDict
+
+import crum
+from django.core.signals import request_finished, request_started
+from django.dispatch import receiver
+
+from . import waffle
+from .models import BlockCompletion, validate_percent
+from .tasks import submit_completion_batch
+
+
+class _CompletionBuffer(threading.local):
+    """
+    A thread-local buffer of the completions submitted during a request.
+    """
+    def __init__(self):
+        super(_CompletionBuffer, self).__init__()
+        # Completion values keyed by block key, keyed by (user id, course key).
+        self.completions = OrderedDict()
+
+
+_BUFFER = _CompletionBuffer()
+
+
+def submit_completion(user, course_key, block_key, completion):
+    """
+    Submit the completion value of a block for the user, as
+    BlockCompletion.objects.submit_completion does, but buffered until the
+    end of the request when completion buffering is enabled, in which case
+    the completion of the block is only raised.
+
+    The completion value is validated right away, so that invalid values
+    are still reported to the caller.
+    """
+    if not waffle.waffle().is_enabled(waffle.ENABLE_COMPLETION_BUFFERING) or crum.get_current_request() is None:
+        BlockCompletion.objects.submit_completion(
+            user=user,
+            course_key=course_key,
+            block_key=block_key,
+            completion=completion,
+        )
+        return
+
+    validate_percent(completion)
+    blocks = _BUFFER.completions.setdefault((user.id, course_key), OrderedDict())
+    blocks[block_key] = max(completion, blocks.get(block_key, completion))
+
+
+@receiver(request_started)
+def clear_buffered_completions(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Empty the buffer when a request starts.
+    """
+    _BUFFER.completions = OrderedDict()
+
+
+@receiver(request_finished)
+def submit_buffered_completions(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Submit the completions buffered during the request, with a task per user
+    and course.
+    """
+    completions, _BUFFER.completions = _BUFFER.completions, OrderedDict()
+    for (user_id, course_key), blocks in completions.items():
+        submit_completion_batch.delay(
+            user_id,
+            unicode(course_key),
+            [(unicode(block_key), completion) for block_key, completion in blocks.items()],
+        )
@@ -4,9 +4,12 @@ Completion tracking and aggregation models.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from collections import OrderedDict, defaultdict
+
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import models, transaction, connection
+from django.db import IntegrityError, models, transaction, connection
+from django.utils import timezone
 from django.utils.translation import ugettext as _
 from model_utils.models import TimeStampedModel
 from opaque_keys.edx.keys import CourseKey
@@ -74,17 +77,7 @@ class BlockCompletionManager(models.Manager):
                 subclasses.
         """
 
-        # Raise ValueError to match normal django semantics for wrong type of field.
-        if not isinstance(course_key, CourseKey):
-            raise ValueError(
-                "course_key must be an instance of `opaque_keys.edx.keys.CourseKey`.  Got {}".format(type(course_key))
-            )
-        try:
-            block_type = block_key.block_type
-        except AttributeError:
-            raise ValueError(
-                "block_key must be an instance of `opaque_keys.edx.keys.UsageKey`.  Got {}".format(type(block_key))
-            )
+        block_type = self._validate_keys(course_key, block_key)
 
         if waffle.waffle().is_enabled(waffle.ENABLE_COMPLETION_TRACKING):
             obj, is_new = self.get_or_create(
@@ -105,11 +98,38 @@ class BlockCompletionManager(models.Manager):
             )
         return obj, is_new
 
+    @staticmethod
+    def _validate_keys(course_key, block_key):
+        """
+        Raise ValueError if the course_key or the block_key is not a key of
+        the right type. Otherwise, return the block type of the block_key.
+        """
+        # Raise ValueError to match normal django semantics for wrong type of field.
+        if not isinstance(course_key, CourseKey):
+            raise ValueError(
+                "course_key must be an instance of `opaque_keys.edx.keys.CourseKey`.  Got {}".format(type(course_key))
+            )
+        try:
+            return block_key.block_type
+        except AttributeError:
+            raise ValueError(
+                "block_key must be an instance of `opaque_keys.edx.keys.UsageKey`.  Got {}".format(type(block_key))
+            )
+
     @transaction.atomic()
     def submit_batch_completion(self, user, course_key, blocks):
         """
         Performs a batch insertion of completion objects.
 
+        The existing completions of the blocks are read with a single query,
+        the new ones are inserted with a single query, and the changed ones
+        are updated with a query per distinct completion value.
+
+        Since batches may be submitted out of order by asynchronous tasks,
+        the completion of a block is only ever raised: if a block is given
+        more than once, its highest completion value is used, and an
+        existing completion is only updated if it is lower.
+
         Parameters:
             * user (django.contrib.auth.models.User): The user for whom the
               completions are being submitted.
@@ -136,10 +156,76 @@ class BlockCompletionManager(models.Manager):
                 If there was a problem getting, creating, or updating the
                 BlockCompletion record in the database.
         """
-        block_completions = {}
+        if not waffle.waffle().is_enabled(waffle.ENABLE_COMPLETION_TRACKING):
+            # If the feature is not enabled, this method should not be called.  Error out with a RuntimeError.
+            raise RuntimeError(
+                "BlockCompletion.objects.submit_batch_completion should not be called when the feature is disabled."
+            )
+
+        completions = OrderedDict()
         for block, completion in blocks:
-            (block_completion, is_new) = self.submit_completion(user, course_key, block, completion)
-            block_completions[block_completion] = is_new
+            self._validate_keys(course_key, block)
+            validate_percent(completion)
+            completions[block] = max(completion, completions.get(block, completion))
+
+        try:
+            with transaction.atomic():
+                return self._submit_completions(user, course_key, completions)
+        except IntegrityError:
+            # Some of the completions were created concurrently, so they are
+            # now updated instead.
+            with transaction.atomic():
+                return self._submit_completions(user, course_key, completions)
+
+    def _submit_completions(self, user, course_key, completions):
+        """
+        Create the completions of the user in the course, given as an
+        ordered mapping of block keys to completion values, or raise the
+        existing ones that are lower, with bulk queries. Return a dictionary
+        mapping each BlockCompletion object to whether it was newly created.
+
+        The updates are made with QuerySet.update, which bypasses save(), so
+        the modified timestamp of the updated completions is set explicitly.
+        """
+        # Blocks are matched by their serialized keys, which do not include
+        # the run of the course for old style keys.
+        existing_completions = {
+            unicode(block_completion.block_key): block_completion
+            for block_completion in self.filter(user=user, course_key=course_key, block_key__in=completions.keys())
+        }
+
+        new_completions = []
+        changed_completions = defaultdict(list)
+        for block, completion in completions.items():
+            block_completion = existing_completions.get(unicode(block))
+            if block_completion is None:
+                new_completions.append(self.model(
+                    user=user,
+                    course_key=course_key,
+                    block_type=block.block_type,
+                    block_key=block,
+                    completion=completion,
+                ))
+            elif block_completion.completion < completion:
+                block_completion.completion = completion
+                changed_completions[completion].append(block_completion.id)
+
+        modified = timezone.now()
+        for completion, ids in changed_completions.items():
+            # Completions raised concurrently since they were read are kept.
+            self.filter(id__in=ids, completion__lt=completion).update(completion=completion, modified=modified)
+
+        block_completions = dict.fromkeys(existing_completions.values(), False)
+        if new_completions:
+            self.bulk_create(new_completions)
+            # The inserted objects are read again, as bulk_create does not
+            # set their ids on all databases.
+            created_completions = self.filter(
+                user=user,
+                course_key=course_key,
+                block_key__in=[new_completion.block_key for new_completion in new_completions],
+            )
+            block_completions.update(dict.fromkeys(created_completions, True))
         return block_completions
 
 
@@ -0,0 +1,29 @@
+"""
+Tasks for completion.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from celery.task import task  # pylint: disable=import-error,no-name-in-module
+from django.contrib.auth.models import User
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+from .models import BlockCompletion
+
+
+@task(name='lms.djangoapps.completion.tasks.submit_completion_batch')
+def submit_completion_batch(user_id, course_key, blocks):
+    """
+    Submits the completions of a user in a course as a batch.
+
+    Arguments:
+        user_id (int): id of the user.
+        course_key (unicode): serialized key of the course.
+        blocks (list): list of pairs of the serialized usage key of a block
+            and its completion value.
+    """
+    BlockCompletion.objects.submit_batch_completion(
+        User.objects.get(id=user_id),
+        CourseKey.from_string(course_key),
+        [(UsageKey.from_string(block_key), completion) for block_key, completion in blocks],
+    )
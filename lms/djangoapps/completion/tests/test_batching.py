@@ -0,0 +1,90 @@
+"""
+Test the buffered submission of completions.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import crum
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from opaque_keys.edx.keys import UsageKey
+
+from openedx.core.djangolib.testing.utils import get_mock_request
+from student.tests.factories import UserFactory
+
+from .. import batching, models, waffle
+
+
+class SubmitCompletionTestCase(TestCase):
+    """
+    Test that completions are buffered until the end of the request when
+    completion buffering is enabled.
+    """
+    def setUp(self):
+        super(SubmitCompletionTestCase, self).setUp()
+        for switch in (waffle.ENABLE_COMPLETION_TRACKING, waffle.ENABLE_COMPLETION_BUFFERING):
+            _overrider = waffle.waffle().override(switch, True)
+            _overrider.__enter__()
+            self.addCleanup(_overrider.__exit__, None, None, None)
+        self.user = UserFactory()
+        self.block_key = UsageKey.from_string('block-v1:edx+test+run+type@video+block@doggos')
+        self.other_block_key = UsageKey.from_string('block-v1:edx+test+run+type@html+block@kittens')
+        batching.clear_buffered_completions(sender=None)
+
+    def _submit_completion(self, block_key, completion):
+        """
+        Submit the completion of the block for the user.
+        """
+        batching.submit_completion(
+            user=self.user,
+            course_key=block_key.course_key,
+            block_key=block_key,
+            completion=completion,
+        )
+
+    def _get_completions(self):
+        """
+        Return the completion values of the blocks in the database.
+        """
+        return dict(models.BlockCompletion.objects.values_list('block_key', 'completion'))
+
+    def test_buffered_until_request_finished(self):
+        get_mock_request(self.user)
+        self.addCleanup(crum.set_current_request, None)
+        self._submit_completion(self.block_key, 0.5)
+        self._submit_completion(self.block_key, 1.0)
+        self._submit_completion(self.other_block_key, 1.0)
+        self.assertEqual(self._get_completions(), {})
+
+        batching.submit_buffered_completions(sender=None)
+        self.assertEqual(self._get_completions(), {self.block_key: 1.0, self.other_block_key: 1.0})
+
+    def test_buffered_highest_completion(self):
+        get_mock_request(self.user)
+        self.addCleanup(crum.set_current_request, None)
+        self._submit_completion(self.block_key, 0.8)
+        self._submit_completion(self.block_key, 0.4)
+        batching.submit_buffered_completions(sender=None)
+        self.assertEqual(self._get_completions(), {self.block_key: 0.8})
+
+        # The batch of an earlier request submitted late does not lower it.
+        self._submit_completion(self.block_key, 0.6)
+        batching.submit_buffered_completions(sender=None)
+        self.assertEqual(self._get_completions(), {self.block_key: 0.8})
+
+    def test_invalid_completion(self):
+        get_mock_request(self.user)
+        self.addCleanup(crum.set_current_request, None)
+        with self.assertRaises(ValidationError):
+            self._submit_completion(self.block_key, 1.2)
+
+    def test_submitted_outside_of_request(self):
+        self._submit_completion(self.block_key, 1.0)
+        self.assertEqual(self._get_completions(), {self.block_key: 1.0})
+
+    def test_submitted_without_buffering(self):
+        get_mock_request(self.user)
+        self.addCleanup(crum.set_current_request, None)
+        with waffle.waffle().override(waffle.ENABLE_COMPLETION_BUFFERING, False):
+            self._submit_completion(self.block_key, 1.0)
+        self.assertEqual(self._get_completions(), {self.block_key: 1.0})
@@ -187,3 +187,46 @@ class SubmitBatchCompletionTestCase(TestCase):
         self.assertEqual(models.BlockCompletion.objects.count(), 1)
         model = models.BlockCompletion.objects.first()
         self.assertEqual(model.completion, 1.0)
+
+    def test_submit_batch_completion_with_new_and_existing_blocks(self):
+        other_block_key = UsageKey.from_string('block-v1:edx+test+run+type@html+block@kittens')
+        models.BlockCompletion.objects.submit_batch_completion(self.user, self.course_key_obj, [(self.block_key, 0.0)])
+        block_completions = models.BlockCompletion.objects.submit_batch_completion(
+            self.user,
+            self.course_key_obj,
+            [(self.block_key, 1.0), (other_block_key, 0.5), (other_block_key, 1.0)],
+        )
+        self.assertEqual(
+            {(completion.block_key, completion.completion, isnew) for completion, isnew in block_completions.items()},
+            {(self.block_key, 1.0, False), (other_block_key, 1.0, True)},
+        )
+        self.assertEqual(
+            dict(models.BlockCompletion.objects.values_list('block_key', 'completion')),
+            {self.block_key: 1.0, other_block_key: 1.0},
+        )
+
+    def test_submit_batch_completion_only_raises_completion(self):
+        models.BlockCompletion.objects.submit_batch_completion(self.user, self.course_key_obj, [(self.block_key, 0.8)])
+        block_completions = models.BlockCompletion.objects.submit_batch_completion(
+            self.user,
+            self.course_key_obj,
+            [(self.block_key, 0.9), (self.block_key, 0.5)],
+        )
+        self.assertEqual(
+            {(completion.block_key, completion.completion, isnew) for completion, isnew in block_completions.items()},
+            {(self.block_key, 0.9, False)},
+        )
+
+        # An older batch submitted late does not lower the completion.
+        models.BlockCompletion.objects.submit_batch_completion(self.user, self.course_key_obj, [(self.block_key, 0.3)])
+        self.assertEqual(models.BlockCompletion.objects.get().completion, 0.9)
+
+    def test_submit_batch_completion_with_invalid_completion(self):
+        other_block_key = UsageKey.from_string('block-v1:edx+test+run+type@html+block@kittens')
+        with self.assertRaises(ValidationError):
+            models.BlockCompletion.objects.submit_batch_completion(
+                self.user,
+                self.course_key_obj,
+                [(self.block_key, 1.0), (other_block_key, 1.2)],
+            )
+        self.assertEqual(models.BlockCompletion.objects.count(), 0)
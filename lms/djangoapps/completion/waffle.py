@@ -18,6 +18,12 @@ WAFFLE_NAMESPACE = 'completion'
 # xblocks.
 ENABLE_COMPLETION_TRACKING = 'enable_completion_tracking'
 
+# Full name: completion.enable_completion_buffering
+# Indicates whether the completions submitted by xblocks while handling a
+# request are aggregated and written in batches by a celery task once the
+# request is finished, rather than written one at a time right away.
+ENABLE_COMPLETION_BUFFERING = 'enable_completion_buffering'
+
 
 def waffle():
     """
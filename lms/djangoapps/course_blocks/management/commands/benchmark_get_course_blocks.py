@@ -0,0 +1,94 @@
+"""
+Microbenchmark of get_course_blocks for a collected course, comparing deep
+copies of the collected block structure with copy-on-write copies, e.g.
+
+    ./manage.py lms benchmark_get_course_blocks course-v1:edX+DemoX+Demo_Course staff
+"""
+import gc
+import timeit
+from copy import deepcopy
+from textwrap import dedent
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from opaque_keys.edx.keys import CourseKey
+
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
+from openedx.core.djangoapps.content.block_structure.block_structure import BlockStructureBlockData
+from openedx.core.djangoapps.content.block_structure.factory import BlockStructureFactory
+from request_cache.middleware import RequestCache
+from xmodule.modulestore.django import modulestore
+
+from ...api import get_course_blocks
+
+
+def _deep_copy(block_structure):
+    """
+    Returns a deep copy of the given block structure, as copied before
+    block structures were copied on write.
+    """
+    return BlockStructureFactory.create_new(
+        block_structure.root_block_usage_key,
+        deepcopy(block_structure._block_relations),  # pylint: disable=protected-access
+        deepcopy(block_structure.transformer_data),
+        deepcopy(block_structure._block_data_map),  # pylint: disable=protected-access
+    )
+
+
+def _count_new_objects(func):
+    """
+    Returns the number of objects tracked by the garbage collector that
+    are created by the given function and still referenced by its result.
+    """
+    gc.collect()
+    before = len(gc.get_objects())
+    result = func()  # pylint: disable=unused-variable
+    gc.collect()
+    return len(gc.get_objects()) - before
+
+
+class Command(BaseCommand):
+    help = dedent(__doc__).strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_id', help='the collected course whose blocks are transformed')
+        parser.add_argument('username', help='the user for whom the blocks are transformed')
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=10,
+            help='Number of times the blocks are transformed.',
+        )
+
+    def handle(self, *args, **options):
+        course_key = CourseKey.from_string(options['course_id'])
+        user = User.objects.get(username=options['username'])
+        root_usage_key = modulestore().make_course_usage_key(course_key)
+        collected = get_block_structure_manager(course_key).get_collected()
+
+        def transform():
+            RequestCache.clear_request_cache()
+            return get_course_blocks(user, root_usage_key, collected_block_structure=collected)
+
+        copy_on_write = BlockStructureBlockData.__dict__['copy']
+        for label, copy in (('deep copy', _deep_copy), ('copy-on-write', copy_on_write)):
+            BlockStructureBlockData.copy = copy
+            try:
+                copy_seconds = min(timeit.repeat(collected.copy, number=1, repeat=options['repeat']))
+                transform_seconds = min(timeit.repeat(transform, number=1, repeat=options['repeat']))
+                copy_objects = _count_new_objects(collected.copy)
+                transform_objects = _count_new_objects(transform)
+            finally:
+                BlockStructureBlockData.copy = copy_on_write
+
+            self.stdout.write(
+                u'{}: copy {:.2f} ms, {} objects; get_course_blocks {:.2f} ms, {} objects ({} blocks)'.format(
+                    label,
+                    copy_seconds * 1000,
+                    copy_objects,
+                    transform_seconds * 1000,
+                    transform_objects,
+                    len(collected),
+                )
+            )
+
@@ -6,6 +6,7 @@ import string
 from collections import namedtuple
 
 import ddt
+from mock import patch
 from nose.plugins.attrib import attr
 
 from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort
@@ -17,6 +18,7 @@ from xmodule.modulestore.tests.factories import CourseFactory
 from xmodule.partitions.partitions import Group, UserPartition
 
 from ...api import get_course_blocks
+from .. import user_partitions
 from ..user_partitions import UserPartitionTransformer, _MergedGroupAccess
 from .helpers import CourseStructureTestCase, update_block
 
@@ -220,6 +222,30 @@ class UserPartitionTransformerTestCase(UserPartitionTestMixin, CourseStructureTe
             self.get_block_key_set(self.blocks, *expected_blocks)
         )
 
+    def test_transform_checks_each_rule_once(self):
+        self.setup_partitions_and_course()
+        add_user_to_cohort(self.partition_cohorts[self.user_partition.id - 1][0], self.user.username)
+
+        with patch.object(
+            user_partitions, '_has_group_access', wraps=user_partitions._has_group_access
+        ) as mock_has_group_access:
+            trans_block_structure = get_course_blocks(self.user, self.course.location, self.transformers)
+
+        checked_rules = [call_args[0][0] for call_args in mock_has_group_access.call_args_list]
+        self.assertEqual(len(checked_rules), len(set(checked_rules)))
+
+        # Blocks with the same merged access share their rule: F inherits
+        # C's access, and L's access is restricted to G's by its parent.
+        for block_ref, same_rule_block_ref in (('F', 'C'), ('L', 'G'), ('J', 'E')):
+            self.assertIs(
+                trans_block_structure.get_transformer_block_field(
+                    self.blocks[block_ref].location, UserPartitionTransformer, 'group_access_rule',
+                ),
+                trans_block_structure.get_transformer_block_field(
+                    self.blocks[same_rule_block_ref].location, UserPartitionTransformer, 'group_access_rule',
+                ),
+            )
+
     def test_transform_on_inactive_partition(self):
         """
         Tests UserPartitionTransformer for inactive UserPartition.
@@ -20,9 +20,13 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
 
     Staff users are *not* exempted from user partition pathways.
     """
-    WRITE_VERSION = 1
+    WRITE_VERSION = 2
     READ_VERSION = 1
 
+    # The group_access fields of split_test children are set by the
+    # SplitTestTransformer's collect.
+    COLLECT_DEPENDENCIES = (SplitTestTransformer,)
+
     @classmethod
     def name(cls):
         """
@@ -59,6 +63,11 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
         # topological sort, we know a block's parents are guaranteed to
         # already have merged group access computed before the block
         # itself.
+        #
+        # The merged access is also stored as a rule that is shared by
+        # all blocks with the same access, so that the transform checks
+        # each distinct rule only once.
+        rules = {}
         for block_key in block_structure.topological_traversal():
             xblock = block_structure.get_xblock(block_key)
             parent_keys = block_structure.get_parents(block_key)
@@ -68,6 +77,8 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
             ]
             merged_group_access = _MergedGroupAccess(user_partitions, xblock, merged_parent_access_list)
             block_structure.set_transformer_block_field(block_key, cls, 'merged_group_access', merged_group_access)
+            rule = rules.setdefault(merged_group_access.rule, merged_group_access.rule)
+            block_structure.set_transformer_block_field(block_key, cls, 'group_access_rule', rule)
 
     def transform_block_filters(self, usage_info, block_structure):
         result_list = SplitTestTransformer().transform_block_filters(usage_info, block_structure)
@@ -79,10 +90,26 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
         user_groups = _get_user_partition_groups(
             usage_info.course_key, user_partitions, usage_info.user
         )
+        # Whether the user has access, keyed by group access rule.
+        rule_access = {}
+
+        def has_group_access(block_key):
+            """
+            Returns whether the user has group access to the given block.
+            """
+            rule = block_structure.get_transformer_block_field(block_key, self, 'group_access_rule')
+            if rule is None:
+                # The rule was not collected by an earlier version of the
+                # transformer.
+                return block_structure.get_transformer_block_field(
+                    block_key, self, 'merged_group_access'
+                ).check_group_access(user_groups)
+            if rule not in rule_access:
+                rule_access[rule] = _has_group_access(rule, user_groups)
+            return rule_access[rule]
+
         group_access_filter = block_structure.create_removal_filter(
-            lambda block_key: not block_structure.get_transformer_block_field(
-                block_key, self, 'merged_group_access'
-            ).check_group_access(user_groups)
+            lambda block_key: not has_group_access(block_key)
         )
 
         result_list.append(group_access_filter)
@@ -207,6 +234,22 @@ class _MergedGroupAccess(object):
         else:
             return None
 
+    @property
+    def rule(self):
+        """
+        Returns a hashable representation of the merged access, which is
+        equal for all blocks with the same group access restrictions.
+
+        Returns:
+            frozenset[(int, frozenset[int])]: The IDs of the groups that
+                can access each partition with restrictions, keyed by
+                partition ID.
+        """
+        return frozenset(
+            (partition_id, frozenset(group_ids))
+            for partition_id, group_ids in self._access.iteritems()
+        )
+
     def check_group_access(self, user_groups):
         """
         Arguments:
@@ -217,24 +260,39 @@ class _MergedGroupAccess(object):
         Returns:
             bool: Whether said user has group access.
         """
-        for partition_id, allowed_group_ids in self._access.iteritems():
+        return _has_group_access(self._access.iteritems(), user_groups)
 
-            # If the user is not assigned to a group for this partition,
-            # deny access.
-            if partition_id not in user_groups:
-                return False
 
-            # If the user belongs to one of the allowed groups for this
-            # partition, then move and check the next partition.
-            elif user_groups[partition_id].id in allowed_group_ids:
-                continue
+def _has_group_access(access, user_groups):
+    """
+    Arguments:
+        access (iterable[(int, set[int])]): The IDs of the groups that can
+            access each partition with restrictions, keyed by partition ID.
+        user_groups (dict[int: Group]): Given a user, a mapping from user
+            partition IDs to the group to which the user belongs in each
+            partition.
+
+    Returns:
+        bool: Whether said user has group access.
+    """
+    for partition_id, allowed_group_ids in access:
+
+        # If the user is not assigned to a group for this partition,
+        # deny access.
+        if partition_id not in user_groups:
+            return False
 
-            # Else, deny access.
-            else:
-                return False
+        # If the user belongs to one of the allowed groups for this
+        # partition, then move and check the next partition.
+        elif user_groups[partition_id].id in allowed_group_ids:
+            continue
+
+        # Else, deny access.
+        else:
+            return False
 
-        # The user has access for every partition, grant access.
-        return True
+    # The user has access for every partition, grant access.
+    return True
 
 
 def _get_user_partition_groups(course_key, user_partitions, user):
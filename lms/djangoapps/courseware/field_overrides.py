@@ -27,6 +27,7 @@ from xmodule.modulestore.inheritance import InheritanceMixin
 NOTSET = object()
 ENABLED_OVERRIDE_PROVIDERS_KEY = u'courseware.field_overrides.enabled_providers.{course_id}'
 ENABLED_MODULESTORE_OVERRIDE_PROVIDERS_KEY = u'courseware.modulestore_field_overrides.enabled_providers.{course_id}'
+INHERITED_OVERRIDES_KEY = u'courseware.field_overrides.inherited_overrides'
 
 
 def resolve_dotted(name):
@@ -48,15 +49,12 @@ def resolve_dotted(name):
     return target
 
 
-def _lineage(block):
+def clear_inherited_overrides():
     """
-    Returns an iterator over all ancestors of the given block, starting with
-    its immediate parent and ending at the root of the block tree.
+    Forgets the inherited field overrides resolved during the current request.
+    Must be called whenever field overrides are changed.
     """
-    parent = block.get_parent()
-    while parent:
-        yield parent
-        parent = parent.get_parent()
+    RequestCache.get_request_cache().data.pop(INHERITED_OVERRIDES_KEY, None)
 
 
 class _OverridesDisabled(threading.local):
@@ -197,6 +195,9 @@ class OverrideFieldData(FieldData):
     def __init__(self, user, fallback, providers):
         self.fallback = fallback
         self.providers = tuple(provider(user) for provider in providers)
+        # Inherited overrides resolved for one user and set of providers
+        # are shared by all the blocks of the request.
+        self._inherited_overrides_key = (type(self), getattr(user, 'id', user), tuple(providers))
 
     def get_override(self, block, name):
         """
@@ -210,6 +211,39 @@ class OverrideFieldData(FieldData):
                     return value
         return NOTSET
 
+    def get_inherited_override(self, block, name):
+        """
+        Returns the override of the inheritable field identified by `name`
+        that `block` inherits from its nearest overridden ancestor, or
+        `NOTSET` if no ancestor's field is overridden.
+
+        The overrides inherited by every block are resolved top-down and kept
+        for the rest of the request, so that reading a field of all the blocks
+        of a course consults the providers once per block rather than once
+        per ancestor of each block.
+        """
+        if overrides_disabled():
+            return NOTSET
+        tables = RequestCache.get_request_cache().data.setdefault(INHERITED_OVERRIDES_KEY, {})
+        table = tables.setdefault(self._inherited_overrides_key, {})
+        return self._resolve_inherited_override(table, block, name)
+
+    def _resolve_inherited_override(self, table, block, name):
+        """
+        Returns the override inherited by `block` for the field `name`,
+        resolving and recording those of its ancestors in `table` as needed.
+        """
+        key = (block.location, name)
+        if key not in table:
+            value = NOTSET
+            parent = block.get_parent()
+            if parent:
+                value = self.get_override(parent, name)
+                if value is NOTSET:
+                    value = self._resolve_inherited_override(table, parent, name)
+            table[key] = value
+        return table[key]
+
     def get(self, block, name):
         value = self.get_override(block, name)
         if value is not NOTSET:
@@ -231,11 +265,8 @@ class OverrideFieldData(FieldData):
             # If this is an inheritable field and an override is set above,
             # then we want to return False here, so the field_data uses the
             # override and not the original value for this block.
-            inheritable = InheritanceMixin.fields.keys()
-            if name in inheritable:
-                for ancestor in _lineage(block):
-                    if self.get_override(ancestor, name) is not NOTSET:
-                        return False
+            if name in InheritanceMixin.fields and self.get_inherited_override(block, name) is not NOTSET:
+                return False
 
         return has is not NOTSET or self.fallback.has(block, name)
 
@@ -246,12 +277,10 @@ class OverrideFieldData(FieldData):
         # The `default` method is overloaded by the field storage system to
         # also handle inheritance.
         if self.providers and not overrides_disabled():
-            inheritable = InheritanceMixin.fields.keys()
-            if name in inheritable:
-                for ancestor in _lineage(block):
-                    value = self.get_override(ancestor, name)
-                    if value is not NOTSET:
-                        return value
+            if name in InheritanceMixin.fields:
+                value = self.get_inherited_override(block, name)
+                if value is not NOTSET:
+                    return value
         return self.fallback.default(block, name)
 
 
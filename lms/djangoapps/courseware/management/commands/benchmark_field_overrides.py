@@ -0,0 +1,99 @@
+"""
+Microbenchmark of the cost of reading inheritable fields through the field
+override providers, e.g.
+
+    ./manage.py lms benchmark_field_overrides ccx-v1:edX+DemoX+Demo_Course+ccx@1 staff
+"""
+import timeit
+from functools import partial
+from textwrap import dedent
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from opaque_keys.edx.keys import CourseKey
+
+from request_cache.middleware import RequestCache
+from xmodule.modulestore.django import modulestore
+
+from ...field_overrides import OverrideFieldData, clear_inherited_overrides, resolve_dotted
+
+CCX_PROVIDER = 'lms.djangoapps.ccx.overrides.CustomCoursesForEdxOverrideProvider'
+INDIVIDUAL_DUE_DATES_PROVIDER = 'courseware.student_field_overrides.IndividualStudentOverrideProvider'
+SELF_PACED_PROVIDER = 'courseware.self_paced_overrides.SelfPacedDateOverrideProvider'
+
+PROVIDER_CONFIGURATIONS = (
+    ('no providers', ()),
+    ('ccx', (CCX_PROVIDER,)),
+    ('individual due dates', (INDIVIDUAL_DUE_DATES_PROVIDER,)),
+    ('self-paced', (SELF_PACED_PROVIDER,)),
+    ('all providers', (CCX_PROVIDER, INDIVIDUAL_DUE_DATES_PROVIDER, SELF_PACED_PROVIDER)),
+)
+
+FIELDS = ('start', 'due', 'visible_to_staff_only', 'graded')
+
+
+class Command(BaseCommand):
+    help = dedent(__doc__).strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_id', help='the course, or CCX, whose blocks are read')
+        parser.add_argument('username', help='the user for whom the blocks are read')
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of times the fields of all the blocks are read.',
+        )
+
+    def handle(self, *args, **options):
+        course_key = CourseKey.from_string(options['course_id'])
+        user = User.objects.get(username=options['username'])
+        course = modulestore().get_course(course_key, depth=None)
+        blocks = list(_iter_blocks(course))
+        field_data = {block.location: block._field_data for block in blocks}  # pylint: disable=protected-access
+
+        for label, provider_names in PROVIDER_CONFIGURATIONS:
+            providers = tuple(resolve_dotted(provider_name) for provider_name in provider_names)
+            for block in blocks:
+                block._field_data = OverrideFieldData(  # pylint: disable=protected-access
+                    user, field_data[block.location], providers
+                )
+
+            for name, shared in (('per block', False), ('shared across blocks', True)):
+                seconds = min(timeit.repeat(
+                    partial(_read_fields, blocks, shared),
+                    setup=RequestCache.clear_request_cache,
+                    number=1,
+                    repeat=options['repeat'],
+                ))
+                self.stdout.write(u'{}, inherited overrides resolved {}: {:.2f} us per field read'.format(
+                    label, name, seconds * 1000000 / (len(blocks) * len(FIELDS))
+                ))
+
+        for block in blocks:
+            block._field_data = field_data[block.location]  # pylint: disable=protected-access
+        RequestCache.clear_request_cache()
+
+
+def _read_fields(blocks, shared):
+    """
+    Reads the benchmarked fields of all the blocks. Unless `shared`, the
+    overrides inherited by each block are resolved by walking its lineage.
+    """
+    for block in blocks:
+        block._field_data_cache.clear()  # pylint: disable=protected-access
+    for block in blocks:
+        for field_name in FIELDS:
+            if not shared:
+                clear_inherited_overrides()
+            getattr(block, field_name)
+
+
+def _iter_blocks(block):
+    """
+    Yields the given block and all of its descendants.
+    """
+    yield block
+    for child in block.get_children():
+        for descendant in _iter_blocks(child):
+            yield descendant
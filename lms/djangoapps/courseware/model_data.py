@@ -677,6 +677,37 @@ class UserInfoCache(DjangoOrmFieldCache):
         return key.field_name
 
 
+def get_descendant_descriptors(descriptor, depth=None, descriptor_filter=lambda descriptor: True):
+    """
+    Return a list of all child descriptors down to the specified depth
+    that match the descriptor filter. Includes `descriptor`
+
+    descriptor: The parent to search inside
+    depth: The number of levels to descend, or None for infinite depth
+    descriptor_filter(descriptor): A function that returns True
+        if descriptor should be included in the results
+    """
+    def get_child_descriptors(descriptor, depth):
+        """
+        Return the descriptors of the subtree of `descriptor`.
+        """
+        if descriptor_filter(descriptor):
+            descriptors = [descriptor]
+        else:
+            descriptors = []
+
+        if depth is None or depth > 0:
+            new_depth = depth - 1 if depth is not None else depth
+
+            for child in descriptor.get_children() + descriptor.get_required_module_descriptors():
+                descriptors.extend(get_child_descriptors(child, new_depth))
+
+        return descriptors
+
+    with modulestore().bulk_operations(descriptor.location.course_key):
+        return get_child_descriptors(descriptor, depth)
+
+
 class FieldDataCache(object):
     """
     A cache of django model objects needed to supply the data
@@ -748,33 +779,7 @@ class FieldDataCache(object):
                 should be cached
         """
 
-        def get_child_descriptors(descriptor, depth, descriptor_filter):
-            """
-            Return a list of all child descriptors down to the specified depth
-            that match the descriptor filter. Includes `descriptor`
-
-            descriptor: The parent to search inside
-            depth: The number of levels to descend, or None for infinite depth
-            descriptor_filter(descriptor): A function that returns True
-                if descriptor should be included in the results
-            """
-            if descriptor_filter(descriptor):
-                descriptors = [descriptor]
-            else:
-                descriptors = []
-
-            if depth is None or depth > 0:
-                new_depth = depth - 1 if depth is not None else depth
-
-                for child in descriptor.get_children() + descriptor.get_required_module_descriptors():
-                    descriptors.extend(get_child_descriptors(child, new_depth, descriptor_filter))
-
-            return descriptors
-
-        with modulestore().bulk_operations(descriptor.location.course_key):
-            descriptors = get_child_descriptors(descriptor, depth, descriptor_filter)
-
-        self.add_descriptors_to_cache(descriptors)
+        self.add_descriptors_to_cache(get_descendant_descriptors(descriptor, depth, descriptor_filter))
 
     @classmethod
     def cache_for_descriptor_descendents(cls, course_id, user, descriptor, depth=None,
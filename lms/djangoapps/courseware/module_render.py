@@ -40,7 +40,7 @@ from courseware.masquerade import (
 from courseware.model_data import DjangoKeyValueStore, FieldDataCache
 from edxmako.shortcuts import render_to_string
 from eventtracking import tracker
-from lms.djangoapps.completion.models import BlockCompletion
+from lms.djangoapps.completion import batching as completion_batching
 from lms.djangoapps.completion import waffle as completion_waffle
 from lms.djangoapps.grades.signals.signals import SCORE_PUBLISHED
 from lms.djangoapps.lms_xblock.field_data import LmsFieldData
@@ -52,6 +52,7 @@ from openedx.core.djangoapps.crawlers.models import CrawlersConfig
 from openedx.core.djangoapps.credit.services import CreditService
 from openedx.core.djangoapps.monitoring_utils import set_custom_metrics_for_course_key, set_monitoring_transaction_name
 from openedx.core.djangoapps.util.user_utils import SystemUser
+from openedx.core.djangoapps.waffle_utils import WaffleSwitchNamespace
 from openedx.core.lib.license import wrap_with_license
 from openedx.core.lib.url_utils import quote_slashes, unquote_slashes
 from openedx.core.lib.xblock_utils import request_token as xblock_request_token
@@ -60,6 +61,7 @@ from openedx.core.lib.xblock_utils import (
     replace_course_urls,
     replace_jump_to_id_urls,
     replace_static_urls,
+    replace_urls_with_cache,
     wrap_xblock
 )
 from student.models import anonymous_id_for_user, user_by_anonymous_id
@@ -73,6 +75,7 @@ from xblock_django.user_service import DjangoXBlockUserService
 from xmodule.contentstore.django import contentstore
 from xmodule.error_module import ErrorDescriptor, NonStaffErrorDescriptor
 from xmodule.exceptions import NotFoundError, ProcessingError
+from xmodule.html_module import HtmlBlock
 from xmodule.lti_module import LTIModule
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
@@ -518,7 +521,7 @@ def get_module_system_for_user(
         if not completion_waffle.waffle().is_enabled(completion_waffle.ENABLE_COMPLETION_TRACKING):
             raise Http404
         else:
-            BlockCompletion.objects.submit_completion(
+            completion_batching.submit_completion(
                 user=user,
                 course_key=course_id,
                 block_key=block.scope_ids.usage_id,
@@ -561,7 +564,7 @@ def get_module_system_for_user(
             # and we ignore the deprecated 'progress' events
             # in order to avoid duplicate work and possibly conflicting semantics.
             if not getattr(block, 'has_custom_completion', False):
-                BlockCompletion.objects.submit_completion(
+                completion_batching.submit_completion(
                     user=user,
                     course_key=course_id,
                     block_key=block.scope_ids.usage_id,
@@ -635,6 +638,41 @@ def get_module_system_for_user(
     if is_masquerading_as_specific_student(user, course_id):
         block_wrappers.append(filter_displayed_blocks)
 
+    # TODO (cpennington): When modules are shared between courses, the static
+    # prefix is going to have to be specific to the module, not the directory
+    # that the xml was loaded from
+    data_dir = getattr(descriptor, 'data_dir', None)
+    block_static_asset_path = static_asset_path or descriptor.static_asset_path
+    jump_to_id_base_url = reverse('jump_to_id', kwargs={'course_id': text_type(course_id), 'module_id': ''})
+    url_rewriters = [
+        # Rewrite urls beginning in /static to point to course-specific content
+        partial(replace_static_urls, data_dir, course_id=course_id, static_asset_path=block_static_asset_path),
+
+        # Allow URLs of the form '/course/' refer to the root of multicourse directory
+        #   hierarchy of this course
+        partial(replace_course_urls, course_id),
+
+        # this will rewrite intra-courseware links (/jump_to_id/<id>). This format
+        # is an improvement over the /course/... format for studio authored courses,
+        # because it is agnostic to course-hierarchy.
+        # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
+        # function, we just need to specify something to get the reverse() to work.
+        partial(replace_jump_to_id_urls, course_id, jump_to_id_base_url),
+    ]
+
+    # The html of html blocks is rewritten before it is wrapped, so that
+    # the rewritten html is the same for all learners and can be cached.
+    cache_rewritten_html = (
+        isinstance(descriptor, HtmlBlock) and
+        WaffleSwitchNamespace(name=u'courseware').is_enabled(u'cache_rewritten_html')
+    )
+    if cache_rewritten_html:
+        block_wrappers.append(partial(
+            replace_urls_with_cache,
+            url_rewriters,
+            (text_type(course_id), data_dir, block_static_asset_path, jump_to_id_base_url),
+        ))
+
     if settings.FEATURES.get("LICENSING", False):
         block_wrappers.append(wrap_with_license)
 
@@ -649,32 +687,8 @@ def get_module_system_for_user(
             request_token=request_token,
         ))
 
-    # TODO (cpennington): When modules are shared between courses, the static
-    # prefix is going to have to be specific to the module, not the directory
-    # that the xml was loaded from
-
-    # Rewrite urls beginning in /static to point to course-specific content
-    block_wrappers.append(partial(
-        replace_static_urls,
-        getattr(descriptor, 'data_dir', None),
-        course_id=course_id,
-        static_asset_path=static_asset_path or descriptor.static_asset_path
-    ))
-
-    # Allow URLs of the form '/course/' refer to the root of multicourse directory
-    #   hierarchy of this course
-    block_wrappers.append(partial(replace_course_urls, course_id))
-
-    # this will rewrite intra-courseware links (/jump_to_id/<id>). This format
-    # is an improvement over the /course/... format for studio authored courses,
-    # because it is agnostic to course-hierarchy.
-    # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
-    # function, we just need to specify something to get the reverse() to work.
-    block_wrappers.append(partial(
-        replace_jump_to_id_urls,
-        course_id,
-        reverse('jump_to_id', kwargs={'course_id': text_type(course_id), 'module_id': ''}),
-    ))
+    if not cache_rewritten_html:
+        block_wrappers.extend(url_rewriters)
 
     if settings.FEATURES.get('DISPLAY_DEBUG_INFO_TO_STAFF'):
         if is_masquerading_as_specific_student(user, course_id):
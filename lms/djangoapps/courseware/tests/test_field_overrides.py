@@ -8,13 +8,16 @@ from django.test.utils import override_settings
 from nose.plugins.attrib import attr
 from xblock.field_data import DictFieldData
 
+from request_cache.middleware import RequestCache
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory
 
 from ..field_overrides import (
+    NOTSET,
     FieldOverrideProvider,
     OverrideFieldData,
     OverrideModulestoreFieldData,
+    clear_inherited_overrides,
     disable_overrides,
     resolve_dotted
 )
@@ -149,6 +152,76 @@ class OverrideModulestoreFieldDataTests(FieldOverrideTestMixin, OverrideFieldDat
         self.assertIsInstance(data, DictFieldData)
 
 
+class FakeBlock(object):
+    """
+    A block of a tree of blocks, with just enough of the XBlock interface
+    for resolving inherited overrides.
+    """
+    def __init__(self, location, parent=None):
+        self.location = location
+        self.parent = parent
+
+    def get_parent(self):
+        return self.parent
+
+
+class CountingOverrideProvider(FieldOverrideProvider):
+    """
+    A `FieldOverrideProvider` overriding the due date of the root block,
+    which counts the lookups made.
+    """
+    lookups = []
+
+    def get(self, block, name, default):
+        self.lookups.append((block.location, name))
+        if block.location == 'root' and name == 'due':
+            return 'tomorrow'
+        return default
+
+    @classmethod
+    def enabled_for(cls, course):
+        return True
+
+
+@attr(shard=1)
+class InheritedOverridesTests(unittest.TestCase):
+    """
+    Tests for the resolution of inherited overrides by `OverrideFieldData`.
+    """
+    def setUp(self):
+        super(InheritedOverridesTests, self).setUp()
+        self.addCleanup(RequestCache.clear_request_cache)
+        CountingOverrideProvider.lookups = []
+        root = FakeBlock('root')
+        self.leaves = []
+        for chapter_index in range(2):
+            chapter = FakeBlock('chapter{}'.format(chapter_index), root)
+            for leaf_index in range(3):
+                self.leaves.append(FakeBlock('leaf{}{}'.format(chapter_index, leaf_index), chapter))
+        self.field_data = OverrideFieldData(TESTUSER, DictFieldData({}), [CountingOverrideProvider])
+
+    def test_inherited_override(self):
+        for leaf in self.leaves:
+            self.assertEqual(self.field_data.get_inherited_override(leaf, 'due'), 'tomorrow')
+            self.assertIs(self.field_data.get_inherited_override(leaf, 'start'), NOTSET)
+
+    def test_ancestors_consulted_once(self):
+        for leaf in self.leaves:
+            self.field_data.get_inherited_override(leaf, 'start')
+        # Each chapter and the root are only looked up once.
+        self.assertEqual(len(CountingOverrideProvider.lookups), 3)
+
+    def test_clear_inherited_overrides(self):
+        self.field_data.get_inherited_override(self.leaves[0], 'start')
+        clear_inherited_overrides()
+        self.field_data.get_inherited_override(self.leaves[0], 'start')
+        self.assertEqual(len(CountingOverrideProvider.lookups), 4)
+
+    def test_overrides_disabled(self):
+        with disable_overrides():
+            self.assertIs(self.field_data.get_inherited_override(self.leaves[0], 'due'), NOTSET)
+
+
 @attr(shard=1)
 class ResolveDottedTests(unittest.TestCase):
     """
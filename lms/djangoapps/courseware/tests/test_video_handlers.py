@@ -20,7 +20,11 @@ from xmodule.contentstore.django import contentstore
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.django import modulestore
-from xmodule.video_module.transcripts_utils import TranscriptException, TranscriptsGenerationException
+from xmodule.video_module.transcripts_utils import (
+    TranscriptException,
+    TranscriptsGenerationException,
+    invalidate_transcript_availability_index
+)
 from xmodule.x_module import STUDENT_VIEW
 
 from .helpers import BaseTestXmodule
@@ -73,6 +77,7 @@ def _clear_assets(location):
         asset_location = asset['asset_key']
         del_cached_content(asset_location)
         store.delete(asset_location)
+    invalidate_transcript_availability_index(location.course_key)
 
 
 def _get_subs_id(filename):
@@ -104,6 +109,7 @@ def _upload_file(subs_file, location, filename):
     content = StaticContent(content_location, filename, mime_type, subs_file.read())
     contentstore().save(content)
     del_cached_content(content.location)
+    invalidate_transcript_availability_index(location.course_key)
 
 
 @normalize_repr
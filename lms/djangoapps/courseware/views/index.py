@@ -53,7 +53,7 @@ from ..entrance_exams import (
     user_has_passed_entrance_exam
 )
 from ..masquerade import setup_masquerade
-from ..model_data import FieldDataCache
+from ..model_data import FieldDataCache, get_descendant_descriptors
 from ..module_render import get_module_for_descriptor, toc_for_course
 
 log = logging.getLogger("edx.courseware.views.index")
@@ -72,6 +72,23 @@ class CoursewareIndex(View):
         waffle_flag = CourseWaffleFlag(WaffleFlagNamespace(name='seo'), 'enable_anonymous_courseware_access')
         return waffle_flag.is_enabled(self.course_key)
 
+    @cached_property
+    def render_units_on_demand(self):
+        """
+        Returns whether only the active unit of the section is rendered with
+        the page, the other units being fetched by the sequence when the
+        learner navigates to them.
+        """
+        waffle_flag = CourseWaffleFlag(WaffleFlagNamespace(name='courseware'), 'render_units_on_demand')
+        return (
+            waffle_flag.is_enabled(self.course_key) and
+            self.request.user.is_authenticated() and
+            # The units of sections that are hidden from learners are all rendered
+            # for staff masquerading as a specific student.
+            not self._is_masquerading_as_specific_student() and
+            self.section.location.block_type == 'sequential'
+        )
+
     @method_decorator(ensure_csrf_cookie)
     @method_decorator(cache_control(no_cache=True, no_store=True, must_revalidate=True))
     @method_decorator(ensure_valid_course_key)
@@ -106,6 +123,7 @@ class CoursewareIndex(View):
         self.section_url_name = section
         self.position = position
         self.chapter, self.section = None, None
+        self.unit_descendants = {}
         self.course = None
         self.url = request.path
 
@@ -332,10 +350,22 @@ class CoursewareIndex(View):
         """
         Prefetches all descendant data for the requested section and
         sets up the runtime, which binds the request user to the section.
+
+        When units are rendered on demand, only the data of the section and
+        its units is prefetched, and that of the descendants of the active
+        unit is prefetched by _prefetch_active_unit.
         """
         # Pre-fetch all descendant data
         self.section = modulestore().get_item(self.section.location, depth=None, lazy=False)
-        self.field_data_cache.add_descriptor_descendents(self.section, depth=None)
+        if self.render_units_on_demand:
+            # The descendants of the units are gathered before the units are
+            # bound, as getting the children of a bound unit binds them.
+            self.unit_descendants = {
+                unit.location: get_descendant_descriptors(unit) for unit in self.section.get_children()
+            }
+            self.field_data_cache.add_descriptor_descendents(self.section, depth=1)
+        else:
+            self.field_data_cache.add_descriptor_descendents(self.section, depth=None)
 
         # Bind section to user
         self.section = get_module_for_descriptor(
@@ -348,6 +378,16 @@ class CoursewareIndex(View):
             course=self.course,
         )
 
+    def _prefetch_active_unit(self, section_context):
+        """
+        Prefetches all descendant data for the unit of the section that is
+        rendered for the given section context, before its children are
+        bound to the user.
+        """
+        active_unit = self.section.get_active_display_item(section_context)
+        if active_unit is not None:
+            self.field_data_cache.add_descriptors_to_cache(self.unit_descendants.get(active_unit.location, []))
+
     def _save_positions(self):
         """
         Save where we are in the course and chapter.
@@ -435,6 +475,8 @@ class CoursewareIndex(View):
                 table_of_contents['previous_of_active_section'],
                 table_of_contents['next_of_active_section'],
             )
+            if self.render_units_on_demand:
+                self._prefetch_active_unit(section_context)
             courseware_context['fragment'] = self.section.render(STUDENT_VIEW, section_context)
             if self.section.position and self.section.has_children:
                 display_items = self.section.get_display_items()
@@ -498,6 +540,7 @@ class CoursewareIndex(View):
             section_context['next_url'] = _compute_section_url(next_of_active_section, 'first')
         # sections can hide data that masquerading staff should see when debugging issues with specific students
         section_context['specific_masquerade'] = self._is_masquerading_as_specific_student()
+        section_context['render_units_on_demand'] = self.render_units_on_demand
         return section_context
 
 
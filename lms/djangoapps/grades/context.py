@@ -6,7 +6,7 @@ from collections import OrderedDict
 from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 
 from .course_grade import CourseGrade
-from .scores import possibly_scored
+from .scores import scorable_descendants
 
 
 def grading_context_for_course(course):
@@ -45,10 +45,7 @@ def grading_context(course, course_structure):
             subsection = course_structure[subsection_key]
             scored_descendants_of_subsection = []
             if subsection.graded:
-                for descendant_key in course_structure.post_order_traversal(
-                        filter_func=possibly_scored,
-                        start_node=subsection_key,
-                ):
+                for descendant_key in scorable_descendants(course_structure, subsection_key):
                     scored_descendants_of_subsection.append(
                         course_structure[descendant_key],
                     )
@@ -0,0 +1,108 @@
+"""
+Benchmark of the computation of the course grades of the learners enrolled
+in a course, which are neither read from nor saved to the database. For
+each learner, it times the transform of the course structure, the reading
+of their scores and the computation of their subsection grades, as well as
+locating the scorable blocks of every subsection with the index collected
+by the GradesTransformer compared to traversing the subsection, e.g.
+
+    ./manage.py lms benchmark_course_grades course-v1:edX+DemoX+Demo_Course --learners 100
+"""
+from textwrap import dedent
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+from opaque_keys.edx.keys import CourseKey
+
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from student.models import CourseEnrollment
+
+from ...course_data import CourseData
+from ...scores import possibly_scored
+from ...subsection_grade import CreateSubsectionGrade
+from ...subsection_grade_factory import SubsectionGradeFactory
+from ...transformer import GradesTransformer
+
+PHASES = ('structure', 'scores', 'subsection grades', 'index', 'traversal')
+
+
+def _elapsed(func):
+    """
+    Returns the time, in milliseconds, taken by the given function.
+    """
+    start = default_timer()
+    func()
+    return (default_timer() - start) * 1000
+
+
+def _time_learner(user, course_key, collected_block_structure):
+    """
+    Returns the times, in milliseconds, of every phase of the computation of
+    the grades of the given learner, keyed by phase.
+    """
+    course_data = CourseData(user, course_key=course_key, collected_block_structure=collected_block_structure)
+    factory = SubsectionGradeFactory(user, course_data=course_data)
+    times = {'structure': _elapsed(lambda: course_data.structure)}
+
+    def read_scores():
+        """
+        Reads the scores of the learner.
+        """
+        factory._submissions_scores  # pylint: disable=pointless-statement, protected-access
+        factory._csm_scores  # pylint: disable=pointless-statement, protected-access
+    times['scores'] = _elapsed(read_scores)
+
+    structure = course_data.structure
+    subsection_keys = [
+        subsection_key
+        for chapter_key in structure.get_children(structure.root_block_usage_key)
+        for subsection_key in structure.get_children(chapter_key)
+    ]
+
+    def compute_subsection_grades():
+        """
+        Computes the subsection grades of the learner.
+        """
+        for subsection_key in subsection_keys:
+            CreateSubsectionGrade(
+                structure[subsection_key],
+                structure,
+                factory._submissions_scores,  # pylint: disable=protected-access
+                factory._csm_scores,  # pylint: disable=protected-access
+            )
+    times['subsection grades'] = _elapsed(compute_subsection_grades)
+
+    times['index'] = _elapsed(lambda: [
+        GradesTransformer.get_scorable_descendants(structure, subsection_key)
+        for subsection_key in subsection_keys
+    ])
+    times['traversal'] = _elapsed(lambda: [
+        list(structure.post_order_traversal(filter_func=possibly_scored, start_node=subsection_key))
+        for subsection_key in subsection_keys
+    ])
+    return times
+
+
+class Command(BaseCommand):
+    help = dedent(__doc__).strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument('course', help='Id of the course.')
+        parser.add_argument('--learners', type=int, default=100, help='Number of learners whose grades are computed.')
+
+    def handle(self, *args, **options):
+        course_key = CourseKey.from_string(options['course'])
+        collected_block_structure = get_course_in_cache(course_key)
+        users = CourseEnrollment.objects.users_enrolled_in(course_key).order_by('id')[:options['learners']]
+
+        learner_times = [_time_learner(user, course_key, collected_block_structure) for user in users]
+        if not learner_times:
+            self.stdout.write(u'No learners are enrolled in {}'.format(course_key))
+            return
+
+        self.stdout.write(u'{} learners'.format(len(learner_times)))
+        for phase in PHASES:
+            phase_times = [times[phase] for times in learner_times]
+            self.stdout.write(u'{}: mean {:.2f} ms, max {:.2f} ms per learner'.format(
+                phase, sum(phase_times) / len(phase_times), max(phase_times),
+            ))
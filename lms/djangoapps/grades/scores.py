@@ -22,6 +22,22 @@ def possibly_scored(usage_key):
     return usage_key.block_type in _block_types_possibly_scored()
 
 
+def scorable_descendants(course_structure, subsection_key):
+    """
+    Returns the usage keys of the blocks of the given subsection, in the
+    given course structure, that could have a score.  The keys collected
+    by the GradesTransformer are used when available, so that the
+    subsection is not traversed.
+    """
+    block_keys = GradesTransformer.get_scorable_descendants(course_structure, subsection_key)
+    if block_keys is None:
+        block_keys = course_structure.post_order_traversal(
+            filter_func=possibly_scored,
+            start_node=subsection_key,
+        )
+    return block_keys
+
+
 def get_score(submissions_scores, csm_scores, persisted_block, block):
     """
     Returns the score for a problem, as a ProblemScore object.  It is
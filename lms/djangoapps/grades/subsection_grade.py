@@ -8,7 +8,7 @@ from logging import getLogger
 from lazy import lazy
 
 from lms.djangoapps.grades.models import BlockRecord, PersistentSubsectionGrade
-from lms.djangoapps.grades.scores import get_score, possibly_scored, compute_percent
+from lms.djangoapps.grades.scores import get_score, scorable_descendants, compute_percent
 from xmodule import block_metadata_utils, graders
 from xmodule.graders import AggregatedScore, ShowCorrectness
 
@@ -107,10 +107,7 @@ class ZeroSubsectionGrade(SubsectionGradeBase):
         course.
         """
         locations = OrderedDict()  # dict of problem locations to ProblemScore
-        for block_key in self.course_data.structure.post_order_traversal(
-                filter_func=possibly_scored,
-                start_node=self.location,
-        ):
+        for block_key in scorable_descendants(self.course_data.structure, self.location):
             block = self.course_data.structure[block_key]
             if getattr(block, 'has_score', False):
                 problem_score = get_score(
@@ -214,10 +211,7 @@ class CreateSubsectionGrade(NonZeroSubsectionGrade):
     """
     def __init__(self, subsection, course_structure, submissions_scores, csm_scores):
         self.problem_scores = OrderedDict()
-        for block_key in course_structure.post_order_traversal(
-                filter_func=possibly_scored,
-                start_node=subsection.location,
-        ):
+        for block_key in scorable_descendants(course_structure, subsection.location):
             problem_score = self._compute_block_score(block_key, course_structure, submissions_scores, csm_scores)
             if problem_score:
                 self.problem_scores[block_key] = problem_score
@@ -18,6 +18,7 @@ from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import check_mongo_calls
 
+from ..scores import scorable_descendants
 from ..transformer import GradesTransformer
 
 
@@ -222,6 +223,78 @@ class GradesTransformerTestCase(CourseStructureTestCase):
             )
             self.assertEqual(actual_subsections, {blocks[sub].location for sub in expected_subsections})
 
+    def test_collect_scorable_descendants(self):
+        expected_scorable_descendants = {
+            # Subsections A and B share vertical 3 and subsection C.
+            'sub_A': None,
+            'sub_B': None,
+            'sub_C': ['prob_BCb'],
+        }
+        blocks = self.build_complicated_hypothetical_course()
+        block_structure = get_course_blocks(self.student, blocks[u'course'].location, self.transformers)
+        for block_ref, expected_refs in expected_scorable_descendants.iteritems():
+            self.assertEqual(
+                GradesTransformer.get_scorable_descendants(block_structure, blocks[block_ref].location),
+                [blocks[ref].location for ref in expected_refs] if expected_refs is not None else None,
+            )
+
+        # Blocks that are no longer in the structure are left out.
+        block_structure.remove_block(blocks[u'prob_BCb'].location, keep_descendants=False)
+        self.assertEqual(GradesTransformer.get_scorable_descendants(block_structure, blocks[u'sub_C'].location), [])
+
+    def test_scorable_descendants_with_shared_child(self):
+        blocks = self.build_course([
+            {
+                u'org': u'GradesTestOrg',
+                u'course': u'GB101',
+                u'run': u'cannonball',
+                u'#type': u'course',
+                u'#ref': u'course',
+                u'#children': [
+                    {
+                        u'#type': u'chapter',
+                        u'#ref': u'chapter',
+                        u'#children': [
+                            {
+                                u'#type': u'sequential',
+                                u'#ref': u'sub_A',
+                                u'#children': [
+                                    {
+                                        u'#type': u'vertical',
+                                        u'#ref': u'vert_A',
+                                        u'#children': [
+                                            {u'#type': u'problem', u'#ref': u'prob_shared', u'#parents': [u'vert_B']},
+                                        ],
+                                    },
+                                ],
+                            },
+                            {
+                                u'#type': u'sequential',
+                                u'#ref': u'sub_B',
+                                u'#children': [
+                                    {u'#type': u'vertical', u'#ref': u'vert_B'},
+                                ],
+                            },
+                        ],
+                    },
+                ],
+            },
+        ])
+        block_structure = get_course_blocks(self.student, blocks[u'course'].location, self.transformers)
+
+        # The unit of subsection A is removed for the learner, but the shared
+        # problem is kept through the unit of subsection B.
+        block_structure.remove_block(blocks[u'vert_A'].location, keep_descendants=False)
+        self.assertIn(blocks[u'prob_shared'].location, block_structure)
+        self.assertNotIn(
+            blocks[u'prob_shared'].location,
+            list(scorable_descendants(block_structure, blocks[u'sub_A'].location)),
+        )
+        self.assertIn(
+            blocks[u'prob_shared'].location,
+            list(scorable_descendants(block_structure, blocks[u'sub_B'].location)),
+        )
+
     def test_unscored_block_collection(self):
         blocks = self.build_course_with_problems()
         block_structure = get_course_blocks(self.student, blocks[u'course'].location, self.transformers)
@@ -9,6 +9,7 @@ from logging import getLogger
 
 from lms.djangoapps.course_blocks.transformers.utils import collect_unioned_set_field, get_field_on_block
 from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
+from openedx.core.lib.graph_traversals import traverse_post_order
 
 log = getLogger(__name__)
 
@@ -34,8 +35,15 @@ class GradesTransformer(BlockStructureTransformer):
     transformer_block_field for each block:
 
         max_score: (numeric)
+
+    And the following value is stored as a transformer_block_field for
+    each subsection:
+
+        scorable_descendants: (tuple) usage keys of the descendants of the
+            subsection that have a score, in post-order, or None if any
+            descendant has several parents.
     """
-    WRITE_VERSION = 4
+    WRITE_VERSION = 5
     READ_VERSION = 4
     FIELDS_TO_COLLECT = [
         u'due',
@@ -49,6 +57,7 @@ class GradesTransformer(BlockStructureTransformer):
     ]
 
     EXPLICIT_GRADED_FIELD_NAME = 'explicit_graded'
+    SCORABLE_DESCENDANTS_FIELD_NAME = 'scorable_descendants'
 
     @classmethod
     def name(cls):
@@ -72,6 +81,7 @@ class GradesTransformer(BlockStructureTransformer):
             merged_field_name='subsections',
             filter_by=lambda block_key: block_key.block_type == 'sequential',
         )
+        cls._collect_scorable_descendants(block_structure)
         cls._collect_explicit_graded(block_structure)
         cls._collect_grading_policy_hash(block_structure)
 
@@ -93,6 +103,65 @@ class GradesTransformer(BlockStructureTransformer):
         )
         return b64encode(sha1(ordered_policy).digest())
 
+    @classmethod
+    def get_scorable_descendants(cls, block_structure, subsection_key):
+        """
+        Returns the usage keys of the descendants of the given subsection
+        that have a score and are in the given block structure, in
+        post-order, or None if they were not collected for the subsection.
+
+        Since none of the collected descendants has several parents, those
+        in the block structure are still reachable from the subsection.
+        """
+        scorable_descendants = block_structure.get_transformer_block_field(
+            subsection_key, cls, cls.SCORABLE_DESCENDANTS_FIELD_NAME,
+        )
+        if scorable_descendants is None:
+            return None
+        return [block_key for block_key in scorable_descendants if block_key in block_structure]
+
+    @classmethod
+    def _collect_scorable_descendants(cls, block_structure):
+        """
+        Collect, for every subsection, the usage keys of its descendants
+        that have a score, so that grading a subsection does not need to
+        traverse it.
+
+        Nothing is collected for subsections with descendants that have
+        several parents, such descendants being kept in a learner's
+        structure through other parents after they are no longer reachable
+        from the subsection. Those subsections are traversed instead.
+        """
+        # Import is placed here to avoid a circular import.
+        from .scores import possibly_scored
+
+        for subsection_key in block_structure.topological_traversal():
+            if subsection_key.block_type != 'sequential':
+                continue
+            # The descendants are traversed without the structure's own
+            # traversal, which skips the blocks that are not collected again
+            # when only some blocks of the course changed.
+            descendants = list(traverse_post_order(
+                start_node=subsection_key,
+                get_children=block_structure.get_children,
+                filter_func=possibly_scored,
+            ))
+            if any(
+                len(block_structure.get_parents(block_key)) > 1
+                for block_key in descendants
+                if block_key != subsection_key
+            ):
+                scorable_descendants = None
+            else:
+                scorable_descendants = tuple(
+                    block_key
+                    for block_key in descendants
+                    if getattr(block_structure.get_xblock(block_key), 'has_score', False)
+                )
+            block_structure.set_transformer_block_field(
+                subsection_key, cls, cls.SCORABLE_DESCENDANTS_FIELD_NAME, scorable_descendants,
+            )
+
     @classmethod
     def _collect_explicit_graded(cls, block_structure):
         """
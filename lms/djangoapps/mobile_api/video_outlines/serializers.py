@@ -4,19 +4,20 @@ Serializer for video outline
 from edxval.api import ValInternalError, get_video_info_for_course_and_profiles
 from rest_framework.reverse import reverse
 
-from courseware.access import has_access
-from courseware.courses import get_course_by_id
-from courseware.model_data import FieldDataCache
-from courseware.module_render import get_module_for_descriptor
-from util.module_utils import get_dynamic_descriptor_children
-from xmodule.modulestore.django import modulestore
+from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, get_course_blocks
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
+from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
+from xmodule.block_metadata_utils import display_name_with_default_escaped
 from xmodule.modulestore.mongo.base import BLOCK_TYPES_WITH_CHILDREN
 from xmodule.video_module.transcripts_model_utils import is_val_transcript_feature_enabled_for_course
+from xmodule.video_module.transcripts_utils import VideoTranscriptsMixin
+
+from .transformers import VideoBlockOutlineTransformer
 
 
 class BlockOutline(object):
     """
-    Serializes course videos, pulling data from VAL and the video modules.
+    Serializes course videos, pulling data from VAL and the course's block structure.
     """
     def __init__(self, course_id, start_block, block_types, request, video_profiles):
         """Create a BlockOutline using `start_block` as a starting point."""
@@ -33,86 +34,81 @@ class BlockOutline(object):
             self.local_cache['course_videos'] = {}
 
     def __iter__(self):
-        def parent_or_requested_block_type(usage_key):
-            """
-            Returns whether the usage_key's block_type is one of self.block_types or a parent type.
-            """
-            return (
-                usage_key.block_type in self.block_types or
-                usage_key.block_type in BLOCK_TYPES_WITH_CHILDREN
-            )
+        collected_structure = get_block_structure_manager(self.course_id).get_collected()
+        user_structure = get_course_blocks(
+            self.request.user,
+            self.start_block.location,
+            BlockStructureTransformers(COURSE_BLOCK_ACCESS_TRANSFORMERS + [VideoBlockOutlineTransformer()]),
+            collected_block_structure=collected_structure,
+        )
 
-        def create_module(descriptor):
+        def is_visible(usage_key):
             """
-            Factory method for creating and binding a module for the given descriptor.
+            Returns whether the usage_key's block_type is one of self.block_types or a parent type,
+            and the block is accessible to the user.
             """
-            field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
-                self.course_id, self.request.user, descriptor, depth=0,
-            )
-            course = get_course_by_id(self.course_id)
-            return get_module_for_descriptor(
-                self.request.user, self.request, descriptor, field_data_cache, self.course_id, course=course
-            )
-
-        with modulestore().bulk_operations(self.course_id):
-            child_to_parent = {}
-            stack = [self.start_block]
-            while stack:
-                curr_block = stack.pop()
-
-                if curr_block.hide_from_toc:
-                    # For now, if the 'hide_from_toc' setting is set on the block, do not traverse down
-                    # the hierarchy.  The reason being is that these blocks may not have human-readable names
-                    # to display on the mobile clients.
-                    # Eventually, we'll need to figure out how we want these blocks to be displayed on the
-                    # mobile clients.  As they are still accessible in the browser, just not navigatable
-                    # from the table-of-contents.
-                    continue
-
-                if curr_block.location.block_type in self.block_types:
-                    if not has_access(self.request.user, 'load', curr_block, course_key=self.course_id):
-                        continue
-
-                    summary_fn = self.block_types[curr_block.category]
-                    block_path = list(path(curr_block, child_to_parent, self.start_block))
-                    unit_url, section_url = find_urls(self.course_id, curr_block, child_to_parent, self.request)
-
-                    yield {
-                        "path": block_path,
-                        "named_path": [b["name"] for b in block_path],
-                        "unit_url": unit_url,
-                        "section_url": section_url,
-                        "summary": summary_fn(self.course_id, curr_block, self.request, self.local_cache)
-                    }
-
-                if curr_block.has_children:
-                    children = get_dynamic_descriptor_children(
-                        curr_block,
-                        self.request.user.id,
-                        create_module,
-                        usage_key_filter=parent_or_requested_block_type
-                    )
-                    for block in reversed(children):
-                        stack.append(block)
-                        child_to_parent[block] = curr_block
-
-
-def path(block, child_to_parent, start_block):
+            if usage_key.block_type not in self.block_types and usage_key.block_type not in BLOCK_TYPES_WITH_CHILDREN:
+                return False
+            # split_test blocks are removed from the user's block structure, with the
+            # children of the user's group kept in their place. They are still traversed
+            # here, so that they keep appearing in the paths of their descendants.
+            return usage_key in user_structure or usage_key.block_type == 'split_test'
+
+        start_key = self.start_block.location
+        child_to_parent = {}
+        stack = [start_key]
+        while stack:
+            curr_key = stack.pop()
+
+            if collected_structure.get_xblock_field(curr_key, 'hide_from_toc'):
+                # For now, if the 'hide_from_toc' setting is set on the block, do not traverse down
+                # the hierarchy.  The reason being is that these blocks may not have human-readable names
+                # to display on the mobile clients.
+                # Eventually, we'll need to figure out how we want these blocks to be displayed on the
+                # mobile clients.  As they are still accessible in the browser, just not navigatable
+                # from the table-of-contents.
+                continue
+
+            if curr_key.block_type in self.block_types and curr_key in user_structure:
+                summary_fn = self.block_types[curr_key.block_type]
+                block_path = list(path(curr_key, child_to_parent, start_key, collected_structure))
+                unit_url, section_url = find_urls(
+                    self.course_id, curr_key, child_to_parent, self.request, collected_structure
+                )
+
+                yield {
+                    "path": block_path,
+                    "named_path": [b["name"] for b in block_path],
+                    "unit_url": unit_url,
+                    "section_url": section_url,
+                    "summary": summary_fn(self.course_id, user_structure, curr_key, self.request, self.local_cache)
+                }
+
+            children = [
+                child_key for child_key in collected_structure.get_children(curr_key)
+                if child_key not in child_to_parent and is_visible(child_key)
+            ]
+            for child_key in reversed(children):
+                stack.append(child_key)
+                child_to_parent[child_key] = curr_key
+
+
+def path(block_key, child_to_parent, start_key, block_structure):
     """path for block"""
     block_path = []
-    while block in child_to_parent:
-        block = child_to_parent[block]
-        if block is not start_block:
+    while block_key in child_to_parent:
+        block_key = child_to_parent[block_key]
+        if block_key != start_key:
             block_path.append({
                 # to be consistent with other edx-platform clients, return the defaulted display name
-                'name': block.display_name_with_default_escaped,
-                'category': block.category,
-                'id': unicode(block.location)
+                'name': display_name_with_default_escaped(block_structure[block_key]),
+                'category': block_key.block_type,
+                'id': unicode(block_key)
             })
     return reversed(block_path)
 
 
-def find_urls(course_id, block, child_to_parent, request):
+def find_urls(course_id, block_key, child_to_parent, request, block_structure):
     """
     Find the section and unit urls for a block.
 
@@ -123,21 +119,21 @@ def find_urls(course_id, block, child_to_parent, request):
 
     """
     block_path = []
-    while block in child_to_parent:
-        block = child_to_parent[block]
-        block_path.append(block)
+    while block_key in child_to_parent:
+        block_key = child_to_parent[block_key]
+        block_path.append(block_key)
 
     block_list = list(reversed(block_path))
     block_count = len(block_list)
 
-    chapter_id = block_list[1].location.block_id if block_count > 1 else None
+    chapter_id = block_list[1].block_id if block_count > 1 else None
     section = block_list[2] if block_count > 2 else None
     position = None
 
     if block_count > 3:
         position = 1
-        for block in section.children:
-            if block.name == block_list[3].url_name:
+        for child_key in block_structure.get_children(section):
+            if child_key.block_id == block_list[3].block_id:
                 break
             position += 1
 
@@ -151,7 +147,7 @@ def find_urls(course_id, block, child_to_parent, request):
         chapter_url = reverse("courseware_chapter", kwargs=kwargs, request=request)
         return chapter_url, chapter_url
 
-    kwargs['section'] = section.url_name
+    kwargs['section'] = section.block_id
     section_url = reverse("courseware_section", kwargs=kwargs, request=request)
     if position is None:
         return section_url, section_url
@@ -161,20 +157,39 @@ def find_urls(course_id, block, child_to_parent, request):
     return unit_url, section_url
 
 
-def video_summary(video_profiles, course_id, video_descriptor, request, local_cache):
+class _CollectedVideo(VideoTranscriptsMixin):
     """
-    returns summary dict for the given video module
+    Stands in for a video block, given its data collected by the
+    VideoBlockOutlineTransformer, so that the transcript helpers of the
+    VideoTranscriptsMixin are used without instantiating the block.
     """
+    def __init__(self, video_key, video_data):
+        self.location = video_key
+        self.sub = video_data['transcripts_info']['sub']
+        self.transcripts = video_data['transcripts_info']['transcripts']
+        self.transcript_language = video_data['transcript_language']
+        self.edx_video_id = video_data['edx_video_id']
+        self.youtube_id_1_0 = video_data['youtube_id_1_0']
+        self.html5_sources = video_data['html5_sources']
+
+
+def video_summary(video_profiles, course_id, block_structure, video_key, request, local_cache):
+    """
+    returns summary dict for the given video block
+    """
+    video_data = block_structure.get_transformer_block_field(
+        video_key, VideoBlockOutlineTransformer, VideoBlockOutlineTransformer.VIDEO_DATA
+    )
     always_available_data = {
-        "name": video_descriptor.display_name,
-        "category": video_descriptor.category,
-        "id": unicode(video_descriptor.scope_ids.usage_id),
-        "only_on_web": video_descriptor.only_on_web,
+        "name": block_structure.get_xblock_field(video_key, 'display_name'),
+        "category": video_key.block_type,
+        "id": unicode(video_key),
+        "only_on_web": video_data['only_on_web'],
     }
 
     all_sources = []
 
-    if video_descriptor.only_on_web:
+    if video_data['only_on_web']:
         ret = {
             "video_url": None,
             "video_thumbnail_url": None,
@@ -188,47 +203,49 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
         return ret
 
     # Get encoded videos
-    video_data = local_cache['course_videos'].get(video_descriptor.edx_video_id, {})
+    val_video_data = local_cache['course_videos'].get(video_data['edx_video_id'], {})
 
     # Get highest priority video to populate backwards compatible field
     default_encoded_video = {}
 
-    if video_data:
+    if val_video_data:
         for profile in video_profiles:
-            default_encoded_video = video_data['profiles'].get(profile, {})
+            default_encoded_video = val_video_data['profiles'].get(profile, {})
             if default_encoded_video:
                 break
 
     if default_encoded_video:
         video_url = default_encoded_video['url']
     # Then fall back to VideoDescriptor fields for video URLs
-    elif video_descriptor.html5_sources:
-        video_url = video_descriptor.html5_sources[0]
-        all_sources = video_descriptor.html5_sources
+    elif video_data['html5_sources']:
+        video_url = video_data['html5_sources'][0]
+        all_sources = list(video_data['html5_sources'])
     else:
-        video_url = video_descriptor.source
+        video_url = video_data['source']
 
-    if video_descriptor.source:
-        all_sources.append(video_descriptor.source)
+    if video_data['source']:
+        all_sources.append(video_data['source'])
 
     # Get duration/size, else default
-    duration = video_data.get('duration', None)
+    duration = val_video_data.get('duration', None)
     size = default_encoded_video.get('file_size', 0)
 
     # Transcripts...
+    video = _CollectedVideo(video_key, video_data)
     feature_enabled = is_val_transcript_feature_enabled_for_course(course_id)
-    transcripts_info = video_descriptor.get_transcripts_info(include_val_transcripts=feature_enabled)
-    transcript_langs = video_descriptor.available_translations(
-        transcripts=transcripts_info,
-        include_val_transcripts=feature_enabled
-    )
+    transcripts_info = video.get_transcripts_info(include_val_transcripts=feature_enabled)
+    if feature_enabled:
+        transcript_langs = video.available_translations(transcripts_info, include_val_transcripts=True)
+    else:
+        # Without edx-val transcripts, the translations are those collected from the block.
+        transcript_langs = video_data['translations']
 
     transcripts = {
         lang: reverse(
             'video-transcripts-detail',
             kwargs={
                 'course_id': unicode(course_id),
-                'block_id': video_descriptor.scope_ids.usage_id.block_id,
+                'block_id': video_key.block_id,
                 'lang': lang
             },
             request=request,
@@ -242,8 +259,8 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
         "duration": duration,
         "size": size,
         "transcripts": transcripts,
-        "language": video_descriptor.get_default_transcript_language(transcripts_info),
-        "encoded_videos": video_data.get('profiles'),
+        "language": video.get_default_transcript_language(transcripts_info),
+        "encoded_videos": val_video_data.get('profiles'),
         "all_sources": all_sources,
     }
     ret.update(always_available_data)
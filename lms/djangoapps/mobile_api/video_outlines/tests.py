@@ -18,6 +18,8 @@ from nose.plugins.attrib import attr
 
 from mobile_api.models import MobileApiConfig
 from mobile_api.testutils import MobileAPITestCase, MobileAuthTestMixin, MobileCourseAccessTestMixin
+from mobile_api.video_outlines.transformers import VideoBlockOutlineTransformer
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort, remove_user_from_cohort
 from openedx.core.djangoapps.course_groups.models import CourseUserGroupPartitionGroup
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory
@@ -943,6 +945,21 @@ class TestVideoSummaryList(TestVideoAPITestCase, MobileAuthTestMixin, MobileCour
         self.assertEqual(len(course_outline), 1)
         self.assertItemsEqual(course_outline[0]['summary']['transcripts'].keys(), expected_transcripts)
 
+    def test_collected_video_data(self):
+        video = self._create_video_with_subs()
+        block_structure = get_course_in_cache(self.course.id)
+        video_data = block_structure.get_transformer_block_field(
+            video.location, VideoBlockOutlineTransformer, VideoBlockOutlineTransformer.VIDEO_DATA
+        )
+        self.assertEqual(video_data['edx_video_id'], self.edx_video_id)
+        self.assertEqual(video_data['transcripts_info'], {'sub': video.sub, 'transcripts': {}})
+        self.assertEqual(video_data['translations'], ['en'])
+        self.assertIsNone(
+            block_structure.get_transformer_block_field(
+                self.unit.location, VideoBlockOutlineTransformer, VideoBlockOutlineTransformer.VIDEO_DATA
+            )
+        )
+
 
 @attr(shard=2)
 class TestTranscriptsDetail(TestVideoAPITestCase, MobileAuthTestMixin, MobileCourseAccessTestMixin,
@@ -0,0 +1,62 @@
+"""
+Video Outline Transformer
+"""
+from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
+
+
+class VideoBlockOutlineTransformer(BlockStructureTransformer):
+    """
+    Collects the video and transcript metadata needed by the mobile video
+    outline, so that the outline can be served without instantiating the
+    video modules on each request.
+
+    The transform method is a no-op; access to the blocks is enforced by the
+    course block access transformers.
+    """
+    WRITE_VERSION = 1
+    READ_VERSION = 1
+    VIDEO_DATA = 'video_data'
+
+    @classmethod
+    def name(cls):
+        return "mobile_api:video_outline"
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collect the navigation fields of every block, and the source and
+        transcript information of each video block.
+        """
+        block_structure.request_xblock_fields('category', 'display_name', 'hide_from_toc')
+
+        for block_key in block_structure.topological_traversal():
+            if block_key.block_type != 'video':
+                continue
+
+            block = block_structure.get_xblock(block_key)
+
+            # Transcripts stored in edx-val are not collected here, since they
+            # can change without the course being published. They are merged
+            # in when the outline is served.
+            transcripts_info = block.get_transcripts_info()
+            block_structure.set_transformer_block_field(
+                block_key,
+                cls,
+                cls.VIDEO_DATA,
+                {
+                    'only_on_web': block.only_on_web,
+                    'edx_video_id': block.edx_video_id,
+                    'youtube_id_1_0': block.youtube_id_1_0,
+                    'html5_sources': block.html5_sources,
+                    'source': block.source,
+                    'transcript_language': block.transcript_language,
+                    'transcripts_info': transcripts_info,
+                    'translations': block.available_translations(transcripts_info),
+                },
+            )
+
+    def transform(self, usage_info, block_structure):
+        """
+        Mutates block_structure based on the given usage_info.
+        """
+        pass
@@ -306,6 +306,9 @@ CELERY_QUEUES.update(
 if ENV_TOKENS.get('COMPREHENSIVE_THEME_DIR', None):
     COMPREHENSIVE_THEME_DIR = ENV_TOKENS.get('COMPREHENSIVE_THEME_DIR')
 
+MAKO_MODULE_DIR = ENV_TOKENS.get('MAKO_MODULE_DIR', MAKO_MODULE_DIR)
+MAKO_PRELOAD_TEMPLATES = ENV_TOKENS.get('MAKO_PRELOAD_TEMPLATES', MAKO_PRELOAD_TEMPLATES)
+
 COMPREHENSIVE_THEME_DIRS = ENV_TOKENS.get('COMPREHENSIVE_THEME_DIRS', COMPREHENSIVE_THEME_DIRS) or []
 
 # COMPREHENSIVE_THEME_LOCALE_PATHS contain the paths to themes locale directories e.g.
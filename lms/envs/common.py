@@ -540,6 +540,9 @@ OAUTH2_PROVIDER_APPLICATION_MODEL = 'oauth2_provider.Application'
 # Mako templating
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_lms')
+# Load the templates precompiled into MAKO_MODULE_DIR by the compile_mako_templates
+# management command at startup, instead of on first use in each process.
+MAKO_PRELOAD_TEMPLATES = False
 MAKO_TEMPLATE_DIRS_BASE = [
     PROJECT_ROOT / 'templates',
     COMMON_ROOT / 'templates',
@@ -1965,6 +1968,14 @@ BLOCK_STRUCTURES_SETTINGS = dict(
     # Maximum number of retries per task.
     TASK_MAX_RETRIES=5,
 
+    # Maximum number of threads collecting the data of independent
+    # transformers concurrently when a block structure is collected.
+    # With 1, the transformers are collected one after the other.
+    # Values greater than 1 are experimental: the registered transformers
+    # and the modulestore they read xblocks from are not known to be
+    # thread-safe, so leave this at 1 in production.
+    COLLECT_MAX_WORKERS=1,
+
     # Backend storage
     # STORAGE_CLASS='storages.backends.s3boto.S3BotoStorage',
     # STORAGE_KWARGS=dict(bucket='nim-beryl-test'),
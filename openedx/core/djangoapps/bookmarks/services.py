@@ -3,6 +3,7 @@ Bookmarks service.
 """
 import logging
 
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 
 from request_cache.middleware import RequestCache
@@ -14,6 +15,11 @@ from . import DEFAULT_FIELDS, api
 log = logging.getLogger(__name__)
 
 CACHE_KEY_TEMPLATE = u"bookmarks.list.{}.{}"
+BOOKMARKED_CACHE_KEY_TEMPLATE = u"bookmarks.usage_ids.{}.{}"
+# The cache is invalidated before the change of a bookmark is committed, so a
+# concurrent request may cache the usage ids from before the change. The
+# timeout bounds how long they may then be stale.
+BOOKMARKED_CACHE_TIMEOUT = 60 * 5  # 5 minutes
 
 
 class BookmarksService(object):
@@ -26,6 +32,11 @@ class BookmarksService(object):
     get bookmark status during a request (for, example when
     rendering courseware and getting bookmarks status for search
     results) will not cause repeated queries to the database.
+
+    The usage ids of the blocks bookmarked by the user in a course, which
+    is_bookmarked() and are_bookmarked() check, are also kept in the django
+    cache across requests, for a few minutes. They are invalidated when a
+    bookmark is saved or deleted.
     """
 
     def __init__(self, user, **kwargs):
@@ -55,6 +66,58 @@ class BookmarksService(object):
 
         return bookmarks_cache
 
+    def _bookmarked_usage_ids(self, course_key):
+        """
+        Return the set of usage ids of the blocks bookmarked by the user in
+        a particular course, fetching it if it is not cached.
+
+        Arguments:
+            course_key (CourseKey): course_key of the course whose bookmarked blocks should be returned.
+        """
+        course_key = modulestore().fill_in_run(course_key)
+        if course_key.run is None or not self._user.is_authenticated():
+            return frozenset()
+        cache_key = BOOKMARKED_CACHE_KEY_TEMPLATE.format(self._user.id, course_key)
+
+        request_cache = RequestCache.get_request_cache().data
+        usage_ids = request_cache.get(cache_key)
+        if usage_ids is None:
+            usage_ids = cache.get(cache_key)
+            if usage_ids is None:
+                bookmarks_queryset = api.get_bookmarks(self._user, course_key=course_key, serialized=False)
+                usage_ids = frozenset(
+                    unicode(usage_key) for usage_key in bookmarks_queryset.values_list('usage_key', flat=True)
+                )
+                cache.set(cache_key, usage_ids, BOOKMARKED_CACHE_TIMEOUT)
+            request_cache[cache_key] = usage_ids
+
+        return usage_ids
+
+    def _update_bookmarked_usage_ids(self, course_key, usage_id, bookmarked):
+        """
+        Apply a change of the bookmarked status of a block to the usage ids
+        of the blocks bookmarked by the user, if they were fetched during the
+        request, and invalidate the ones cached across requests, which other
+        requests may have changed since they were fetched.
+
+        Arguments:
+            course_key (CourseKey): course_key of the course of the block.
+            usage_id (unicode): usage id of the block.
+            bookmarked (Bool): whether the block is now bookmarked.
+        """
+        course_key = modulestore().fill_in_run(course_key)
+        cache_key = BOOKMARKED_CACHE_KEY_TEMPLATE.format(self._user.id, course_key)
+
+        request_cache = RequestCache.get_request_cache().data
+        usage_ids = request_cache.get(cache_key)
+        if usage_ids is not None:
+            if bookmarked:
+                usage_ids = usage_ids | {usage_id}
+            else:
+                usage_ids = usage_ids - {usage_id}
+            request_cache[cache_key] = usage_ids
+        cache.delete(cache_key)
+
     def bookmarks(self, course_key):
         """
         Return a list of bookmarks for the course for the current user.
@@ -77,13 +140,27 @@ class BookmarksService(object):
         Returns:
             Bool
         """
-        usage_id = unicode(usage_key)
-        bookmarks_cache = self._bookmarks_cache(usage_key.course_key, fetch=True)
-        for bookmark in bookmarks_cache:
-            if bookmark['usage_id'] == usage_id:
-                return True
+        return unicode(usage_key) in self._bookmarked_usage_ids(usage_key.course_key)
+
+    def are_bookmarked(self, usage_keys):
+        """
+        Return whether each of the blocks has been bookmarked by the user.
+
+        Arguments:
+            usage_keys: list of UsageKeys of the blocks.
+
+        Returns:
+            dict mapping each UsageKey to a Bool
+        """
+        usage_ids_by_course = {}
+        are_bookmarked = {}
+        for usage_key in usage_keys:
+            course_key = usage_key.course_key
+            if course_key not in usage_ids_by_course:
+                usage_ids_by_course[course_key] = self._bookmarked_usage_ids(course_key)
+            are_bookmarked[usage_key] = unicode(usage_key) in usage_ids_by_course[course_key]
 
-        return False
+        return are_bookmarked
 
     def set_bookmarked(self, usage_key):
         """
@@ -104,6 +181,7 @@ class BookmarksService(object):
         bookmarks_cache = self._bookmarks_cache(usage_key.course_key)
         if bookmarks_cache is not None:
             bookmarks_cache.append(bookmark)
+        self._update_bookmarked_usage_ids(usage_key.course_key, bookmark['usage_id'], bookmarked=True)
 
         return True
 
@@ -133,5 +211,6 @@ class BookmarksService(object):
                     break
             if deleted_bookmark_index is not None:
                 bookmarks_cache.pop(deleted_bookmark_index)
+        self._update_bookmarked_usage_ids(usage_key.course_key, unicode(usage_key), bookmarked=False)
 
         return True
@@ -3,10 +3,15 @@ Signals for bookmarks.
 """
 from importlib import import_module
 
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch.dispatcher import receiver
 
 from xmodule.modulestore.django import SignalHandler
 
+from .models import Bookmark
+from .services import BOOKMARKED_CACHE_KEY_TEMPLATE
+
 
 @receiver(SignalHandler.course_published)
 def trigger_update_xblocks_cache_task(sender, course_key, **kwargs):  # pylint: disable=invalid-name,unused-argument
@@ -18,3 +23,14 @@ def trigger_update_xblocks_cache_task(sender, course_key, **kwargs):  # pylint:
     # Note: The countdown=0 kwarg is set to ensure the method below does not attempt to access the course
     # before the signal emitter has finished all operations. This is also necessary to ensure all tests pass.
     tasks.update_xblocks_cache.apply_async([unicode(course_key)], countdown=0)
+
+
+@receiver(post_save, sender=Bookmark)
+@receiver(post_delete, sender=Bookmark)
+def invalidate_bookmarked_usage_ids(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached usage ids of the blocks bookmarked by the user in
+    the course when a bookmark is created or deleted.
+    """
+    if kwargs.get('created', True):
+        cache.delete(BOOKMARKED_CACHE_KEY_TEMPLATE.format(instance.user_id, instance.course_key))
@@ -5,8 +5,10 @@ Tests for bookmark services.
 import pytest
 from nose.plugins.attrib import attr
 from opaque_keys.edx.keys import UsageKey
+from request_cache.middleware import RequestCache
 
 from openedx.core.djangolib.testing.utils import skip_unless_lms
+from .. import api
 from ..services import BookmarksService
 from .test_models import BookmarksTestsBase
 
@@ -60,6 +62,65 @@ class BookmarksServiceTests(BookmarksTestsBase):
         with self.assertNumQueries(1):
             self.assertFalse(bookmark_service.is_bookmarked(usage_key=self.sequential_1.location))
 
+    def test_are_bookmarked(self):
+        """
+        Verifies are_bookmarked returns a Bool for each block as expected.
+        """
+        usage_keys = [self.sequential_1.location, self.vertical_2.location, self.sequential_2.location]
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.bookmark_service.are_bookmarked(usage_keys),
+                {self.sequential_1.location: True, self.vertical_2.location: False, self.sequential_2.location: True},
+            )
+
+    def test_bookmarked_cached_across_requests(self):
+        """
+        Verifies the bookmarked blocks are cached across requests, and that
+        the cache is kept up to date when bookmarks change.
+        """
+        self.assertTrue(self.bookmark_service.is_bookmarked(usage_key=self.sequential_1.location))
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(0):
+            self.assertTrue(BookmarksService(self.user).is_bookmarked(usage_key=self.sequential_1.location))
+
+        # Changes made with the service invalidate the cache.
+        BookmarksService(self.user).set_bookmarked(usage_key=self.chapter_1.location)
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(1):
+            self.assertTrue(BookmarksService(self.user).is_bookmarked(usage_key=self.chapter_1.location))
+
+        # Changes made otherwise invalidate the cache.
+        api.delete_bookmark(self.user, usage_key=self.sequential_1.location)
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(1):
+            self.assertFalse(BookmarksService(self.user).is_bookmarked(usage_key=self.sequential_1.location))
+
+    def test_bookmarked_by_concurrent_requests(self):
+        """
+        Verifies that bookmarks set by concurrent requests are all seen by
+        later requests.
+        """
+        # The first request fetches the bookmarked blocks.
+        first_service = BookmarksService(self.user)
+        self.assertFalse(first_service.is_bookmarked(usage_key=self.chapter_1.location))
+        first_request_cache = dict(RequestCache.get_request_cache().data)
+
+        # The second request bookmarks a block.
+        RequestCache.clear_request_cache()
+        BookmarksService(self.user).set_bookmarked(usage_key=self.chapter_1.location)
+
+        # The first request, still with the blocks it fetched, bookmarks another block.
+        RequestCache.clear_request_cache()
+        RequestCache.get_request_cache().data.update(first_request_cache)
+        first_service.set_bookmarked(usage_key=self.vertical_2.location)
+        self.assertTrue(first_service.is_bookmarked(usage_key=self.vertical_2.location))
+
+        RequestCache.clear_request_cache()
+        self.assertEqual(
+            BookmarksService(self.user).are_bookmarked([self.chapter_1.location, self.vertical_2.location]),
+            {self.chapter_1.location: True, self.vertical_2.location: True},
+        )
+
     def test_set_bookmarked(self):
         """
         Verifies set_bookmarked returns Bool as expected.
@@ -1,5 +1,39 @@
+import json
+import zlib
+
 # Template used to create cache keys for individual programs.
 PROGRAM_CACHE_KEY_TPL = 'program-{uuid}'
 
 # Cache key used to locate an item containing a list of all program UUIDs for a site.
 SITE_PROGRAM_UUIDS_CACHE_KEY_TPL = 'program-uuids-{domain}'
+
+# Cache key used to locate the version of the program data cached for a site. The
+# version changes every time cache_programs rewrites the site's programs, and is
+# used to key process-local copies of the site's programs.
+SITE_PROGRAMS_VERSION_CACHE_KEY_TPL = 'program-version-{domain}'
+
+# Maximum number of program keys requested from the cache by a single get_many.
+# Large multi-gets are split into chunks of this size and issued concurrently.
+PROGRAM_CACHE_CHUNK_SIZE = 50
+
+# Maximum number of concurrent get_many calls issued when reading programs.
+PROGRAM_CACHE_MAX_WORKERS = 4
+
+
+def compress_program(program):
+    """
+    Serialize a program dict into a compact, compressed string suitable for caching.
+    """
+    return zlib.compress(json.dumps(program, separators=(',', ':')))
+
+
+def decompress_program(cached_value):
+    """
+    Inverse of compress_program.
+
+    Program dicts cached before compression was introduced are returned unchanged.
+    """
+    if cached_value is None or isinstance(cached_value, dict):
+        return cached_value
+
+    return json.loads(zlib.decompress(cached_value))
@@ -1,5 +1,6 @@
 import logging
 import sys
+from uuid import uuid4
 
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
@@ -8,7 +9,9 @@ from django.core.management import BaseCommand
 
 from openedx.core.djangoapps.catalog.cache import (
     PROGRAM_CACHE_KEY_TPL,
-    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
+    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL,
+    SITE_PROGRAMS_VERSION_CACHE_KEY_TPL,
+    compress_program
 )
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
 from openedx.core.djangoapps.catalog.utils import create_catalog_api_client
@@ -21,7 +24,9 @@ class Command(BaseCommand):
     """Management command used to cache program data.
 
     This command requests every available program from the discovery
-    service, writing each to its own cache entry with an indefinite expiration.
+    service, writing each to its own compressed cache entry with an indefinite
+    expiration. Once all programs are cached, a new program version is written
+    for every site, which invalidates process-local copies of the site's programs.
     It is meant to be run on a scheduled basis and should be the only code
     updating these cache entries.
     """
@@ -43,7 +48,9 @@ class Command(BaseCommand):
             raise
 
         programs = {}
+        domains = []
         for site in Site.objects.all():
+            domains.append(site.domain)
             site_config = getattr(site, 'configuration', None)
             if site_config is None or not site_config.get_value('COURSE_CATALOG_API_URL'):
                 logger.info('Skipping site {domain}. No configuration.'.format(domain=site.domain))
@@ -69,6 +76,12 @@ class Command(BaseCommand):
         logger.info('Caching details for {successful} programs.'.format(successful=successful))
         cache.set_many(programs, None)
 
+        version = uuid4().hex
+        cache.set_many(
+            {SITE_PROGRAMS_VERSION_CACHE_KEY_TPL.format(domain=domain): version for domain in domains},
+            None
+        )
+
         if failure:
             # This will fail a Jenkins job running this command, letting site
             # operators know that there was a problem.
@@ -104,7 +117,7 @@ class Command(BaseCommand):
                 cache_key = PROGRAM_CACHE_KEY_TPL.format(uuid=uuid)
                 logger.info('Requesting details for program {uuid}.'.format(uuid=uuid))
                 program = client.programs(uuid).get(exclude_utm=1)
-                programs[cache_key] = program
+                programs[cache_key] = compress_program(program)
             except:  # pylint: disable=bare-except
                 logger.exception('Failed to retrieve details for program {uuid}.'.format(uuid=uuid))
                 failure = True
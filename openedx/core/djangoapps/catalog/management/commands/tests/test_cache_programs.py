@@ -6,7 +6,9 @@ from django.core.management import call_command
 
 from openedx.core.djangoapps.catalog.cache import (
     PROGRAM_CACHE_KEY_TPL,
-    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
+    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL,
+    SITE_PROGRAMS_VERSION_CACHE_KEY_TPL,
+    decompress_program
 )
 from openedx.core.djangoapps.catalog.tests.factories import ProgramFactory
 from openedx.core.djangoapps.catalog.tests.mixins import CatalogIntegrationMixin
@@ -113,7 +115,30 @@ class TestCachePrograms(CatalogIntegrationMixin, CacheIsolationTestCase, SiteMix
         # of the cache above, so all we need to do here is verify the accuracy of
         # the data itself.
         for key, program in cached_programs.items():
-            self.assertEqual(program, programs[key])
+            self.assertEqual(decompress_program(program), programs[key])
+
+        # A program version should be cached for the site.
+        self.assertIsNotNone(cache.get(SITE_PROGRAMS_VERSION_CACHE_KEY_TPL.format(domain=self.site_domain)))
+
+    def test_handle_changes_version(self):
+        """
+        Verify that every run of the command caches a new program version for each site.
+        """
+        UserFactory(username=self.catalog_integration.service_username)
+        self.mock_list()
+        for program in self.programs:
+            self.mock_detail(program['uuid'], program)
+
+        version_key = SITE_PROGRAMS_VERSION_CACHE_KEY_TPL.format(domain=self.site_domain)
+
+        call_command('cache_programs')
+        first_version = cache.get(version_key)
+
+        call_command('cache_programs')
+        second_version = cache.get(version_key)
+
+        self.assertIsNotNone(first_version)
+        self.assertNotEqual(first_version, second_version)
 
     def test_handle_missing_service_user(self):
         """
@@ -181,4 +206,4 @@ class TestCachePrograms(CatalogIntegrationMixin, CacheIsolationTestCase, SiteMix
         )
 
         for key, program in cached_programs.items():
-            self.assertEqual(program, partial_programs[key])
+            self.assertEqual(decompress_program(program), partial_programs[key])
@@ -9,10 +9,16 @@ from django.core.cache import cache
 from django.test import TestCase, override_settings
 from student.tests.factories import UserFactory
 
-from openedx.core.djangoapps.catalog.cache import PROGRAM_CACHE_KEY_TPL, SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
+from openedx.core.djangoapps.catalog.cache import (
+    PROGRAM_CACHE_KEY_TPL,
+    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL,
+    SITE_PROGRAMS_VERSION_CACHE_KEY_TPL,
+    compress_program
+)
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
 from openedx.core.djangoapps.catalog.tests.factories import CourseFactory, CourseRunFactory, ProgramFactory, ProgramTypeFactory
 from openedx.core.djangoapps.catalog.tests.mixins import CatalogIntegrationMixin
+from openedx.core.djangoapps.catalog import utils as catalog_utils
 from openedx.core.djangoapps.catalog.utils import (
     get_course_runs,
     get_course_runs_for_course,
@@ -39,6 +45,9 @@ class TestGetPrograms(CacheIsolationTestCase):
         super(TestGetPrograms, self).setUp()
         self.site = SiteFactory()
 
+        catalog_utils._LOCAL_SITE_PROGRAMS.clear()  # pylint: disable=protected-access
+        self.addCleanup(catalog_utils._LOCAL_SITE_PROGRAMS.clear)  # pylint: disable=protected-access
+
     def test_get_many(self, mock_warning, mock_info):
         programs = ProgramFactory.create_batch(3)
 
@@ -120,7 +129,12 @@ class TestGetPrograms(CacheIsolationTestCase):
             else:
                 return partial_programs
 
-        mock_cache.get.return_value = [program['uuid'] for program in programs]
+        uuids_key = SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=self.site.domain)
+
+        def fake_get(key, default=None):
+            return [program['uuid'] for program in programs] if key == uuids_key else default
+
+        mock_cache.get.side_effect = fake_get
         mock_cache.get_many.side_effect = fake_get_many
 
         actual_programs = get_programs(self.site)
@@ -139,6 +153,95 @@ class TestGetPrograms(CacheIsolationTestCase):
             key = PROGRAM_CACHE_KEY_TPL.format(uuid=program['uuid'])
             self.assertEqual(program, all_programs[key])
 
+    def test_get_many_compressed(self, mock_warning, _mock_info):
+        programs = ProgramFactory.create_batch(3)
+
+        cache.set_many(
+            {PROGRAM_CACHE_KEY_TPL.format(uuid=program['uuid']): compress_program(program) for program in programs},
+            None
+        )
+        cache.set(
+            SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=self.site.domain),
+            [program['uuid'] for program in programs],
+            None
+        )
+
+        actual_programs = get_programs(self.site)
+
+        self.assertEqual(
+            sorted(actual_programs, key=lambda program: program['uuid']),
+            sorted(programs, key=lambda program: program['uuid'])
+        )
+        self.assertEqual(get_programs(self.site, uuid=programs[0]['uuid']), programs[0])
+        self.assertFalse(mock_warning.called)
+
+    @mock.patch(UTILS_MODULE + '.PROGRAM_CACHE_CHUNK_SIZE', 2)
+    def test_get_many_chunked(self, mock_warning, _mock_info):
+        programs = ProgramFactory.create_batch(5)
+
+        cache.set_many(
+            {PROGRAM_CACHE_KEY_TPL.format(uuid=program['uuid']): compress_program(program) for program in programs},
+            None
+        )
+        cache.set(
+            SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=self.site.domain),
+            [program['uuid'] for program in programs],
+            None
+        )
+
+        with mock.patch(UTILS_MODULE + '.cache', wraps=cache) as mock_cache:
+            actual_programs = get_programs(self.site)
+
+        # 5 programs should be read in chunks of at most 2 keys.
+        self.assertEqual(mock_cache.get_many.call_count, 3)
+        self.assertTrue(all(len(call[0][0]) <= 2 for call in mock_cache.get_many.call_args_list))
+        self.assertEqual(
+            set(program['uuid'] for program in actual_programs),
+            set(program['uuid'] for program in programs)
+        )
+        self.assertFalse(mock_warning.called)
+
+    def test_get_many_process_local_copy(self, _mock_warning, _mock_info):
+        programs = ProgramFactory.create_batch(2)
+        version_key = SITE_PROGRAMS_VERSION_CACHE_KEY_TPL.format(domain=self.site.domain)
+
+        cache.set_many(
+            {PROGRAM_CACHE_KEY_TPL.format(uuid=program['uuid']): compress_program(program) for program in programs},
+            None
+        )
+        cache.set(
+            SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=self.site.domain),
+            [program['uuid'] for program in programs],
+            None
+        )
+        cache.set(version_key, 'first', None)
+
+        self.assertEqual(len(get_programs(self.site)), 2)
+
+        # Programs are served from the process-local copy while the version is unchanged.
+        with mock.patch.object(cache, 'get_many') as mock_get_many:
+            actual_programs = get_programs(self.site)
+            self.assertFalse(mock_get_many.called)
+
+        self.assertEqual(len(actual_programs), 2)
+
+        # Program dicts are shared with the process-local copy, but the list isn't.
+        actual_programs.pop()
+        local_programs = get_programs(self.site)
+        self.assertEqual(len(local_programs), 2)
+        self.assertIs(local_programs[0], actual_programs[0])
+
+        # A new version causes programs to be read from the cache again.
+        cache.set(
+            SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=self.site.domain),
+            [programs[0]['uuid']],
+            None
+        )
+        cache.set(version_key, 'second', None)
+
+        actual_programs = get_programs(self.site)
+        self.assertEqual([program['uuid'] for program in actual_programs], [programs[0]['uuid']])
+
     def test_get_one(self, mock_warning, _mock_info):
         expected_program = ProgramFactory()
         expected_uuid = expected_program['uuid']
@@ -3,6 +3,7 @@ import copy
 import datetime
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
 from dateutil.parser import parse as datetime_parse
 from django.conf import settings
 from django.core.cache import cache
@@ -10,8 +11,12 @@ from django.core.exceptions import ObjectDoesNotExist
 from edx_rest_api_client.client import EdxRestApiClient
 
 from openedx.core.djangoapps.catalog.cache import (
+    PROGRAM_CACHE_CHUNK_SIZE,
     PROGRAM_CACHE_KEY_TPL,
-    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
+    PROGRAM_CACHE_MAX_WORKERS,
+    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL,
+    SITE_PROGRAMS_VERSION_CACHE_KEY_TPL,
+    decompress_program
 )
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
 from openedx.core.lib.edx_api_utils import get_edx_api_data
@@ -20,6 +25,14 @@ from pytz import UTC
 
 logger = logging.getLogger(__name__)
 
+# Process-local copies of each site's programs, keyed by site domain. Each entry
+# is a (version, programs) tuple, where version is the site's program version
+# as written to the cache by cache_programs.
+_LOCAL_SITE_PROGRAMS = {}
+
+# Thread pool used to issue chunked cache reads, created on first use.
+_CACHE_EXECUTOR = None
+
 
 def create_catalog_api_client(user, site=None):
     """Returns an API client which can be used to make Catalog API requests."""
@@ -35,11 +48,71 @@ def create_catalog_api_client(user, site=None):
     return EdxRestApiClient(url, jwt=jwt)
 
 
+def _get_cache_executor():
+    """
+    Return the process-wide thread pool used to issue chunked cache reads.
+
+    The pool is long-lived so that its threads, and the cache connections they
+    open, are reused across requests.
+    """
+    global _CACHE_EXECUTOR  # pylint: disable=global-statement
+    if _CACHE_EXECUTOR is None:
+        _CACHE_EXECUTOR = ThreadPoolExecutor(max_workers=PROGRAM_CACHE_MAX_WORKERS)
+    return _CACHE_EXECUTOR
+
+
+def _get_many(keys):
+    # Runs in a thread of the executor. The cache proxy resolves that thread's
+    # own client, since Django cache clients are per-thread.
+    return cache.get_many(keys)
+
+
+def _get_many_chunked(keys):
+    """
+    Read the given keys from the cache, splitting them into bounded chunks.
+
+    Large multi-gets are prone to partial failures when they span many Memcached
+    nodes. Chunks are issued concurrently so that splitting them up doesn't cost
+    additional round trip latency.
+
+    Arguments:
+        keys (list): cache keys to read.
+
+    Returns:
+        dict, mapping the cache keys that were hit to their cached values.
+    """
+    chunks = [keys[i:i + PROGRAM_CACHE_CHUNK_SIZE] for i in range(0, len(keys), PROGRAM_CACHE_CHUNK_SIZE)]
+    if len(chunks) <= 1:
+        return cache.get_many(keys) if keys else {}
+
+    found = {}
+    for chunk_results in _get_cache_executor().map(_get_many, chunks):
+        found.update(chunk_results)
+
+    return found
+
+
+def _get_program_details(uuids):
+    """
+    Read and decompress the cached details of the given programs.
+
+    Returns:
+        list of dict, representing the programs which were found in the cache.
+    """
+    cached = _get_many_chunked([PROGRAM_CACHE_KEY_TPL.format(uuid=uuid) for uuid in uuids])
+    return [decompress_program(value) for value in cached.values()]
+
+
 def get_programs(site, uuid=None):
     """Read programs from the cache.
 
     The cache is populated by a management command, cache_programs.
 
+    When the cache holds a version for the site's programs, a process-local copy of
+    the site's programs is kept and reused until cache_programs writes a new version.
+    The program dicts returned are shared with that copy, so callers must copy them
+    before mutating them.
+
     Arguments:
         site (Site): django.contrib.sites.models object
 
@@ -53,17 +126,22 @@ def get_programs(site, uuid=None):
     missing_details_msg_tpl = 'Failed to get details for program {uuid} from the cache.'
 
     if uuid:
-        program = cache.get(PROGRAM_CACHE_KEY_TPL.format(uuid=uuid))
+        program = decompress_program(cache.get(PROGRAM_CACHE_KEY_TPL.format(uuid=uuid)))
         if not program:
             logger.warning(missing_details_msg_tpl.format(uuid=uuid))
 
         return program
+
+    version = get_programs_version(site)
+    local_version, local_programs = _LOCAL_SITE_PROGRAMS.get(site.domain, (None, None))
+    if version is not None and version == local_version:
+        return list(local_programs)
+
     uuids = cache.get(SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=site.domain), [])
     if not uuids:
         logger.warning('Failed to get program UUIDs from the cache.')
 
-    programs = cache.get_many([PROGRAM_CACHE_KEY_TPL.format(uuid=uuid) for uuid in uuids])
-    programs = list(programs.values())
+    programs = _get_program_details(uuids)
 
     # The get_many above sometimes fails to bring back details cached on one or
     # more Memcached nodes. It doesn't look like these keys are being evicted.
@@ -71,22 +149,42 @@ def get_programs(site, uuid=None):
     # on one or more nodes are missing from the result of the get_many. One
     # get_many may fail to bring these keys back, but a get_many occurring
     # immediately afterwards will succeed in bringing back all the keys. This
-    # behavior can be mitigated by trying again for the missing keys, which is
-    # what we do here. Splitting the get_many into smaller chunks may also help.
+    # behavior is mitigated by splitting the get_many into smaller chunks and
+    # trying again for the missing keys, which is what we do here.
     missing_uuids = set(uuids) - set(program['uuid'] for program in programs)
     if missing_uuids:
         logger.info(
             'Failed to get details for {count} programs. Retrying.'.format(count=len(missing_uuids))
         )
 
-        retried_programs = cache.get_many([PROGRAM_CACHE_KEY_TPL.format(uuid=uuid) for uuid in missing_uuids])
-        programs += list(retried_programs.values())
+        programs += _get_program_details(list(missing_uuids))
 
         still_missing_uuids = set(uuids) - set(program['uuid'] for program in programs)
         for uuid in still_missing_uuids:
             logger.warning(missing_details_msg_tpl.format(uuid=uuid))
 
-    return programs
+        if still_missing_uuids:
+            # Don't hold on to an incomplete copy of the site's programs.
+            return programs
+
+    if version is not None:
+        _LOCAL_SITE_PROGRAMS[site.domain] = (version, programs)
+
+    return list(programs)
+
+
+def get_programs_version(site):
+    """Read the version of the site's programs from the cache.
+
+    The version changes every time cache_programs rewrites the site's programs.
+
+    Arguments:
+        site (Site): django.contrib.sites.models object
+
+    Returns:
+        str, or None if no version has been cached for the site.
+    """
+    return cache.get(SITE_PROGRAMS_VERSION_CACHE_KEY_TPL.format(domain=site.domain))
 
 
 def get_program_types(name=None):
@@ -13,6 +13,7 @@ class CommonInitializationConfig(AppConfig):
         # Common settings validations for the LMS and CMS.
         from . import checks
         self._add_mimetypes()
+        self._patch_config_models()
 
     def _add_mimetypes(self):
         """
@@ -24,3 +25,12 @@ class CommonInitializationConfig(AppConfig):
         mimetypes.add_type('application/x-font-opentype', '.otf')
         mimetypes.add_type('application/x-font-ttf', '.ttf')
         mimetypes.add_type('application/font-woff', '.woff')
+
+    def _patch_config_models(self):
+        """
+        Serve the current configuration of ConfigurationModels from a
+        process-wide cache.
+        """
+        from openedx.core.djangoapps.monkey_patch import config_models_models
+
+        config_models_models.patch()
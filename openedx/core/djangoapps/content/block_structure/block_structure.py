@@ -7,8 +7,9 @@ Module with family of classes for block structures.
 The following internal data structures are implemented:
     _BlockRelations - Data structure for a single block's relations.
     _BlockData - Data structure for a single block's data.
+    PackedBlockRelations - Compact serializable form of all relations.
 """
-from copy import deepcopy
+from array import array
 from functools import partial
 from logging import getLogger
 
@@ -23,12 +24,19 @@ logger = getLogger(__name__)  # pylint: disable=invalid-name
 # A dictionary key value for storing a transformer's version number.
 TRANSFORMER_VERSION_KEY = '_version'
 
+# Names of the xBlock fields that are collected for every block, so
+# that the blocks that changed since the structure was last collected
+# can be found.
+EDIT_INFO_XBLOCK_FIELDS = ('edited_on', 'subtree_edited_on')
+
 
 class _BlockRelations(object):
     """
     Data structure to encapsulate relationships for a single block,
     including its children and parents.
     """
+    __slots__ = ('parents', 'children')
+
     def __init__(self):
 
         # List of usage keys of this block's parents.
@@ -39,6 +47,85 @@ class _BlockRelations(object):
         # list [UsageKey]
         self.children = []
 
+    def copy(self):
+        """
+        Returns a new instance of _BlockRelations with copies of this
+        instance's lists.
+        """
+        block_relations = _BlockRelations()
+        block_relations.parents = list(self.parents)
+        block_relations.children = list(self.children)
+        return block_relations
+
+    def __getstate__(self):
+        return {'parents': self.parents, 'children': self.children}
+
+    def __setstate__(self, state):
+        # The state is also the instance dictionary of the relations
+        # pickled before they had slots.
+        self.parents = state['parents']
+        self.children = state['children']
+
+
+class PackedBlockRelations(object):
+    """
+    Compact representation of a map of usage keys to block relations,
+    used to serialize it.
+
+    The usage keys of the blocks are stored once, in a table, and the
+    parents and children of the blocks are stored as indices into that
+    table in two arrays of integers. The relations of the block at
+    index i of the table are at indices offsets[i] to offsets[i + 1] of
+    these arrays.
+    """
+    def __init__(self, block_relations):
+        """
+        Arguments:
+            block_relations (dict({UsageKey: _BlockRelations})) -
+                Internal map of a block's usage key to its
+                parents/children relations.
+        """
+        # List of usage keys of all the blocks.
+        # list [UsageKey]
+        self.block_keys = list(block_relations)
+
+        # Arrays of the indices of the parents and children of all the
+        # blocks, and arrays of the offsets of each block's parents and
+        # children in them.
+        # array [int]
+        self.parents = array('i')
+        self.parent_offsets = array('i', [0])
+        self.children = array('i')
+        self.child_offsets = array('i', [0])
+
+        indices = {block_key: index for index, block_key in enumerate(self.block_keys)}
+        for block_key in self.block_keys:
+            relations = block_relations[block_key]
+            self.parents.extend(indices[parent_key] for parent_key in relations.parents)
+            self.parent_offsets.append(len(self.parents))
+            self.children.extend(indices[child_key] for child_key in relations.children)
+            self.child_offsets.append(len(self.children))
+
+    def unpack(self):
+        """
+        Returns the map of usage keys to block relations represented by
+        this instance.
+
+        Returns:
+            dict({UsageKey: _BlockRelations})
+        """
+        block_keys = self.block_keys
+        parents, parent_offsets = self.parents, self.parent_offsets
+        children, child_offsets = self.children, self.child_offsets
+
+        block_relations = {}
+        for index, block_key in enumerate(block_keys):
+            relations = _BlockRelations()
+            relations.parents = [block_keys[i] for i in parents[parent_offsets[index]:parent_offsets[index + 1]]]
+            relations.children = [block_keys[i] for i in children[child_offsets[index]:child_offsets[index + 1]]]
+            block_relations[block_key] = relations
+        return block_relations
+
 
 class BlockStructure(object):
     """
@@ -62,6 +149,12 @@ class BlockStructure(object):
         # dict {UsageKey: _BlockRelations}
         self._block_relations = {}
 
+        # Set of usage keys of the blocks whose relations were copied
+        # since this structure started sharing its relations with a
+        # copy of it, or None if it shares none of its relations.
+        # set(UsageKey)
+        self._own_block_relations = None
+
         # Add the root block.
         self._add_block(self._block_relations, root_block_usage_key)
 
@@ -91,7 +184,8 @@ class BlockStructure(object):
         Returns:
             [UsageKey] - A list of usage keys of the block's parents.
         """
-        return self._block_relations[usage_key].parents if usage_key in self else []
+        block_relations = self._block_relations.get(usage_key)
+        return block_relations.parents if block_relations is not None else []
 
     def get_children(self, usage_key):
         """
@@ -105,7 +199,8 @@ class BlockStructure(object):
         Returns:
             [UsageKey] - A list of usage keys of the block's children.
         """
-        return self._block_relations[usage_key].children if usage_key in self else []
+        block_relations = self._block_relations.get(usage_key)
+        return block_relations.children if block_relations is not None else []
 
     def set_root_block(self, usage_key):
         """
@@ -120,7 +215,7 @@ class BlockStructure(object):
                 new root of the block structure.
         """
         self.root_block_usage_key = usage_key
-        self._block_relations[usage_key].parents = []
+        self._get_block_relations_for_update(usage_key).parents = []
 
     def __contains__(self, usage_key):
         """
@@ -205,29 +300,33 @@ class BlockStructure(object):
         """
         Mutates this block structure by removing any unreachable blocks.
         """
-
-        # Create a new block relations map to store only those blocks
-        # that are still linked
-        pruned_block_relations = {}
-        old_block_relations = self._block_relations
-
-        # Build the structure from the leaves up by doing a post-order
-        # traversal of the old structure, thereby encountering only
-        # reachable blocks.
-        for block_key in self.post_order_traversal():
-            # If the block is in the old structure,
-            if block_key in old_block_relations:
-                # Add it to the new pruned structure
-                self._add_block(pruned_block_relations, block_key)
-
-                # Add a relationship to only those old children that
-                # were also added to the new pruned structure.
-                for child in old_block_relations[block_key].children:
-                    if child in pruned_block_relations:
-                        self._add_to_relations(pruned_block_relations, block_key, child)
-
-        # Replace this structure's relations with the newly pruned one.
-        self._block_relations = pruned_block_relations
+        block_relations = self._block_relations
+
+        # Find the blocks reachable from the root with a depth-first
+        # search, which does not need the order of a traversal.
+        reachable_block_keys = set()
+        block_keys_to_visit = [self.root_block_usage_key] if self.root_block_usage_key in block_relations else []
+        while block_keys_to_visit:
+            block_key = block_keys_to_visit.pop()
+            if block_key not in reachable_block_keys:
+                reachable_block_keys.add(block_key)
+                block_keys_to_visit.extend(block_relations[block_key].children)
+
+        if len(reachable_block_keys) == len(block_relations):
+            return
+
+        for block_key in block_relations.keys():
+            if block_key not in reachable_block_keys:
+                del block_relations[block_key]
+
+        # The children of reachable blocks are reachable, but some of
+        # their parents may not be.
+        for block_key in reachable_block_keys:
+            parents = block_relations[block_key].parents
+            if not all(parent_key in reachable_block_keys for parent_key in parents):
+                self._get_block_relations_for_update(block_key).parents = [
+                    parent_key for parent_key in parents if parent_key in reachable_block_keys
+                ]
 
     def _add_relation(self, parent_key, child_key):
         """
@@ -237,28 +336,32 @@ class BlockStructure(object):
             parent_key (UsageKey) - Usage key of the parent block.
             child_key (UsageKey) - Usage key of the child block.
         """
-        self._add_to_relations(self._block_relations, parent_key, child_key)
-
-    @staticmethod
-    def _add_to_relations(block_relations, parent_key, child_key):
-        """
-        Adds a parent to child relationship in the given block
-        relations map.
-
-        Arguments:
-            block_relations (dict({UsageKey: _BlockRelations})) -
-                Internal map of a block's usage key to its
-                parents/children relations.
+        self._add_block(self._block_relations, parent_key)
+        self._add_block(self._block_relations, child_key)
 
-            parent_key (UsageKey) - Usage key of the parent block.
+        self._get_block_relations_for_update(child_key).parents.append(parent_key)
+        self._get_block_relations_for_update(parent_key).children.append(child_key)
 
-            child_key (UsageKey) - Usage key of the child block.
+    def _share_block_relations(self):
+        """
+        Marks the relations of all the blocks in this structure as
+        shared with a copy of it, so that they are copied before they
+        are modified.
         """
-        BlockStructure._add_block(block_relations, parent_key)
-        BlockStructure._add_block(block_relations, child_key)
+        self._own_block_relations = set()
 
-        block_relations[child_key].parents.append(parent_key)
-        block_relations[parent_key].children.append(child_key)
+    def _get_block_relations_for_update(self, usage_key):
+        """
+        Returns the relations of the block identified by the given
+        usage_key, copying them first if they are shared with another
+        block structure.
+        """
+        block_relations = self._block_relations[usage_key]
+        if self._own_block_relations is not None and usage_key not in self._own_block_relations:
+            block_relations = block_relations.copy()
+            self._block_relations[usage_key] = block_relations
+            self._own_block_relations.add(usage_key)
+        return block_relations
 
     @staticmethod
     def _add_block(block_relations, usage_key):
@@ -326,7 +429,14 @@ class TransformerData(FieldData):
     """
     Data structure to encapsulate collected data for a transformer.
     """
-    pass
+    def copy(self):
+        """
+        Returns a new instance of TransformerData with a shallow copy
+        of this instance's fields.
+        """
+        transformer_data = TransformerData()
+        transformer_data.fields = dict(self.fields)
+        return transformer_data
 
 
 class TransformerDataMap(dict):
@@ -391,6 +501,17 @@ class BlockData(FieldData):
         # Map of transformer name to its block-specific data.
         self.transformer_data = TransformerDataMap()
 
+    def copy(self):
+        """
+        Returns a new instance of BlockData with shallow copies of this
+        instance's fields and transformer data.
+        """
+        block_data = BlockData(self.location)
+        block_data.fields = dict(self.fields)
+        for transformer_name, transformer_data in self.transformer_data.iteritems():
+            block_data.transformer_data[transformer_name] = transformer_data.copy()
+        return block_data
+
 
 class BlockStructureBlockData(BlockStructure):
     """
@@ -401,7 +522,7 @@ class BlockStructureBlockData(BlockStructure):
     # update this value whenever the data structure changes. Dependent storage
     # layers can then use this value when serializing/deserializing block
     # structures, and invalidating any previously cached/stored data.
-    VERSION = 2
+    VERSION = 3
 
     def __init__(self, root_block_usage_key):
         super(BlockStructureBlockData, self).__init__(root_block_usage_key)
@@ -414,18 +535,36 @@ class BlockStructureBlockData(BlockStructure):
         # Map of a transformer's name to its non-block-specific data.
         self.transformer_data = TransformerDataMap()
 
+        # Sets of usage keys of the blocks, and of names of the
+        # transformers, whose data was copied since this structure
+        # started sharing its data with a copy of it, or None if it
+        # shares none of its data.
+        # set(UsageKey), set(string)
+        self._own_block_data = None
+        self._own_transformer_data = None
+
     def copy(self):
         """
-        Returns a new instance of BlockStructureBlockData with a
-        deep-copy of this instance's contents.
+        Returns a new instance of BlockStructureBlockData with this
+        instance's contents.
+
+        The relations and data of the blocks, and the transformers'
+        data, are shared by both instances, and copied by either of
+        them when it first modifies them. So copying a collected
+        structure only costs copying its maps, and transforming the
+        copy only costs copying the data it modifies.
         """
         from .factory import BlockStructureFactory
-        return BlockStructureFactory.create_new(
+        block_structure = BlockStructureFactory.create_new(
             self.root_block_usage_key,
-            deepcopy(self._block_relations),
-            deepcopy(self.transformer_data),
-            deepcopy(self._block_data_map),
+            dict(self._block_relations),
+            TransformerDataMap(self.transformer_data),
+            dict(self._block_data_map),
         )
+        for structure in (self, block_structure):
+            structure._share_block_relations()  # pylint: disable=protected-access
+            structure._share_block_data()  # pylint: disable=protected-access
+        return block_structure
 
     def iteritems(self):
         """
@@ -497,7 +636,7 @@ class BlockStructureBlockData(BlockStructure):
             value (any picklable type) - The value to associate with the
                 given key for the given transformer's data.
         """
-        setattr(self.transformer_data.get_or_create(transformer), key, value)
+        setattr(self._get_or_create_transformer_data_for_update(transformer), key, value)
 
     def get_transformer_block_data(self, usage_key, transformer):
         """
@@ -576,8 +715,10 @@ class BlockStructureBlockData(BlockStructure):
             transformer (BlockStructureTransformer) - The transformer
                 whose data entry is to be deleted.
         """
+        if usage_key not in self._block_data_map:
+            return
         try:
-            transformer_block_data = self.get_transformer_block_data(usage_key, transformer)
+            transformer_block_data = self._get_or_create_block(usage_key).transformer_data[transformer]
             delattr(transformer_block_data, key)
         except (AttributeError, KeyError):
             pass
@@ -607,11 +748,11 @@ class BlockStructureBlockData(BlockStructure):
 
         # Remove block from its children.
         for child in children:
-            self._block_relations[child].parents.remove(usage_key)
+            self._get_block_relations_for_update(child).parents.remove(usage_key)
 
         # Remove block from its parents.
         for parent in parents:
-            self._block_relations[parent].children.remove(usage_key)
+            self._get_block_relations_for_update(parent).children.remove(usage_key)
 
         # Remove block.
         self._block_relations.pop(usage_key, None)
@@ -734,18 +875,48 @@ class BlockStructureBlockData(BlockStructure):
             raise TransformerException('Version attributes are not set on transformer {0}.', transformer.name())
         self.set_transformer_data(transformer, TRANSFORMER_VERSION_KEY, transformer.WRITE_VERSION)
 
+    def _share_block_data(self):
+        """
+        Marks the data of all the blocks and transformers in this
+        structure as shared with a copy of it, so that they are copied
+        before they are modified.
+        """
+        self._own_block_data = set()
+        self._own_transformer_data = set()
+
     def _get_or_create_block(self, usage_key):
         """
-        Returns the BlockData associated with the given usage_key.
+        Returns the BlockData associated with the given usage_key,
+        copying it first if it is shared with another block structure.
         If not found, creates and returns a new BlockData and
         maps it to the given key.
         """
-        try:
-            return self._block_data_map[usage_key]
-        except KeyError:
+        block_data = self._block_data_map.get(usage_key)
+        if block_data is None:
             block_data = BlockData(usage_key)
-            self._block_data_map[usage_key] = block_data
+        elif self._own_block_data is None or usage_key in self._own_block_data:
             return block_data
+        else:
+            block_data = block_data.copy()
+
+        self._block_data_map[usage_key] = block_data
+        if self._own_block_data is not None:
+            self._own_block_data.add(usage_key)
+        return block_data
+
+    def _get_or_create_transformer_data_for_update(self, transformer):
+        """
+        Returns the non-block-specific TransformerData of the given
+        transformer, copying it first if it is shared with another
+        block structure.
+        """
+        transformer_data = self.transformer_data.get_or_create(transformer)
+        transformer_name = self.transformer_data._translate_key(transformer)  # pylint: disable=protected-access
+        if self._own_transformer_data is not None and transformer_name not in self._own_transformer_data:
+            transformer_data = transformer_data.copy()
+            self.transformer_data[transformer_name] = transformer_data
+            self._own_transformer_data.add(transformer_name)
+        return transformer_data
 
 
 class BlockStructureModulestoreData(BlockStructureBlockData):
@@ -770,6 +941,17 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
         # set(string)
         self._requested_xblock_fields = set()
 
+        # The modulestore from which xBlocks that were not added are
+        # loaded when they are requested, if any.
+        # ModuleStoreRead
+        self._modulestore = None
+
+        # Set of usage keys of the blocks whose data is being collected,
+        # or None if the data of all blocks is being collected. While
+        # it is set, the structure's traversals only yield these blocks.
+        # set(UsageKey)
+        self._blocks_to_collect = None
+
     def request_xblock_fields(self, *field_names):
         """
         Records request for collecting data for the given xBlock fields.
@@ -794,11 +976,75 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
             usage_key (UsageKey) - Usage key of the block whose
                 xBlock object is to be returned.
         """
-        return self._xblock_map[usage_key]
+        try:
+            return self._xblock_map[usage_key]
+        except KeyError:
+            if self._modulestore is None:
+                raise
+            xblock = self._modulestore.get_item(usage_key)
+            self._add_xblock(usage_key, xblock)
+            return xblock
+
+    def topological_traversal(
+            self,
+            filter_func=None,
+            yield_descendants_of_unyielded=False,
+            start_node=None,
+    ):
+        """
+        Performs a topological sort of the blocks whose data is being
+        collected. See BlockStructure.topological_traversal.
+        """
+        return super(BlockStructureModulestoreData, self).topological_traversal(
+            filter_func=self._get_collection_filter(filter_func),
+            yield_descendants_of_unyielded=yield_descendants_of_unyielded,
+            start_node=start_node,
+        )
+
+    def post_order_traversal(
+            self,
+            filter_func=None,
+            start_node=None,
+    ):
+        """
+        Performs a post-order sort of the blocks whose data is being
+        collected. See BlockStructure.post_order_traversal.
+        """
+        return super(BlockStructureModulestoreData, self).post_order_traversal(
+            filter_func=self._get_collection_filter(filter_func),
+            start_node=start_node,
+        )
 
     #--- Internal methods ---#
     # To be used within the block_structure framework or by tests.
 
+    def _set_blocks_to_collect(self, block_keys):
+        """
+        Restricts the structure's traversals to the blocks with the
+        given usage keys, so that transformers only collect their data.
+        Since the ancestors of every block to collect must also be
+        collected, traversals can skip over the descendants of blocks
+        that are not collected.
+
+        Arguments:
+            block_keys (set(UsageKey)) - Usage keys of the blocks to
+                collect, or None to collect all blocks.
+        """
+        self._blocks_to_collect = block_keys
+
+    def _get_collection_filter(self, filter_func):
+        """
+        Returns a filter function that combines the given filter_func
+        with the restriction to the blocks whose data is being
+        collected.
+        """
+        blocks_to_collect = self._blocks_to_collect
+        if blocks_to_collect is None:
+            return filter_func
+        if filter_func is None:
+            return blocks_to_collect.__contains__
+        return lambda block_key: block_key in blocks_to_collect and filter_func(block_key)
+
     def _add_xblock(self, usage_key, xblock):
         """
         Associates the given xBlock object with the given usage_key.
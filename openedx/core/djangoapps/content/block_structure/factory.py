@@ -57,6 +57,121 @@ class BlockStructureFactory(object):
         build_block_structure(root_xblock)
         return block_structure
 
+    @classmethod
+    def create_from_modulestore_incrementally(cls, root_block_usage_key, modulestore, previous_block_structure):
+        """
+        Creates and returns a block structure from the modulestore
+        starting at the given root_block_usage_key, reusing the data
+        collected in the given previous block structure for the blocks
+        that did not change since.
+
+        A block is changed if its edited_on field differs from the
+        previously collected one, and the subtree of a block is
+        unchanged if its subtree_edited_on field does not. Only the
+        blocks on the paths to changed blocks, and their children, are
+        loaded from the modulestore to build the structure.
+
+        The data of the changed blocks, their ancestors and their
+        descendants is to be collected again, since the data collected
+        for a block can depend on its ancestors or descendants. The
+        returned block structure's traversals are restricted to these
+        blocks, and the previously collected data of all other blocks
+        is kept.
+
+        Arguments:
+            root_block_usage_key (UsageKey) - The usage_key for the root
+                of the block structure that is to be created.
+
+            modulestore (ModuleStoreRead) - The modulestore that
+                contains the data for the xBlocks within the block
+                structure starting at root_block_usage_key.
+
+            previous_block_structure (BlockStructureBlockData) - The
+                previously collected block structure starting at
+                root_block_usage_key. Its data is moved to the created
+                block structure.
+
+        Returns:
+            BlockStructureModulestoreData - The created block structure,
+                or None if the root block itself changed, in which case
+                all the blocks are to be collected again.
+        """
+        root_xblock = modulestore.get_item(root_block_usage_key)
+        if not cls._is_unchanged(previous_block_structure, root_xblock, 'edited_on'):
+            return None
+
+        block_structure = BlockStructureModulestoreData(root_block_usage_key)
+        block_structure._modulestore = modulestore  # pylint: disable=protected-access
+        changed_block_keys = set()
+        blocks_visited = set()
+
+        def add_unchanged_subtree(block_key):
+            """
+            Recursively update the block structure with the previous
+            relations of the given block's descendants.
+            """
+            for child_key in previous_block_structure.get_children(block_key):
+                block_structure._add_relation(block_key, child_key)  # pylint: disable=protected-access
+                if child_key not in blocks_visited:
+                    blocks_visited.add(child_key)
+                    add_unchanged_subtree(child_key)
+
+        def build_block_structure(xblock):
+            """
+            Recursively update the block structure with the given xBlock
+            and its descendants, recording the changed blocks.
+            """
+            if xblock.location in blocks_visited:
+                return
+
+            blocks_visited.add(xblock.location)
+            block_structure._add_xblock(xblock.location, xblock)  # pylint: disable=protected-access
+
+            if cls._is_unchanged(previous_block_structure, xblock, 'subtree_edited_on'):
+                add_unchanged_subtree(xblock.location)
+                return
+
+            if not cls._is_unchanged(previous_block_structure, xblock, 'edited_on'):
+                changed_block_keys.add(xblock.location)
+
+            for child in xblock.get_children():
+                block_structure._add_relation(xblock.location, child.location)  # pylint: disable=protected-access
+                build_block_structure(child)
+
+        build_block_structure(root_xblock)
+
+        blocks_to_collect = set()
+        for block_key in changed_block_keys:
+            blocks_to_collect.update(block_structure.post_order_traversal(start_node=block_key))
+            ancestors = list(block_structure.get_parents(block_key))
+            while ancestors:
+                ancestor_key = ancestors.pop()
+                if ancestor_key not in blocks_to_collect:
+                    blocks_to_collect.add(ancestor_key)
+                    ancestors.extend(block_structure.get_parents(ancestor_key))
+
+        # Keep the previously collected data of the blocks that are not
+        # collected again, and load the xBlocks of those that are.
+        previous_block_data_map = previous_block_structure._block_data_map  # pylint: disable=protected-access
+        for block_key in block_structure:
+            if block_key in blocks_to_collect:
+                block_structure.get_xblock(block_key)
+            elif block_key in previous_block_data_map:
+                block_structure._block_data_map[block_key] = previous_block_data_map[block_key]  # pylint: disable=protected-access
+        block_structure.transformer_data = previous_block_structure.transformer_data
+
+        block_structure._set_blocks_to_collect(blocks_to_collect)  # pylint: disable=protected-access
+        return block_structure
+
+    @staticmethod
+    def _is_unchanged(previous_block_structure, xblock, field_name):
+        """
+        Returns whether the value of the given edit info field of the
+        given xBlock is known and was previously collected as is.
+        """
+        value = getattr(xblock, field_name, None)
+        return value is not None and value == previous_block_structure.get_xblock_field(xblock.location, field_name)
+
     @classmethod
     def create_from_store(cls, root_block_usage_key, block_structure_store):
         """
@@ -0,0 +1,117 @@
+"""
+Microbenchmark of the block relations of a synthetic course, comparing the
+serialization of the map of relations with that of its packed form, and
+timing the traversals and pruning of the structure, e.g.
+
+    ./manage.py lms benchmark_block_relations --blocks 20000
+"""
+import gc
+import timeit
+from textwrap import dedent
+
+from django.core.management.base import BaseCommand
+from opaque_keys.edx.locator import CourseLocator
+
+from openedx.core.lib.cache_utils import zpickle, zunpickle
+
+from ...block_structure import BlockStructureBlockData, PackedBlockRelations
+
+# Block types of each level of the synthetic course, below the course block.
+BLOCK_TYPES = ('chapter', 'sequential', 'vertical', 'problem')
+
+
+def _create_block_structure(num_blocks, branching):
+    """
+    Returns a block structure of about num_blocks blocks, in which each
+    non-leaf block has the given number of children.
+    """
+    course_key = CourseLocator('edX', 'Benchmark', 'Run')
+    root_key = course_key.make_usage_key('course', 'course')
+    block_structure = BlockStructureBlockData(root_key)
+    parent_keys = [root_key]
+    for depth, block_type in enumerate(BLOCK_TYPES):
+        block_keys = []
+        for parent_key in parent_keys:
+            for __ in range(branching):
+                if len(block_structure) >= num_blocks:
+                    break
+                block_key = course_key.make_usage_key(block_type, '{}_{}'.format(depth, len(block_keys)))
+                block_structure._add_relation(parent_key, block_key)  # pylint: disable=protected-access
+                block_keys.append(block_key)
+        parent_keys = block_keys
+    return block_structure
+
+
+def _count_new_objects(func):
+    """
+    Returns the number of objects tracked by the garbage collector that
+    are created by the given function and still referenced by its result.
+    """
+    gc.collect()
+    before = len(gc.get_objects())
+    result = func()  # pylint: disable=unused-variable
+    gc.collect()
+    return len(gc.get_objects()) - before
+
+
+class Command(BaseCommand):
+    help = dedent(__doc__).strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument('--blocks', type=int, default=20000, help='Number of blocks in the course.')
+        parser.add_argument('--branching', type=int, default=12, help='Number of children of each block.')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of times each operation is timed.')
+
+    def handle(self, *args, **options):
+        block_structure = _create_block_structure(options['blocks'], options['branching'])
+        block_relations = block_structure._block_relations  # pylint: disable=protected-access
+
+        def best_time(func):
+            """
+            Returns the best time, in milliseconds, of the given function.
+            """
+            return min(timeit.repeat(func, number=1, repeat=options['repeat'])) * 1000
+
+        def serialization_stats(pack, unpack):
+            """
+            Returns the size of the relations serialized in the form
+            returned by pack, the times to serialize and deserialize
+            them, and the number of objects deserialized.
+            """
+            serialized_data = zpickle(pack())
+            return (
+                len(serialized_data),
+                best_time(lambda: zpickle(pack())),
+                best_time(lambda: unpack(zunpickle(serialized_data))),
+                _count_new_objects(lambda: unpack(zunpickle(serialized_data))),
+            )
+
+        self.stdout.write(u'{} blocks'.format(len(block_structure)))
+        for label, stats in (
+                ('map of relations', serialization_stats(lambda: block_relations, lambda data: data)),
+                ('packed relations', serialization_stats(
+                    lambda: PackedBlockRelations(block_relations),
+                    lambda data: data.unpack(),
+                )),
+        ):
+            self.stdout.write(
+                u'{}: {} bytes, serialize {:.2f} ms, deserialize {:.2f} ms, {} objects deserialized'.format(
+                    label, *stats
+                )
+            )
+
+        def prune():
+            """
+            Prunes a copy of the structure, from which a chapter is removed.
+            """
+            pruned = block_structure.copy()
+            pruned.remove_block(pruned.get_children(pruned.root_block_usage_key)[0], keep_descendants=False)
+            pruned._prune_unreachable()  # pylint: disable=protected-access
+
+        self.stdout.write(
+            u'topological traversal {:.2f} ms, post-order traversal {:.2f} ms, prune {:.2f} ms'.format(
+                best_time(lambda: list(block_structure.topological_traversal())),
+                best_time(lambda: list(block_structure.post_order_traversal())),
+                best_time(prune),
+            )
+        )
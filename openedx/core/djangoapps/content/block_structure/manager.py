@@ -120,14 +120,41 @@ class BlockStructureManager(object):
         the modulestore.
         """
         with self._bulk_operations():
-            block_structure = BlockStructureFactory.create_from_modulestore(
-                self.root_block_usage_key,
-                self.modulestore,
-            )
+            block_structure = None
+            if config.waffle().is_enabled(config.INCREMENTAL_COLLECTION):
+                block_structure = self._create_incrementally()
+            if block_structure is None:
+                block_structure = BlockStructureFactory.create_from_modulestore(
+                    self.root_block_usage_key,
+                    self.modulestore,
+                )
             BlockStructureTransformers.collect(block_structure)
+            block_structure._set_blocks_to_collect(None)  # pylint: disable=protected-access
             self.store.add(block_structure)
             return block_structure
 
+    def _create_incrementally(self):
+        """
+        Returns a block structure from the modulestore that reuses the
+        data of the stored block structure for the blocks that did not
+        change since it was collected, or None if there is no
+        compatible stored block structure or its root block changed.
+        """
+        try:
+            previous_block_structure = BlockStructureFactory.create_from_store(
+                self.root_block_usage_key,
+                self.store,
+            )
+            BlockStructureTransformers.verify_versions(previous_block_structure)
+        except (BlockStructureNotFound, TransformerDataIncompatible):
+            return None
+
+        return BlockStructureFactory.create_from_modulestore_incrementally(
+            self.root_block_usage_key,
+            self.modulestore,
+            previous_block_structure,
+        )
+
     def clear(self):
         """
         Removes data for the block structure associated with the given
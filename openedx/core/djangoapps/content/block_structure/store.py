@@ -7,7 +7,7 @@ from logging import getLogger
 from openedx.core.lib.cache_utils import zpickle, zunpickle
 
 from . import config
-from .block_structure import BlockStructureBlockData
+from .block_structure import BlockStructureBlockData, PackedBlockRelations
 from .exceptions import BlockStructureNotFound
 from .factory import BlockStructureFactory
 from .models import BlockStructureModel
@@ -88,6 +88,9 @@ class BlockStructureStore(object):
             found.
         """
         bs_model = self._get_model(root_block_usage_key)
+        if not self._is_current_schema_version(bs_model):
+            logger.info("BlockStructure: Stored with a previous schema version; %s.", bs_model)
+            raise BlockStructureNotFound(root_block_usage_key)
 
         try:
             serialized_data = self._get_from_cache(bs_model)
@@ -194,7 +197,7 @@ class BlockStructureStore(object):
         Serializes the data for the given block_structure.
         """
         data_to_cache = (
-            block_structure._block_relations,
+            PackedBlockRelations(block_structure._block_relations),
             block_structure.transformer_data,
             block_structure._block_data_map,
         )
@@ -204,10 +207,10 @@ class BlockStructureStore(object):
         """
         Deserializes the given data and returns the parsed block_structure.
         """
-        block_relations, transformer_data, block_data_map = zunpickle(serialized_data)
+        packed_block_relations, transformer_data, block_data_map = zunpickle(serialized_data)
         return BlockStructureFactory.create_new(
             root_block_usage_key,
-            block_relations,
+            packed_block_relations.unpack(),
             transformer_data,
             block_data_map,
         )
@@ -227,6 +230,17 @@ class BlockStructureStore(object):
                 root_usage_key=unicode(bs_model.data_usage_key),
             )
 
+    @staticmethod
+    def _is_current_schema_version(bs_model):
+        """
+        Returns whether the given BlockStructureModel or StubModel was
+        stored with the current schema version of the BlockStructure
+        classes. The cache keys of StubModels include that version.
+        """
+        if _is_storage_backing_enabled():
+            return bs_model.block_structure_schema_version == unicode(BlockStructureBlockData.VERSION)
+        return True
+
     @staticmethod
     def _version_data_of_block(root_block):
         """
@@ -11,7 +11,7 @@ from unittest import TestCase
 
 from openedx.core.lib.graph_traversals import traverse_post_order
 
-from ..block_structure import BlockStructure, BlockStructureModulestoreData
+from ..block_structure import BlockStructure, BlockStructureModulestoreData, PackedBlockRelations
 from ..exceptions import TransformerException
 from .helpers import MockXBlock, MockTransformer, ChildrenMapTestMixin
 
@@ -44,6 +44,22 @@ class TestBlockStructure(TestCase, ChildrenMapTestMixin):
             self.assertIn(node, block_structure)
         self.assertNotIn(len(children_map) + 1, block_structure)
 
+    @ddt.data(
+        [],
+        ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP,
+        ChildrenMapTestMixin.LINEAR_CHILDREN_MAP,
+        ChildrenMapTestMixin.DAG_CHILDREN_MAP,
+    )
+    def test_packed_relations(self, children_map):
+        block_structure = self.create_block_structure(children_map, BlockStructure)
+        block_relations = block_structure._block_relations  # pylint: disable=protected-access
+
+        unpacked_block_relations = PackedBlockRelations(block_relations).unpack()
+        self.assertEquals(set(unpacked_block_relations), set(block_relations))
+        for block_key, relations in unpacked_block_relations.iteritems():
+            self.assertEquals(relations.parents, block_relations[block_key].parents)
+            self.assertEquals(relations.children, block_relations[block_key].children)
+
 
 @attr(shard=2)
 @ddt.ddt
@@ -268,3 +284,25 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
         _set_value(new_copy, 'edit2')
         self.assertEquals(_get_value(block_structure), 'edit1')
         self.assertEquals(_get_value(new_copy), 'edit2')
+
+    def test_copy_shares_unmodified_data(self):
+        block_structure = self.create_block_structure(ChildrenMapTestMixin.LINEAR_CHILDREN_MAP)
+        for block in block_structure:
+            block_structure.set_transformer_block_field(block, 'transformer', 'test_key', block)
+        block_structure.set_transformer_data('transformer', 'test_key', 'original_value')
+
+        new_copy = block_structure.copy()
+        new_copy.set_transformer_block_field(1, 'transformer', 'test_key', 'edit')
+        new_copy.set_transformer_data('transformer', 'test_key', 'edit')
+        new_copy.remove_block(3, keep_descendants=False)
+
+        # Only the modified data is copied.
+        self.assertIsNot(new_copy[1], block_structure[1])
+        self.assertIs(new_copy[0], block_structure[0])
+        self.assertIs(new_copy._block_relations[0], block_structure._block_relations[0])
+        self.assertIsNot(new_copy._block_relations[2], block_structure._block_relations[2])
+
+        self.assertEquals(block_structure.get_transformer_block_field(1, 'transformer', 'test_key'), 1)
+        self.assertEquals(block_structure.get_transformer_data('transformer', 'test_key'), 'original_value')
+        self.assertEquals(new_copy.get_transformer_data('transformer', 'test_key'), 'edit')
+        self.assert_block_structure(block_structure, [[1], [2], [3], []])
@@ -2,14 +2,17 @@
 Tests for block_structure_factory.py
 """
 from django.test import TestCase
+from datetime import datetime, timedelta
+
 from nose.plugins.attrib import attr
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
+from ..block_structure import EDIT_INFO_XBLOCK_FIELDS
 from ..store import BlockStructureStore
 from ..exceptions import BlockStructureNotFound
 from ..factory import BlockStructureFactory
 from .helpers import (
-    MockCache, MockModulestoreFactory, ChildrenMapTestMixin
+    MockCache, MockModulestoreFactory, MockTransformer, ChildrenMapTestMixin
 )
 
 
@@ -65,3 +68,63 @@ class TestBlockStructureFactory(TestCase, ChildrenMapTestMixin):
             block_structure._block_data_map,  # pylint: disable=protected-access
         )
         self.assert_block_structure(new_structure, self.children_map)
+
+    def _set_edited_on(self, block_keys, edited_on):
+        """
+        Sets the edited_on field of the given blocks and the
+        subtree_edited_on field of the given blocks and their ancestors
+        in the modulestore.
+        """
+        blocks = self.modulestore.blocks
+        for block_key in block_keys:
+            blocks[block_key].field_map['edited_on'] = edited_on
+        ancestors = set(block_keys)
+        for parent_key, children in reversed(list(enumerate(self.children_map))):
+            if ancestors.intersection(children):
+                ancestors.add(parent_key)
+        for block_key in ancestors:
+            blocks[block_key].field_map['subtree_edited_on'] = edited_on
+
+    def _create_collected_from_modulestore(self):
+        """
+        Returns a block structure created from the modulestore, with
+        the edit info fields of its blocks collected.
+        """
+        block_structure = BlockStructureFactory.create_from_modulestore(
+            root_block_usage_key=0, modulestore=self.modulestore
+        )
+        block_structure.request_xblock_fields(*EDIT_INFO_XBLOCK_FIELDS)
+        block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
+        return block_structure
+
+    def test_from_modulestore_incrementally(self):
+        published_on = datetime(2017, 1, 1)
+        self._set_edited_on(range(len(self.children_map)), published_on)
+        previous_block_structure = self._create_collected_from_modulestore()
+        previous_block_structure.set_transformer_block_field(2, MockTransformer, 'field', 'previous')
+
+        self._set_edited_on([3], published_on + timedelta(days=1))
+        block_structure = BlockStructureFactory.create_from_modulestore_incrementally(
+            root_block_usage_key=0,
+            modulestore=self.modulestore,
+            previous_block_structure=previous_block_structure,
+        )
+
+        self.assert_block_structure(block_structure, self.children_map)
+        self.assertEquals(block_structure._blocks_to_collect, {0, 1, 3})  # pylint: disable=protected-access
+        self.assertEquals(list(block_structure.topological_traversal()), [0, 1, 3])
+        self.assertEquals(block_structure.get_transformer_block_field(2, MockTransformer, 'field'), 'previous')
+
+    def test_from_modulestore_incrementally_root_changed(self):
+        published_on = datetime(2017, 1, 1)
+        self._set_edited_on(range(len(self.children_map)), published_on)
+        previous_block_structure = self._create_collected_from_modulestore()
+
+        self._set_edited_on([0], published_on + timedelta(days=1))
+        self.assertIsNone(
+            BlockStructureFactory.create_from_modulestore_incrementally(
+                root_block_usage_key=0,
+                modulestore=self.modulestore,
+                previous_block_structure=previous_block_structure,
+            )
+        )
@@ -6,9 +6,11 @@ from nose.plugins.attrib import attr
 
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
+from ..block_structure import BlockStructureBlockData
 from ..config import STORAGE_BACKING_FOR_CACHE, waffle
 from ..config.models import BlockStructureConfiguration
 from ..exceptions import BlockStructureNotFound
+from ..models import BlockStructureModel
 from ..store import BlockStructureStore
 from .helpers import ChildrenMapTestMixin, UsageKeyFactoryMixin, MockCache, MockTransformer
 
@@ -80,6 +82,25 @@ class TestBlockStructureStore(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheI
             stored_value = self.store.get(self.block_structure.root_block_usage_key)
             self.assert_block_structure(stored_value, self.children_map)
 
+    def test_uncached_previous_version_without_storage(self):
+        self.store.add(self.block_structure)
+        cache_key, serialized_data = self.mock_cache.map.popitem()
+        self.mock_cache.map[cache_key.replace(
+            'v{}.'.format(BlockStructureBlockData.VERSION),
+            'v{}.'.format(BlockStructureBlockData.VERSION - 1),
+        )] = serialized_data
+        with self.assertRaises(BlockStructureNotFound):
+            self.store.get(self.block_structure.root_block_usage_key)
+
+    def test_previous_version_with_storage(self):
+        with waffle().override(STORAGE_BACKING_FOR_CACHE, active=True):
+            self.store.add(self.block_structure)
+            BlockStructureModel.objects.filter(
+                data_usage_key=self.block_structure.root_block_usage_key,
+            ).update(block_structure_schema_version=unicode(BlockStructureBlockData.VERSION - 1))
+            with self.assertRaises(BlockStructureNotFound):
+                self.store.get(self.block_structure.root_block_usage_key)
+
     @ddt.data(1, 5, None)
     def test_cache_timeout(self, timeout):
         if timeout is not None:
@@ -1,6 +1,8 @@
 """
 Tests for transformers.py
 """
+import ddt
+from django.test import override_settings
 from mock import MagicMock, patch
 from nose.plugins.attrib import attr
 from unittest import TestCase
@@ -13,7 +15,41 @@ from .helpers import (
 )
 
 
+class CollectOrderTransformer(MockTransformer):
+    """
+    Mock transformer that records the order in which transformers are
+    collected.
+    """
+    collected = []
+
+    @classmethod
+    def collect(cls, block_structure):
+        cls.collected.append(cls.name())
+
+
+class FirstTransformer(CollectOrderTransformer):
+    """
+    Mock transformer without collect dependencies.
+    """
+    pass
+
+
+class SecondTransformer(CollectOrderTransformer):
+    """
+    Mock transformer depending on FirstTransformer.
+    """
+    COLLECT_DEPENDENCIES = (FirstTransformer,)
+
+
+class ThirdTransformer(CollectOrderTransformer):
+    """
+    Mock transformer depending on SecondTransformer.
+    """
+    COLLECT_DEPENDENCIES = (SecondTransformer,)
+
+
 @attr(shard=2)
+@ddt.ddt
 class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
     """
     Test class for testing BlockStructureTransformers
@@ -82,3 +118,29 @@ class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
                 self.transformers.verify_versions(block_structure)
             self.transformers.collect(block_structure)
             self.assertTrue(self.transformers.verify_versions(block_structure))
+
+    @ddt.data(1, 3)
+    def test_collect_dependencies(self, max_workers):
+        CollectOrderTransformer.collected = []
+        block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP, BlockStructureModulestoreData)
+        with override_settings(BLOCK_STRUCTURES_SETTINGS={'COLLECT_MAX_WORKERS': max_workers}):
+            with mock_registered_transformers([ThirdTransformer, SecondTransformer, FirstTransformer]):
+                self.transformers.collect(block_structure)
+        self.assertEquals(
+            CollectOrderTransformer.collected,
+            [FirstTransformer.name(), SecondTransformer.name(), ThirdTransformer.name()],
+        )
+        self.assertTrue(self.transformers.verify_versions(block_structure))
+
+    def test_collect_circular_dependencies(self):
+        class CircularTransformer(CollectOrderTransformer):
+            """
+            Mock transformer depending on ThirdTransformer.
+            """
+            COLLECT_DEPENDENCIES = (ThirdTransformer,)
+
+        transformers = [CircularTransformer, FirstTransformer, SecondTransformer, ThirdTransformer]
+        with patch.object(FirstTransformer, 'COLLECT_DEPENDENCIES', (CircularTransformer,)):
+            with mock_registered_transformers(transformers):
+                with self.assertRaises(TransformerException):
+                    self.transformers.collect(MagicMock())
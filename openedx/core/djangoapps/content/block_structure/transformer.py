@@ -55,6 +55,13 @@ class BlockStructureTransformer(object):
     WRITE_VERSION = 0
     READ_VERSION = 0
 
+    # Transformers whose collect method must complete before this
+    # transformer's collect method starts, because it reads the data
+    # they collect or the changes they make to the xBlocks. The collect
+    # methods of transformers that do not depend on each other may run
+    # concurrently.
+    COLLECT_DEPENDENCIES = ()
+
     @classmethod
     def name(cls):
         """
@@ -98,6 +105,14 @@ class BlockStructureTransformer(object):
             topological_traversal
             post_order_traversal
 
+        When a course is collected again after some of its blocks
+        changed, these traversals only yield the changed blocks, their
+        ancestors and their descendants, and the previously collected
+        data of all other blocks is kept. So the data collected for a
+        block should only depend on the block, its ancestors and its
+        descendants, and the data collected for the structure as a
+        whole should only depend on the root block.
+
         Arguments:
             block_structure (BlockStructureModulestoreData) - A mutable
                 block structure that is to be modified with collected
@@ -3,7 +3,16 @@ Module for a collection of BlockStructureTransformers.
 """
 import functools
 from logging import getLogger
+from time import time
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from django.conf import settings
+from django.db import connections
+
+from openedx.core.djangoapps.monitoring_utils import set_custom_metric
+from request_cache.middleware import RequestCache
+
+from .block_structure import EDIT_INFO_XBLOCK_FIELDS
 from .exceptions import TransformerException, TransformerDataIncompatible
 from .transformer import FilteringTransformerMixin
 from .transformer_registry import TransformerRegistry
@@ -74,14 +83,119 @@ class BlockStructureTransformers(object):
     def collect(cls, block_structure):
         """
         Collects data for each registered transformer.
+
+        A transformer is collected only after the transformers listed in
+        its COLLECT_DEPENDENCIES. When the COLLECT_MAX_WORKERS block
+        structures setting is greater than 1, transformers that do not
+        depend on each other are collected concurrently by that many
+        threads; this is experimental, as the transformers are not known
+        to be thread-safe. The time taken by each transformer's collect
+        is logged and reported as a custom metric.
         """
-        for transformer in TransformerRegistry.get_registered_transformers():
+        block_structure.request_xblock_fields(*EDIT_INFO_XBLOCK_FIELDS)
+        transformers = TransformerRegistry.get_registered_transformers()
+        for transformer in transformers:
             block_structure._add_transformer(transformer)  # pylint: disable=protected-access
-            transformer.collect(block_structure)
+
+        max_workers = settings.BLOCK_STRUCTURES_SETTINGS.get('COLLECT_MAX_WORKERS', 1)
+        if max_workers > 1:
+            collect_times = cls._collect_concurrently(block_structure, transformers, max_workers)
+        else:
+            collect_times = {
+                transformer.name(): _collect_transformer(transformer, block_structure)
+                for transformer in cls._get_collect_order(transformers)
+            }
+
+        for transformer_name, seconds in sorted(collect_times.iteritems()):
+            logger.info("BlockStructure: Collected %s in %.3f seconds.", transformer_name, seconds)
+            set_custom_metric('block_structure.collect_time.{}'.format(transformer_name), seconds)
 
         # Collect all fields that were requested by the transformers.
         block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
 
+    @classmethod
+    def _collect_concurrently(cls, block_structure, transformers, max_workers):
+        """
+        Collects data for the given transformers in a pool of threads,
+        starting each transformer as soon as its dependencies are
+        collected.
+
+        Returns:
+            {string: float} - The time, in seconds, taken by the collect
+                of each transformer, keyed by transformer name.
+        """
+        # Validate the dependencies before starting any collection.
+        cls._get_collect_order(transformers)
+        dependencies = cls._get_collect_dependencies(transformers)
+        transformers_by_name = {transformer.name(): transformer for transformer in transformers}
+
+        # Create the data of every block up front, so that the concurrent
+        # collects only update existing block data.
+        for block_key in block_structure:
+            block_structure._get_or_create_block(block_key)  # pylint: disable=protected-access
+
+        collect_times = {}
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while dependencies or running:
+                ready_names = [name for name, names in dependencies.iteritems() if not names]
+                for name in ready_names:
+                    del dependencies[name]
+                    future = executor.submit(_collect_in_worker, transformers_by_name[name], block_structure)
+                    running[future] = name
+
+                done, __ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    collect_times[name] = future.result()
+                    for names in dependencies.itervalues():
+                        names.discard(name)
+        return collect_times
+
+    @classmethod
+    def _get_collect_dependencies(cls, transformers):
+        """
+        Returns a dictionary mapping the name of each of the given
+        transformers to the set of names of the given transformers that
+        must be collected before it. Dependencies on transformers that
+        are not given are ignored.
+        """
+        names = {transformer.name() for transformer in transformers}
+        return {
+            transformer.name(): {
+                dependency.name() for dependency in transformer.COLLECT_DEPENDENCIES
+            } & names
+            for transformer in transformers
+        }
+
+    @classmethod
+    def _get_collect_order(cls, transformers):
+        """
+        Returns the given transformers in an order in which each
+        transformer comes after its dependencies.
+
+        Raises:
+            TransformerException - if the transformers' dependencies
+                are circular.
+        """
+        dependencies = cls._get_collect_dependencies(transformers)
+        transformers_by_name = {transformer.name(): transformer for transformer in transformers}
+        ordered_transformers = []
+        while dependencies:
+            ready_names = sorted(name for name, names in dependencies.iteritems() if not names)
+            if not ready_names:
+                raise TransformerException(
+                    "The collect dependencies of the following transformers are circular: {}".format(
+                        sorted(dependencies)
+                    )
+                )
+            for name in ready_names:
+                del dependencies[name]
+                ordered_transformers.append(transformers_by_name[name])
+            for names in dependencies.itervalues():
+                names.difference_update(ready_names)
+        return ordered_transformers
+
     @classmethod
     def verify_versions(cls, block_structure):
         """
@@ -151,3 +265,28 @@ class BlockStructureTransformers(object):
         """
         for transformer in self._transformers['no_filter']:
             transformer.transform(self.usage_info, block_structure)
+
+
+def _collect_transformer(transformer, block_structure):
+    """
+    Collects data for the given transformer, and returns the time it
+    took in seconds.
+    """
+    start_time = time()
+    transformer.collect(block_structure)
+    return time() - start_time
+
+
+def _collect_in_worker(transformer, block_structure):
+    """
+    Collects data for the given transformer in a worker thread, and
+    returns the time it took in seconds.
+    """
+    try:
+        return _collect_transformer(transformer, block_structure)
+    finally:
+        # The request cache and the database connections of a worker
+        # thread must not outlive the collection.
+        RequestCache.clear_request_cache()
+        for connection in connections.all():
+            connection.close()
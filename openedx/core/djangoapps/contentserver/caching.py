@@ -1,6 +1,8 @@
 """
 Helper functions for caching course assets.
 """
+from uuid import uuid4
+
 from django.core.cache import caches
 from django.core.cache.backends.base import InvalidCacheBackendError
 from opaque_keys import InvalidKeyError
@@ -14,6 +16,8 @@ try:
 except InvalidCacheBackendError:
     pass
 
+ASSETS_VERSION_CACHE_KEY_TEMPLATE = u'contentserver.assets_version.{}'
+
 
 def set_cached_content(content):
     """
@@ -48,3 +52,30 @@ def del_cached_content(location):
         pass
 
     CONTENT_CACHE.delete_many(locations, version=STATIC_CONTENT_VERSION)
+    invalidate_assets_version(location.course_key)
+
+
+def invalidate_assets_version(course_key):
+    """
+    Starts a new version of the assets of the given course. Needs to be
+    called whenever assets of the course may have been saved without their
+    cached content being deleted, as when the course is imported.
+    """
+    CONTENT_CACHE.set(ASSETS_VERSION_CACHE_KEY_TEMPLATE.format(course_key), uuid4().hex, None)
+
+
+def get_assets_version(course_key):
+    """
+    Returns the version of the assets of the given course, which changes
+    whenever the cached content of any of them is deleted, as it is when an
+    asset is saved, locked or deleted, and whenever the course is published,
+    or None if the cache does not keep it.
+    """
+    cache_key = ASSETS_VERSION_CACHE_KEY_TEMPLATE.format(course_key)
+    version = CONTENT_CACHE.get(cache_key)
+    if version is None:
+        # Another process may start a version at the same time, in which
+        # case the first one to be stored wins.
+        CONTENT_CACHE.add(cache_key, uuid4().hex, None)
+        version = CONTENT_CACHE.get(cache_key)
+    return version
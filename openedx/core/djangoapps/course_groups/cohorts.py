@@ -5,14 +5,20 @@ forums, and to the cohort admin views.
 
 import logging
 import random
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from uuid import uuid4
 
 import request_cache
 from courseware import courses
 from django.contrib.auth.models import User
+from django.core.cache import cache as django_cache
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
 from django.db import IntegrityError, transaction
-from django.db.models.signals import m2m_changed, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.http import Http404
 from django.utils.translation import ugettext as _
@@ -168,6 +174,141 @@ def _cohort_cache_key(user_id, course_key):
     return u"{}.{}".format(user_id, course_key)
 
 
+COHORT_MEMBERSHIP_INDEX_NAMESPACE = u"cohorts.membership_index"
+COHORT_MEMBERSHIP_VERSION_CACHE_KEY_TPL = u"cohorts.membership_version.{course_key}"
+
+# Maximum number of courses whose membership index is kept in each process.
+MAX_COHORT_MEMBERSHIP_INDEXES = 100
+
+# Memberships are often changed inside an atomic request, so the index is
+# invalidated before the change is committed and a concurrent request may load
+# the memberships from before the change under the new version. Indexes are
+# reloaded after this many seconds, which bounds how long they may then be stale.
+COHORT_MEMBERSHIP_INDEX_MAX_AGE = 60 * 5
+
+# Process-local membership indexes, keyed by course key. Each entry is a
+# (version, load time, CohortMembershipIndex) tuple, ordered from least to most
+# recently used.
+_cohort_membership_indexes = OrderedDict()
+
+
+class CohortMembershipIndex(object):
+    """
+    Compact, read-only index of the cohort memberships in a course.
+
+    User ids are kept sorted in one array, with the id of each user's cohort at
+    the same position in a parallel array.
+    """
+    def __init__(self, user_ids, cohort_ids):
+        self.user_ids = array('l', user_ids)
+        self.cohort_ids = array('l', cohort_ids)
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    @classmethod
+    def load(cls, course_key):
+        """
+        Loads the index of the given course's cohort memberships with a single query.
+        """
+        memberships = list(CohortMembership.objects.filter(
+            course_id=course_key,
+        ).order_by('user_id').values_list('user_id', 'course_user_group_id'))
+        return cls(
+            (user_id for user_id, __ in memberships),
+            (cohort_id for __, cohort_id in memberships),
+        )
+
+    def get_cohort_id(self, user_id):
+        """
+        Returns the id of the given user's cohort, or None if the user has no cohort.
+        """
+        position = bisect_left(self.user_ids, user_id)
+        if position < len(self.user_ids) and self.user_ids[position] == user_id:
+            return self.cohort_ids[position]
+        return None
+
+
+def _cohort_membership_version(course_key):
+    """
+    Returns the current version of the given course's cohort memberships,
+    which changes every time a membership in the course changes.
+    """
+    cache_key = COHORT_MEMBERSHIP_VERSION_CACHE_KEY_TPL.format(course_key=course_key)
+    version = django_cache.get(cache_key)
+    if version is None:
+        version = uuid4().hex
+        if not django_cache.add(cache_key, version, None):
+            version = django_cache.get(cache_key, version)
+    return version
+
+
+def invalidate_cohort_membership_index(course_key):
+    """
+    Invalidates the membership indexes of the given course in all processes.
+    """
+    django_cache.set(COHORT_MEMBERSHIP_VERSION_CACHE_KEY_TPL.format(course_key=course_key), uuid4().hex, None)
+    request_cache.get_cache(COHORT_MEMBERSHIP_INDEX_NAMESPACE).pop(course_key, None)
+
+
+def get_cohort_membership_index(course_key):
+    """
+    Returns the CohortMembershipIndex of the given course.
+
+    The index is shared across requests handled by this process for up to
+    COHORT_MEMBERSHIP_INDEX_MAX_AGE seconds, and its version is checked at most
+    once per request.
+    """
+    cache = request_cache.get_cache(COHORT_MEMBERSHIP_INDEX_NAMESPACE)
+    if course_key in cache:
+        return cache[course_key]
+
+    version = _cohort_membership_version(course_key)
+    now = time.time()
+    cached_version, loaded_at, index = _cohort_membership_indexes.pop(course_key, (None, None, None))
+    if cached_version != version or now - loaded_at > COHORT_MEMBERSHIP_INDEX_MAX_AGE:
+        index = CohortMembershipIndex.load(course_key)
+        loaded_at = now
+
+    _cohort_membership_indexes[course_key] = (version, loaded_at, index)
+    while len(_cohort_membership_indexes) > MAX_COHORT_MEMBERSHIP_INDEXES:
+        _cohort_membership_indexes.popitem(last=False)
+
+    return cache.setdefault(course_key, index)
+
+
+def get_cohort_ids_for_users(course_key, user_ids):
+    """
+    Returns a dict mapping each of the given user ids to the id of the user's
+    cohort in the given course, or to None if the user has no cohort or the
+    course isn't cohorted. Users are not assigned to cohorts.
+
+    Raises:
+       Http404 if the course doesn't exist.
+    """
+    if not is_course_cohorted(course_key):
+        return {user_id: None for user_id in user_ids}
+
+    index = get_cohort_membership_index(course_key)
+    return {user_id: index.get_cohort_id(user_id) for user_id in user_ids}
+
+
+def get_cohorts_for_users(course_key, user_ids):
+    """
+    Returns a dict mapping each of the given user ids to the user's cohort
+    (a CourseUserGroup) in the given course, or to None if the user has no cohort
+    or the course isn't cohorted. Users are not assigned to cohorts.
+
+    Raises:
+       Http404 if the course doesn't exist.
+    """
+    cohort_ids = get_cohort_ids_for_users(course_key, user_ids)
+    distinct_cohort_ids = set(cohort_ids.itervalues())
+    distinct_cohort_ids.discard(None)
+    cohorts_by_id = CourseUserGroup.objects.in_bulk(list(distinct_cohort_ids)) if distinct_cohort_ids else {}
+    return {user_id: cohorts_by_id.get(cohort_id) for user_id, cohort_id in cohort_ids.iteritems()}
+
+
 def bulk_cache_cohorts(course_key, users):
     """
     Pre-fetches and caches the cohort assignments for the
@@ -178,20 +319,24 @@ def bulk_cache_cohorts(course_key, users):
     request_cache.clear_cache(COHORT_CACHE_NAMESPACE)
     cache = request_cache.get_cache(COHORT_CACHE_NAMESPACE)
 
-    if is_course_cohorted(course_key):
-        cohorts_by_user = {
-            membership.user: membership
-            for membership in
-            CohortMembership.objects.filter(user__in=users, course_id=course_key).select_related('user')
-        }
-        for user, membership in cohorts_by_user.iteritems():
-            cache[_cohort_cache_key(user.id, course_key)] = membership.course_user_group
-        uncohorted_users = filter(lambda u: u not in cohorts_by_user, users)
-    else:
-        uncohorted_users = users
+    cohorts_by_user_id = get_cohorts_for_users(course_key, [user.id for user in users])
+    for user_id, cohort in cohorts_by_user_id.iteritems():
+        cache[_cohort_cache_key(user_id, course_key)] = cohort
+
 
-    for user in uncohorted_users:
-        cache[_cohort_cache_key(user.id, course_key)] = None
+@receiver(post_save, sender=CohortMembership)
+@receiver(post_delete, sender=CohortMembership)
+def _cohort_membership_saved_or_deleted(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidates the course's membership index each time a cohort membership is modified"""
+    invalidate_cohort_membership_index(instance.course_id)
+
+
+@receiver(COHORT_MEMBERSHIP_UPDATED)
+def _cohort_membership_updated(sender, user, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidates the course's membership index once a membership change has been saved.
+    """
+    invalidate_cohort_membership_index(course_key)
 
 
 def get_cohort(user, course_key, assign=True, use_cached=False):
@@ -261,7 +406,11 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
                 course_user_group=course_user_group,
             )
 
-            return cache.setdefault(cache_key, membership.course_user_group)
+        # Invalidate again, so that indexes loaded while the new membership was
+        # in flight aren't kept. Within an atomic request, it is not committed
+        # yet; see COHORT_MEMBERSHIP_INDEX_MAX_AGE.
+        invalidate_cohort_membership_index(course_key)
+        return cache.setdefault(cache_key, membership.course_user_group)
     except IntegrityError as integrity_error:
         # An IntegrityError is raised when multiple workers attempt to
         # create the same row in one of the cohort model entries:
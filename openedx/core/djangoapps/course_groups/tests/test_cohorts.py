@@ -12,6 +12,7 @@ from django.db import IntegrityError
 from django.http import Http404
 from django.test import TestCase
 from opaque_keys.edx.locator import CourseLocator
+from request_cache.middleware import RequestCache
 from student.models import CourseEnrollment
 from student.tests.factories import UserFactory
 from xmodule.modulestore.django import modulestore
@@ -334,6 +335,108 @@ class TestCohorts(ModuleStoreTestCase):
             for __ in range(3):
                 cohorts.get_cohort(user, course.id, use_cached=use_cached)
 
+    def test_get_cohorts_for_users(self):
+        """
+        Make sure cohorts.get_cohorts_for_users() resolves the cohorts of many users at once.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        users = [UserFactory() for __ in range(4)]
+        user_ids = [user.id for user in users]
+        cohort1 = CohortFactory(course_id=course.id, name="TestCohort1", users=users[:2])
+        cohort2 = CohortFactory(course_id=course.id, name="TestCohort2", users=users[2:3])
+
+        # Nobody has a cohort while the course isn't cohorted.
+        self.assertEqual(cohorts.get_cohorts_for_users(course.id, user_ids), dict.fromkeys(user_ids))
+
+        config_course_cohorts(course, is_cohorted=True)
+        RequestCache.clear_request_cache()
+
+        self.assertEqual(
+            cohorts.get_cohorts_for_users(course.id, user_ids),
+            {users[0].id: cohort1, users[1].id: cohort1, users[2].id: cohort2, users[3].id: None}
+        )
+        self.assertEqual(
+            cohorts.get_cohort_ids_for_users(course.id, user_ids),
+            {users[0].id: cohort1.id, users[1].id: cohort1.id, users[2].id: cohort2.id, users[3].id: None}
+        )
+
+    def test_cohort_membership_index_sql_queries(self):
+        """
+        Make sure the membership index is loaded with one query and reused across requests until memberships change.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        users = [UserFactory() for __ in range(3)]
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=users[:2])
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(1):
+            index = cohorts.get_cohort_membership_index(course.id)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.get_cohort_id(users[0].id), cohort.id)
+        self.assertIsNone(index.get_cohort_id(users[2].id))
+
+        # The index is reused by later requests.
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(0):
+            self.assertIs(cohorts.get_cohort_membership_index(course.id), index)
+
+        # Membership changes invalidate the index.
+        cohorts.add_user_to_cohort(cohort, users[2].username)
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(1):
+            index = cohorts.get_cohort_membership_index(course.id)
+        self.assertEqual(index.get_cohort_id(users[2].id), cohort.id)
+
+        cohorts.remove_user_from_cohort(cohort, users[0].username)
+        RequestCache.clear_request_cache()
+        self.assertIsNone(cohorts.get_cohort_membership_index(course.id).get_cohort_id(users[0].id))
+
+    def test_cohort_membership_index_max_age(self):
+        """
+        Make sure the membership index is reloaded once it is older than its maximum age,
+        even if it wasn't invalidated.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        CohortFactory(course_id=course.id, name="TestCohort", users=[UserFactory()])
+        RequestCache.clear_request_cache()
+
+        with patch('openedx.core.djangoapps.course_groups.cohorts.time.time', return_value=1000):
+            index = cohorts.get_cohort_membership_index(course.id)
+
+        RequestCache.clear_request_cache()
+        with patch(
+            'openedx.core.djangoapps.course_groups.cohorts.time.time',
+            return_value=1000 + cohorts.COHORT_MEMBERSHIP_INDEX_MAX_AGE,
+        ):
+            with self.assertNumQueries(0):
+                self.assertIs(cohorts.get_cohort_membership_index(course.id), index)
+
+        RequestCache.clear_request_cache()
+        with patch(
+            'openedx.core.djangoapps.course_groups.cohorts.time.time',
+            return_value=1001 + cohorts.COHORT_MEMBERSHIP_INDEX_MAX_AGE,
+        ):
+            with self.assertNumQueries(1):
+                self.assertIsNot(cohorts.get_cohort_membership_index(course.id), index)
+
+    def test_bulk_cache_cohorts(self):
+        """
+        Make sure cohorts.bulk_cache_cohorts() caches cohorts for later use by cohorts.get_cohort().
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        users = [UserFactory() for __ in range(3)]
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=users[:2])
+        RequestCache.clear_request_cache()
+
+        cohorts.bulk_cache_cohorts(course.id, users)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(cohorts.get_cohort(users[0], course.id, use_cached=True), cohort)
+            self.assertIsNone(cohorts.get_cohort(users[2], course.id, assign=False, use_cached=True))
+
     def test_get_cohort_with_assign(self):
         """
         Make sure cohorts.get_cohort() returns None if no group is already
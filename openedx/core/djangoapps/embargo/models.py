@@ -33,6 +33,10 @@ from .messages import COURSEWARE_MESSAGES, ENROLL_MESSAGES
 
 log = logging.getLogger(__name__)
 
+# Process-local compiled IPFilter address lists, keyed by IPFilter field name.
+# Each entry is a (field value, IPFilter.IPFilterList) tuple.
+_COMPILED_IP_FILTER_LISTS = {}
+
 
 class EmbargoedCourse(models.Model):
     """
@@ -679,11 +683,28 @@ class IPFilter(ConfigurationModel):
     class IPFilterList(object):
         """
         Represent a list of IP addresses with support of networks.
+
+        Networks are compiled into sets of network prefixes, grouped by IP
+        version and prefix length, so that checking whether an address is in
+        the list takes one set lookup per distinct prefix length rather than
+        one comparison per network.
         """
 
         def __init__(self, ips):
             self.networks = [ipaddr.IPNetwork(ip) for ip in ips]
 
+            # {ip version: {prefix length: set(network prefixes)}}
+            prefixes = {}
+            for network in self.networks:
+                prefix = int(network.network) >> (network.max_prefixlen - network.prefixlen)
+                prefixes.setdefault(network.version, {}).setdefault(network.prefixlen, set()).add(prefix)
+
+            # {ip version: [(prefix length, set(network prefixes))]}, shortest prefixes first
+            self._prefixes = {
+                version: sorted(prefixes_by_length.items())
+                for version, prefixes_by_length in prefixes.iteritems()
+            }
+
         def __iter__(self):
             for network in self.networks:
                 yield network
@@ -694,29 +715,42 @@ class IPFilter(ConfigurationModel):
             except ValueError:
                 return False
 
-            for network in self.networks:
-                if network.Contains(ip_addr):
+            ip_int = int(ip_addr)
+            for prefixlen, prefixes in self._prefixes.get(ip_addr.version, []):
+                if ip_int >> (ip_addr.max_prefixlen - prefixlen) in prefixes:
                     return True
 
             return False
 
+    def _get_ip_filter_list(self, field_name):
+        """
+        Return the IPFilterList for the comma-separated addresses in the given field.
+
+        Compiled lists are kept per process, and only rebuilt when the field's value changes.
+        """
+        value = getattr(self, field_name)
+        if value == '':
+            return []
+
+        cached_value, ip_filter_list = _COMPILED_IP_FILTER_LISTS.get(field_name, (None, None))
+        if cached_value != value:
+            ip_filter_list = self.IPFilterList([addr.strip() for addr in value.split(',')])
+            _COMPILED_IP_FILTER_LISTS[field_name] = (value, ip_filter_list)
+        return ip_filter_list
+
     @property
     def whitelist_ips(self):
         """
         Return a list of valid IP addresses to whitelist
         """
-        if self.whitelist == '':
-            return []
-        return self.IPFilterList([addr.strip() for addr in self.whitelist.split(',')])
+        return self._get_ip_filter_list('whitelist')
 
     @property
     def blacklist_ips(self):
         """
         Return a list of valid IP addresses to blacklist
         """
-        if self.blacklist == '':
-            return []
-        return self.IPFilterList([addr.strip() for addr in self.blacklist.split(',')])
+        return self._get_ip_filter_list('blacklist')
 
     def __unicode__(self):
         return "Whitelist: {} - Blacklist: {}".format(self.whitelist_ips, self.blacklist_ips)
@@ -13,6 +13,7 @@ from django.test.utils import override_settings
 from django.core.cache import cache
 from django.db import connection
 
+from openedx.core.djangoapps.geoinfo.api import clear_country_code_cache
 from openedx.core.djangolib.testing.utils import skip_unless_lms
 from student.tests.factories import UserFactory
 from xmodule.modulestore.tests.factories import CourseFactory
@@ -59,6 +60,7 @@ class EmbargoCheckAccessApiTests(ModuleStoreTestCase):
 
         # Clear the cache to prevent interference between tests
         cache.clear()
+        clear_country_code_cache()
 
     @ddt.data(
         # IP country, profile_country, blacklist, whitelist, allow_access
@@ -232,9 +234,11 @@ class EmbargoCheckAccessApiTests(ModuleStoreTestCase):
         """
         Mock for the GeoIP module.
         """
+        clear_country_code_cache()
         with mock.patch.object(pygeoip.GeoIP, 'country_code_by_addr') as mock_ip:
             mock_ip.return_value = country_code
             yield
+        clear_country_code_cache()
 
 
 @ddt.ddt
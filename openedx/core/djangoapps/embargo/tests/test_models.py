@@ -105,6 +105,22 @@ class EmbargoModelsTest(CacheIsolationTestCase):
         self.assertIn('1.1.1.0', cblacklist)
         self.assertNotIn('1.2.0.0', cblacklist)
 
+    def test_ip_filter_list_compiled_once(self):
+        IPFilter(blacklist='1.1.0.0/16, 2001:db8::/32, 18.244.51.3').save()
+
+        cblacklist = IPFilter.current().blacklist_ips
+        self.assertIs(IPFilter.current().blacklist_ips, cblacklist)
+        self.assertIn('2001:db8::1', cblacklist)
+        self.assertNotIn('2001:db9::1', cblacklist)
+        self.assertNotIn('not an address', cblacklist)
+
+        # A new configuration is compiled again.
+        IPFilter(blacklist='1.2.0.0/16').save()
+        cblacklist = IPFilter.current().blacklist_ips
+        self.assertIn('1.2.3.4', cblacklist)
+        self.assertNotIn('1.1.0.1', cblacklist)
+        self.assertNotIn('18.244.51.3', cblacklist)
+
 
 class RestrictedCourseTest(CacheIsolationTestCase):
     """Test RestrictedCourse model. """
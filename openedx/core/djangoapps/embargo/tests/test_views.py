@@ -11,6 +11,7 @@ from mock import patch
 from .factories import CountryAccessRuleFactory, RestrictedCourseFactory
 from .. import messages
 from lms.djangoapps.course_api.tests.mixins import CourseApiFactoryMixin
+from openedx.core.djangoapps.geoinfo.api import clear_country_code_cache
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase, skip_unless_lms
 from openedx.core.djangoapps.theming.tests.test_util import with_comprehensive_theme
 from student.tests.factories import UserFactory
@@ -111,6 +112,8 @@ class CheckCourseAccessViewTest(CourseApiFactoryMixin, ModuleStoreTestCase):
             'ip_address': '0.0.0.0',
             'user': self.user,
         }
+        clear_country_code_cache()
+        self.addCleanup(clear_country_code_cache)
 
     def test_course_access_endpoint_with_unrestricted_course(self):
         response = self.client.get(self.url, data=self.request_data)
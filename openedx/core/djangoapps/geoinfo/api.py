@@ -0,0 +1,87 @@
+"""
+Country lookups by IP address.
+
+The GeoIP databases are opened once per process, memory-mapped, and reopened
+when the database files change on disk. The country codes of recently looked
+up IP addresses are kept in a bounded, process-local LRU cache.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pygeoip
+from django.conf import settings
+
+# Maximum number of IP addresses whose country code is kept in memory.
+COUNTRY_CODE_CACHE_SIZE = 10000
+
+# Minimum number of seconds between two checks for changes to a GeoIP database file.
+GEOIP_RELOAD_CHECK_INTERVAL = 60
+
+_lock = threading.RLock()
+
+# GeoIP readers, keyed by database path. Each entry is a
+# (modification time, time of the last check, pygeoip.GeoIP) tuple.
+_readers = {}
+
+# Country codes of recently looked up IP addresses, ordered from least to most recently used.
+_country_codes = OrderedDict()
+
+
+def _get_reader(path):
+    """
+    Returns the process-wide reader of the GeoIP database at path,
+    reopening it if the file has changed.
+    """
+    with _lock:
+        now = time.time()
+        mtime, checked_at, reader = _readers.get(path, (None, 0, None))
+        if reader is None or now - checked_at >= GEOIP_RELOAD_CHECK_INTERVAL:
+            current_mtime = os.path.getmtime(path)
+            if reader is None or current_mtime != mtime:
+                # pygeoip shares instances by filename unless told not to,
+                # which would keep serving the old database.
+                reader = pygeoip.GeoIP(path, flags=pygeoip.MMAP_CACHE, cache=False)
+                _country_codes.clear()
+            _readers[path] = (current_mtime, now, reader)
+        return reader
+
+
+def country_code_by_addr(ip_addr):
+    """
+    Return the country code associated with an IP address.
+    Handles both IPv4 and IPv6 addresses.
+
+    Args:
+        ip_addr (str): The IP address to look up.
+
+    Returns:
+        str: A 2-letter country code.
+
+    """
+    with _lock:
+        if ip_addr in _country_codes:
+            country_code = _country_codes.pop(ip_addr)
+            _country_codes[ip_addr] = country_code
+            return country_code
+
+    if ip_addr.find(':') >= 0:
+        country_code = _get_reader(settings.GEOIPV6_PATH).country_code_by_addr(ip_addr)
+    else:
+        country_code = _get_reader(settings.GEOIP_PATH).country_code_by_addr(ip_addr)
+
+    with _lock:
+        _country_codes[ip_addr] = country_code
+        while len(_country_codes) > COUNTRY_CODE_CACHE_SIZE:
+            _country_codes.popitem(last=False)
+
+    return country_code
+
+
+def clear_country_code_cache():
+    """
+    Forget the country codes of all looked up IP addresses.
+    """
+    with _lock:
+        _country_codes.clear()
@@ -0,0 +1,92 @@
+"""
+Microbenchmark of the country lookups used by the embargo and geoinfo apps.
+"""
+import random
+import socket
+import struct
+import timeit
+
+import pygeoip
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from openedx.core.djangoapps.geoinfo import api
+
+
+def _random_ipv4_addresses(count):
+    """
+    Returns a list of random IPv4 addresses.
+    """
+    return [socket.inet_ntoa(struct.pack('>I', random.getrandbits(32))) for __ in range(count)]
+
+
+def _random_ipv6_addresses(count):
+    """
+    Returns a list of random global unicast IPv6 addresses.
+    """
+    return [
+        ':'.join(['2{:03x}'.format(random.getrandbits(9))] + ['{:x}'.format(random.getrandbits(16)) for __ in range(7)])
+        for __ in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    """
+    Times IPv4 and IPv6 country lookups.
+    """
+    help = '''
+    Times country lookups of random IPv4 and IPv6 addresses, comparing opening the GeoIP
+    database per lookup with the process-wide reader, with and without the IP address cache.
+    '''
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command parser.
+        """
+        parser.add_argument(
+            '--addresses',
+            type=int,
+            default=1000,
+            help='Number of distinct random addresses looked up per run.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of times each address is looked up.',
+        )
+
+    def handle(self, *args, **options):
+        count = options['addresses']
+        repeat = options['repeat']
+        for label, path, addresses in (
+            ('IPv4', settings.GEOIP_PATH, _random_ipv4_addresses(count)),
+            ('IPv6', settings.GEOIPV6_PATH, _random_ipv6_addresses(count)),
+        ):
+            lookups = addresses * repeat
+
+            def per_lookup_reader():
+                for ip_addr in lookups:
+                    pygeoip.GeoIP(path, cache=False).country_code_by_addr(ip_addr)
+
+            def shared_reader():
+                reader = api._get_reader(path)  # pylint: disable=protected-access
+                for ip_addr in lookups:
+                    reader.country_code_by_addr(ip_addr)
+
+            def cached_lookups():
+                api.clear_country_code_cache()
+                for ip_addr in lookups:
+                    api.country_code_by_addr(ip_addr)
+
+            for name, func in (
+                ('database opened per lookup', per_lookup_reader),
+                ('process-wide reader', shared_reader),
+                ('process-wide reader and cache', cached_lookups),
+            ):
+                seconds = timeit.timeit(func, number=1)
+                self.stdout.write(u'{} {}: {:.2f} us per lookup'.format(
+                    label, name, seconds * 1000000 / len(lookups)
+                ))
+
+        api.clear_country_code_cache()
@@ -0,0 +1,73 @@
+"""
+Tests for the GeoIP lookup API.
+"""
+from django.conf import settings
+from django.test import TestCase
+from mock import patch
+import pygeoip
+
+from openedx.core.djangoapps.geoinfo import api
+
+
+class CountryCodeByAddrTests(TestCase):
+    """
+    Tests of country_code_by_addr.
+    """
+    def setUp(self):
+        super(CountryCodeByAddrTests, self).setUp()
+        api.clear_country_code_cache()
+        self.addCleanup(api.clear_country_code_cache)
+        patcher = patch.object(pygeoip.GeoIP, 'country_code_by_addr', return_value='CN')
+        self.mock_lookup = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookups_are_cached(self):
+        for __ in range(3):
+            self.assertEqual(api.country_code_by_addr('117.79.83.1'), 'CN')
+        self.assertEqual(self.mock_lookup.call_count, 1)
+
+    def test_clear_cache(self):
+        api.country_code_by_addr('117.79.83.1')
+        api.clear_country_code_cache()
+        api.country_code_by_addr('117.79.83.1')
+        self.assertEqual(self.mock_lookup.call_count, 2)
+
+    @patch.object(api, 'COUNTRY_CODE_CACHE_SIZE', 2)
+    def test_least_recently_used_evicted(self):
+        for ip_addr in ('1.0.0.1', '1.0.0.2', '1.0.0.1', '1.0.0.3'):
+            api.country_code_by_addr(ip_addr)
+        self.assertEqual(self.mock_lookup.call_count, 3)
+
+        # 1.0.0.2 was the least recently used address.
+        api.country_code_by_addr('1.0.0.1')
+        self.assertEqual(self.mock_lookup.call_count, 3)
+        api.country_code_by_addr('1.0.0.2')
+        self.assertEqual(self.mock_lookup.call_count, 4)
+
+    def test_ipv6_database(self):
+        with patch.object(api, '_get_reader', wraps=api._get_reader) as mock_get_reader:  # pylint: disable=protected-access
+            api.country_code_by_addr('2001:da8:20f:1502:edcf:550b:4a9c:207d')
+            api.country_code_by_addr('117.79.83.1')
+        self.assertEqual(
+            [call[0][0] for call in mock_get_reader.call_args_list],
+            [settings.GEOIPV6_PATH, settings.GEOIP_PATH],
+        )
+
+
+@patch.object(api, '_readers', {})
+class GetReaderTests(TestCase):
+    """
+    Tests of the process-wide GeoIP readers.
+    """
+    def test_reader_is_shared(self):
+        reader = api._get_reader(settings.GEOIP_PATH)  # pylint: disable=protected-access
+        self.assertIs(api._get_reader(settings.GEOIP_PATH), reader)  # pylint: disable=protected-access
+
+    @patch.object(api, 'GEOIP_RELOAD_CHECK_INTERVAL', 0)
+    def test_reader_reloaded_on_change(self):
+        with patch('os.path.getmtime', return_value=1):
+            reader = api._get_reader(settings.GEOIP_PATH)  # pylint: disable=protected-access
+            self.assertIs(api._get_reader(settings.GEOIP_PATH), reader)  # pylint: disable=protected-access
+
+        with patch('os.path.getmtime', return_value=2):
+            self.assertIsNot(api._get_reader(settings.GEOIP_PATH), reader)  # pylint: disable=protected-access
@@ -9,6 +9,7 @@ from django.contrib.sessions.middleware import SessionMiddleware
 from django.test import TestCase
 from django.test.client import RequestFactory
 
+from openedx.core.djangoapps.geoinfo.api import clear_country_code_cache
 from openedx.core.djangoapps.geoinfo.middleware import CountryMiddleware
 from student.tests.factories import UserFactory, AnonymousUserFactory
 
@@ -27,6 +28,8 @@ class CountryMiddlewareTests(TestCase):
         self.patcher = patch.object(pygeoip.GeoIP, 'country_code_by_addr', self.mock_country_code_by_addr)
         self.patcher.start()
         self.addCleanup(self.patcher.stop)
+        clear_country_code_cache()
+        self.addCleanup(clear_country_code_cache)
 
     def mock_country_code_by_addr(self, ip_addr):
         """
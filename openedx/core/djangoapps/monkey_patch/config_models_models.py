@@ -0,0 +1,143 @@
+"""
+Monkey patch ConfigurationModel.current and ConfigurationModel.key_values to
+serve them from a process-wide cache, rather than from the configuration
+cache on every call.
+
+Every entry of the process-wide cache belongs to a single generation, shared
+by all configuration models and stored in the configuration cache, which is
+read at most once per request. Saving or deleting any configuration model
+starts a new generation, which empties the process-wide cache of every process.
+If the configuration cache does not keep the generation, as with a dummy cache,
+the unpatched methods are used.
+"""
+import copy
+import threading
+from uuid import uuid4
+
+from config_models import models as config_models_models
+from config_models.models import ConfigurationModel
+from django.db.models.signals import post_delete, post_save
+
+from request_cache import get_cache as get_request_cache
+
+GENERATION_CACHE_KEY = 'configuration/generation'
+
+PATCHED_METHODS = ('current', 'key_values')
+
+_lock = threading.Lock()
+
+# The generation of the cached values, and the cached values keyed by
+# (method name, model class, positional arguments, keyword arguments).
+_process_cache = {'generation': None, 'values': {}}
+
+# The unpatched class methods, keyed by name.
+_unpatched_methods = {}
+
+
+def _get_current_generation():
+    """
+    Returns the current generation of the process-wide cache, as read from
+    the configuration cache once per request, or None if the configuration
+    cache does not keep it.
+    """
+    request_cache = get_request_cache('config_models_models')
+    if 'generation' not in request_cache:
+        cache = config_models_models.cache
+        generation = cache.get(GENERATION_CACHE_KEY)
+        if generation is None:
+            # Another process may start a generation at the same time, in
+            # which case the first one to be stored wins.
+            cache.add(GENERATION_CACHE_KEY, uuid4().hex, None)
+            generation = cache.get(GENERATION_CACHE_KEY)
+        request_cache['generation'] = generation
+    return request_cache['generation']
+
+
+def _process_cached(method_name, method):
+    """
+    Returns a class method that serves the values returned by the given
+    class method from the process-wide cache.
+    """
+    def cached_method(cls, *args, **kwargs):
+        """
+        Returns a copy of the cached value, so that callers modifying it do
+        not modify the value served to other requests.
+        """
+        generation = _get_current_generation()
+        if generation is None:
+            return method(cls, *args, **kwargs)
+
+        key = (method_name, cls, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return method(cls, *args, **kwargs)
+
+        with _lock:
+            if _process_cache['generation'] != generation:
+                _process_cache['generation'] = generation
+                _process_cache['values'] = {}
+            values = _process_cache['values']
+            if key in values:
+                return copy.copy(values[key])
+
+        value = method(cls, *args, **kwargs)
+        with _lock:
+            # Drop the value if the configuration changed while it was read.
+            if _process_cache['values'] is values:
+                values[key] = value
+        return copy.copy(value)
+
+    return classmethod(cached_method)
+
+
+def invalidate(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Starts a new generation of the process-wide cache when a configuration
+    model is saved or deleted.
+    """
+    if not issubclass(sender, ConfigurationModel):
+        return
+    with _lock:
+        _process_cache['generation'] = None
+        _process_cache['values'] = {}
+    get_request_cache('config_models_models').clear()
+    config_models_models.cache.set(GENERATION_CACHE_KEY, uuid4().hex, None)
+
+
+def is_patched():
+    """
+    Check if the ConfigurationModel methods have been monkey-patched.
+    """
+    return bool(_unpatched_methods)
+
+
+def patch():
+    """
+    Monkey-patch the ConfigurationModel methods.
+    """
+    if not is_patched():
+        for name in PATCHED_METHODS:
+            _unpatched_methods[name] = ConfigurationModel.__dict__[name]
+            setattr(ConfigurationModel, name, _process_cached(name, _unpatched_methods[name].__func__))
+        post_save.connect(invalidate, dispatch_uid='config_models_models.invalidate')
+        post_delete.connect(invalidate, dispatch_uid='config_models_models.invalidate')
+    return is_patched()
+
+
+def unpatch():
+    """
+    Un-monkey-patch the ConfigurationModel methods.
+
+    Return boolean whether or not the methods could be unpatched
+    """
+    was_patched = is_patched()
+    for name, method in _unpatched_methods.items():
+        setattr(ConfigurationModel, name, method)
+    _unpatched_methods.clear()
+    post_save.disconnect(dispatch_uid='config_models_models.invalidate')
+    post_delete.disconnect(dispatch_uid='config_models_models.invalidate')
+    with _lock:
+        _process_cache['generation'] = None
+        _process_cache['values'] = {}
+    return was_patched
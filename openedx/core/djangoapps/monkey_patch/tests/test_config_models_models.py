@@ -0,0 +1,94 @@
+"""
+Tests for the process-wide cache of ConfigurationModel lookups.
+"""
+from config_models.models import ConfigurationModel
+
+from openedx.core.djangoapps.self_paced.models import SelfPacedConfiguration
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from request_cache.middleware import RequestCache
+from xblock_django.models import XBlockConfiguration
+
+from .. import config_models_models
+
+
+class ConfigModelsPatchTests(CacheIsolationTestCase):
+    """
+    Tests of the monkey-patched ConfigurationModel.current and key_values.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(ConfigModelsPatchTests, self).setUp()
+        config_models_models.patch()
+        RequestCache.clear_request_cache()
+
+    def test_patched(self):
+        self.assertTrue(config_models_models.is_patched())
+
+    def test_current_cached_across_requests(self):
+        SelfPacedConfiguration.objects.create(enabled=True)
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(SelfPacedConfiguration.current().enabled)
+            self.assertTrue(SelfPacedConfiguration.current().enabled)
+
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(0):
+            self.assertTrue(SelfPacedConfiguration.current().enabled)
+
+    def test_current_copied(self):
+        SelfPacedConfiguration.current().enabled = True
+        self.assertFalse(SelfPacedConfiguration.current().enabled)
+
+    def test_keyed_current(self):
+        XBlockConfiguration.objects.create(name='poll', enabled=True)
+        XBlockConfiguration.objects.create(name='survey', enabled=False)
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(3):
+            self.assertTrue(XBlockConfiguration.current('poll').enabled)
+            self.assertFalse(XBlockConfiguration.current('survey').enabled)
+            self.assertEqual(
+                sorted(XBlockConfiguration.key_values('name', flat=True)),
+                ['poll', 'survey'],
+            )
+            self.assertTrue(XBlockConfiguration.current('poll').enabled)
+
+    def test_invalidated_on_save(self):
+        self.assertFalse(SelfPacedConfiguration.current().enabled)
+        SelfPacedConfiguration.objects.create(enabled=True)
+        self.assertTrue(SelfPacedConfiguration.current().enabled)
+
+    def test_invalidated_on_new_generation(self):
+        self.assertFalse(SelfPacedConfiguration.current().enabled)
+
+        # Another process saves a configuration.
+        SelfPacedConfiguration.objects.bulk_create([SelfPacedConfiguration(enabled=True)])
+        config_models_models.config_models_models.cache.set(
+            config_models_models.GENERATION_CACHE_KEY, 'another generation', None
+        )
+
+        # The generation is only checked once per request.
+        self.assertFalse(SelfPacedConfiguration.current().enabled)
+        RequestCache.clear_request_cache()
+        self.assertTrue(SelfPacedConfiguration.current().enabled)
+
+    def test_unpatch(self):
+        patched_current = ConfigurationModel.__dict__['current']
+        self.assertTrue(config_models_models.unpatch())
+        self.addCleanup(config_models_models.patch)
+        self.assertFalse(config_models_models.is_patched())
+        self.assertIsNot(ConfigurationModel.__dict__['current'], patched_current)
+
+
+class ConfigModelsPatchWithoutCacheTests(CacheIsolationTestCase):
+    """
+    Tests of the monkey-patched ConfigurationModel.current when the
+    configuration cache does not keep the generation.
+    """
+    def test_not_cached(self):
+        config_models_models.patch()
+        for __ in range(2):
+            with self.assertNumQueries(1):
+                SelfPacedConfiguration.current()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.conf import settings
+import django.db.models.deletion
+import django.utils.timezone
+import jsonfield.fields
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('programs', '0012_auto_20170419_0018'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramProgress',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, verbose_name='created', editable=False)),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, verbose_name='modified', editable=False)),
+                ('programs_version', models.CharField(help_text='Version of the cached program data the progress was computed against. Blank when stale.', max_length=32, blank=True)),
+                ('data', jsonfield.fields.JSONField(default=dict, help_text='UUIDs of engaged and completed programs, and count-only progress towards engaged programs.')),
+                ('site', models.ForeignKey(to='sites.Site', on_delete=django.db.models.deletion.CASCADE)),
+                ('user', models.ForeignKey(to=settings.AUTH_USER_MODEL, on_delete=django.db.models.deletion.CASCADE)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='programprogress',
+            unique_together=set([('user', 'site')]),
+        ),
+    ]
@@ -1,8 +1,13 @@
 """Models providing Programs support for the LMS and Studio."""
 
 from config_models.models import ConfigurationModel
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
+from jsonfield.fields import JSONField
+from model_utils.models import TimeStampedModel
 
 
 class ProgramsApiConfig(ConfigurationModel):
@@ -21,3 +26,55 @@ class ProgramsApiConfig(ConfigurationModel):
             'Path used to construct URLs to programs marketing pages (e.g., "/foo").'
         )
     )
+
+
+class ProgramProgress(TimeStampedModel):
+    """
+    Materialized summary of a user's progress towards completing the programs offered by a site.
+
+    Records are computed by ProgramProgressMeter and read by program dashboards, which would
+    otherwise gauge progress against every program for the site on each page view. A record is
+    only used while the site's cached program data is at the version it was computed against; it
+    is marked stale when the user's enrollments, certificates or grades change.
+
+    .. no_pii:
+    """
+    class Meta(object):
+        app_label = 'programs'
+        unique_together = ('user', 'site')
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    site = models.ForeignKey(Site, on_delete=models.CASCADE)
+    programs_version = models.CharField(
+        max_length=32,
+        blank=True,
+        help_text=_('Version of the cached program data the progress was computed against. Blank when stale.')
+    )
+    data = JSONField(
+        default=dict,
+        help_text=_('UUIDs of engaged and completed programs, and count-only progress towards engaged programs.')
+    )
+
+    @classmethod
+    def mark_stale(cls, user):
+        """
+        Mark all of the user's progress records as stale.
+
+        Returns:
+            int, the number of records marked stale.
+        """
+        fresh_records = cls.objects.filter(user=user).exclude(programs_version='')
+        # Most learners have no fresh records, for which a read is cheaper than an update.
+        if not fresh_records.exists():
+            return 0
+        return fresh_records.update(programs_version='')
+
+    def is_fresh(self, programs_version, max_age):
+        """
+        Check whether this record reflects the given version of the site's programs and is no older than max_age.
+        """
+        return (
+            bool(programs_version) and
+            self.programs_version == programs_version and
+            self.modified > timezone.now() - max_age
+        )
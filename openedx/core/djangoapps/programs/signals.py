@@ -3,12 +3,20 @@ This module contains signals / handlers related to programs.
 """
 import logging
 
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from openedx.core.djangoapps.signals.signals import COURSE_CERT_AWARDED
+from entitlements.models import CourseEntitlement
+from openedx.core.djangoapps.signals.signals import COURSE_CERT_AWARDED, COURSE_GRADE_CHANGED
+from student.signals import ENROLL_STATUS_CHANGE, ENROLLMENT_TRACK_UPDATED
 
 LOGGER = logging.getLogger(__name__)
 
+# Delay before recomputing stale program progress, giving the transaction which
+# changed the learner's enrollments, entitlements, certificates or grades time
+# to commit.
+PROGRAM_PROGRESS_UPDATE_DELAY_SECONDS = 30
+
 
 @receiver(COURSE_CERT_AWARDED)
 def handle_course_cert_awarded(sender, user, course_key, mode, status, **kwargs):  # pylint: disable=unused-argument
@@ -52,3 +60,38 @@ def handle_course_cert_awarded(sender, user, course_key, mode, status, **kwargs)
     # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
     from openedx.core.djangoapps.programs.tasks.v1.tasks import award_program_certificates
     award_program_certificates.delay(user.username)
+
+
+@receiver([COURSE_CERT_AWARDED, COURSE_GRADE_CHANGED, ENROLL_STATUS_CHANGE, ENROLLMENT_TRACK_UPDATED])
+def handle_program_progress_changed(sender, user, **kwargs):  # pylint: disable=unused-argument
+    """
+    When a learner's enrollments, enrollment modes, certificates or grades
+    change, mark their stored program progress as stale and schedule a celery
+    task to recompute it.
+
+    Learners without stored program progress are left alone; their progress is
+    computed the next time a program dashboard reads it.
+    """
+    # Import here instead of top of file since this module gets imported before
+    # the programs models are ready.
+    from openedx.core.djangoapps.programs.models import ProgramProgress
+
+    if getattr(user, 'id', None) is None or not ProgramProgress.mark_stale(user):
+        return
+
+    LOGGER.debug('handling program progress change: username=%s, sender=%s', user, sender)
+    # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
+    from openedx.core.djangoapps.programs.tasks.v1.tasks import update_program_progress_records
+    update_program_progress_records.apply_async(
+        [user.username],
+        countdown=PROGRAM_PROGRESS_UPDATE_DELAY_SECONDS,
+    )
+
+
+@receiver([post_save, post_delete], sender=CourseEntitlement)
+def handle_course_entitlement_changed(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    When a learner's course entitlements change, mark their stored program
+    progress as stale, as their enrollments do.
+    """
+    handle_program_progress_changed(sender, user=instance.user)
@@ -13,7 +13,8 @@ from provider.oauth2.models import Client
 
 from openedx.core.djangoapps.credentials.models import CredentialsApiConfig
 from openedx.core.djangoapps.credentials.utils import get_credentials
-from openedx.core.djangoapps.programs.utils import ProgramProgressMeter
+from openedx.core.djangoapps.programs.models import ProgramProgress
+from openedx.core.djangoapps.programs.utils import ProgramProgressMeter, update_program_progress
 from openedx.core.lib.token_utils import JwtBuilder
 
 
@@ -206,3 +207,31 @@ def award_program_certificates(self, username):
         LOGGER.info('User %s is not eligible for any new program certificates', username)
 
     LOGGER.info('Successfully completed the task award_program_certificates for username %s', username)
+
+
+@task(ignore_result=True, routing_key=ROUTING_KEY)
+def update_program_progress_records(username):
+    """
+    Recompute the stored program progress of the given user for every site
+    where the user has a ProgramProgress record.
+
+    This task is scheduled whenever the user's progress records are marked
+    stale, so that dashboards can read progress without computing it.
+
+    Args:
+        username (str): The username of the student
+
+    Returns:
+        None
+
+    """
+    try:
+        student = User.objects.get(username=username)
+    except User.DoesNotExist:
+        LOGGER.exception('Task update_program_progress_records was called with invalid username %s', username)
+        return
+
+    for record in ProgramProgress.objects.filter(user=student).select_related('site'):
+        update_program_progress(record.site, student)
+
+    LOGGER.info('Updated program progress records for username %s', username)
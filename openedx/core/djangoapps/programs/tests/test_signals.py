@@ -6,10 +6,14 @@ from django.test import TestCase
 from nose.plugins.attrib import attr
 import mock
 
+from entitlements.tests.factories import CourseEntitlementFactory
+from student.signals import ENROLLMENT_TRACK_UPDATED
 from student.tests.factories import UserFactory
 
 from openedx.core.djangoapps.signals.signals import COURSE_CERT_AWARDED
-from openedx.core.djangoapps.programs.signals import handle_course_cert_awarded
+from openedx.core.djangoapps.programs.models import ProgramProgress
+from openedx.core.djangoapps.programs.signals import handle_course_cert_awarded, handle_program_progress_changed
+from openedx.core.djangoapps.site_configuration.tests.factories import SiteFactory
 from openedx.core.djangolib.testing.utils import skip_unless_lms
 
 TEST_USERNAME = 'test-user'
@@ -75,3 +79,78 @@ class CertAwardedReceiverTest(TestCase):
         self.assertEqual(mock_is_learner_issuance_enabled.call_count, 1)
         self.assertEqual(mock_task.call_count, 1)
         self.assertEqual(mock_task.call_args[0], (TEST_USERNAME,))
+
+
+@attr(shard=2)
+@skip_unless_lms
+@mock.patch('openedx.core.djangoapps.programs.tasks.v1.tasks.update_program_progress_records.apply_async')
+class ProgramProgressChangedReceiverTest(TestCase):
+    """
+    Tests for the `handle_program_progress_changed` signal handler function.
+    """
+    def setUp(self):
+        super(ProgramProgressChangedReceiverTest, self).setUp()
+        self.user = UserFactory.create(username=TEST_USERNAME)
+
+    def test_no_records(self, mock_task):
+        """
+        Ensures that no task is scheduled for users without stored program progress.
+        """
+        handle_program_progress_changed(sender=self.__class__, user=self.user)
+        self.assertEqual(mock_task.call_count, 0)
+
+    def test_records_marked_stale(self, mock_task):
+        """
+        Ensures that stored program progress is marked stale and a task is scheduled to recompute it.
+        """
+        record = ProgramProgress.objects.create(user=self.user, site=SiteFactory(), programs_version='v1')
+
+        handle_program_progress_changed(sender=self.__class__, user=self.user)
+
+        record.refresh_from_db()
+        self.assertEqual(record.programs_version, '')
+        self.assertEqual(mock_task.call_count, 1)
+        self.assertEqual(mock_task.call_args[0][0], [TEST_USERNAME])
+
+        # Records which are already stale don't cause another task to be scheduled.
+        handle_program_progress_changed(sender=self.__class__, user=self.user)
+        self.assertEqual(mock_task.call_count, 1)
+
+    def test_no_update_without_fresh_records(self, mock_task):
+        """
+        Ensures that no record is updated for users without fresh stored program progress.
+        """
+        ProgramProgress.objects.create(user=self.user, site=SiteFactory(), programs_version='')
+        with self.assertNumQueries(1):
+            handle_program_progress_changed(sender=self.__class__, user=self.user)
+        self.assertEqual(mock_task.call_count, 0)
+
+    def test_enrollment_track_updated(self, mock_task):
+        """
+        Ensures that stored program progress is marked stale when a learner's enrollment mode changes.
+        """
+        record = ProgramProgress.objects.create(user=self.user, site=SiteFactory(), programs_version='v1')
+
+        ENROLLMENT_TRACK_UPDATED.send(sender=None, user=self.user, course_key='test-course')
+
+        record.refresh_from_db()
+        self.assertEqual(record.programs_version, '')
+        self.assertEqual(mock_task.call_count, 1)
+
+    def test_course_entitlement_changed(self, mock_task):
+        """
+        Ensures that stored program progress is marked stale when a learner's entitlements are created or deleted.
+        """
+        record = ProgramProgress.objects.create(user=self.user, site=SiteFactory(), programs_version='v1')
+
+        entitlement = CourseEntitlementFactory.create(user=self.user)
+        record.refresh_from_db()
+        self.assertEqual(record.programs_version, '')
+        self.assertEqual(mock_task.call_count, 1)
+
+        record.programs_version = 'v1'
+        record.save()
+        entitlement.delete()
+        record.refresh_from_db()
+        self.assertEqual(record.programs_version, '')
+        self.assertEqual(mock_task.call_count, 2)
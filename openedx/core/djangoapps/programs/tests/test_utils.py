@@ -29,13 +29,17 @@ from openedx.core.djangoapps.catalog.tests.factories import (
     SeatFactory,
     generate_course_run_key
 )
+from openedx.core.djangoapps.programs.models import ProgramProgress
 from openedx.core.djangoapps.programs.tests.factories import ProgressFactory
 from openedx.core.djangoapps.programs.utils import (
     DEFAULT_ENROLLMENT_START_DATE,
+    PROGRAM_PROGRESS_MAX_AGE,
     ProgramDataExtender,
     ProgramMarketingDataExtender,
     ProgramProgressMeter,
-    get_certificates
+    get_certificates,
+    get_program_progress,
+    update_program_progress
 )
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteFactory
 from openedx.core.djangolib.testing.utils import skip_unless_lms
@@ -768,6 +772,90 @@ def _create_course(self, course_price, course_run_count=1, make_entitlement=Fals
     return CourseFactory(course_runs=course_runs, entitlements=entitlements)
 
 
+@attr(shard=2)
+@skip_unless_lms
+@mock.patch(UTILS_MODULE + '.get_programs_version')
+@mock.patch(UTILS_MODULE + '.get_programs')
+@pytest.mark.django111_expected_failure
+class TestGetProgramProgress(TestCase):
+    """Tests of the materialized program progress read API."""
+    def setUp(self):
+        super(TestGetProgramProgress, self).setUp()
+
+        self.user = UserFactory()
+        self.site = SiteFactory()
+
+        self.course_run_key = generate_course_run_key()
+        self.program = ProgramFactory(
+            courses=[
+                CourseFactory(course_runs=[
+                    CourseRunFactory(key=self.course_run_key),
+                ]),
+            ]
+        )
+        CourseEnrollmentFactory(user=self.user, course_id=self.course_run_key, mode=CourseMode.VERIFIED)
+
+    def _expected_progress(self):
+        """The count-only progress expected for the user's single engaged program."""
+        return [ProgressFactory(uuid=self.program['uuid'], in_progress=1, grades={self.course_run_key: 0.0})]
+
+    def test_progress_without_programs_version(self, mock_get_programs, mock_get_programs_version):
+        """Verify that progress is computed, but not stored, when programs have no cached version."""
+        mock_get_programs.return_value = [self.program, ProgramFactory()]
+        mock_get_programs_version.return_value = None
+
+        progress = get_program_progress(self.site, self.user)
+
+        self.assertEqual([program['uuid'] for program in progress['programs']], [self.program['uuid']])
+        self.assertEqual(progress['progress'], self._expected_progress())
+        self.assertEqual(progress['completed_programs'], [])
+        self.assertFalse(ProgramProgress.objects.filter(user=self.user).exists())
+
+    def test_progress_stored_and_reused(self, mock_get_programs, mock_get_programs_version):
+        """Verify that progress is stored on first read and served from the stored record afterwards."""
+        mock_get_programs.return_value = [self.program, ProgramFactory()]
+        mock_get_programs_version.return_value = 'v1'
+
+        progress = get_program_progress(self.site, self.user)
+
+        record = ProgramProgress.objects.get(user=self.user, site=self.site)
+        self.assertEqual(record.programs_version, 'v1')
+        self.assertEqual(record.data['engaged_programs'], [self.program['uuid']])
+        self.assertEqual(progress['progress'], self._expected_progress())
+        self.assertEqual(
+            progress['programs'][0]['detail_url'],
+            reverse('program_details_view', kwargs={'program_uuid': self.program['uuid']})
+        )
+
+        with mock.patch(UTILS_MODULE + '.ProgramProgressMeter') as mock_meter:
+            progress = get_program_progress(self.site, self.user)
+            self.assertFalse(mock_meter.called)
+
+        self.assertEqual([program['uuid'] for program in progress['programs']], [self.program['uuid']])
+        self.assertEqual(progress['progress'], self._expected_progress())
+
+    def test_stale_record_recomputed(self, mock_get_programs, mock_get_programs_version):
+        """Verify that records marked stale, computed against old programs or too old are recomputed."""
+        mock_get_programs.return_value = [self.program]
+        mock_get_programs_version.return_value = 'v1'
+        record = update_program_progress(self.site, self.user)
+
+        self.assertTrue(record.is_fresh('v1', PROGRAM_PROGRESS_MAX_AGE))
+        self.assertFalse(record.is_fresh('v2', PROGRAM_PROGRESS_MAX_AGE))
+        self.assertFalse(record.is_fresh('v1', datetime.timedelta(0)))
+
+        self.assertEqual(ProgramProgress.mark_stale(self.user), 1)
+        record.refresh_from_db()
+        self.assertFalse(record.is_fresh('v1', PROGRAM_PROGRESS_MAX_AGE))
+
+        with mock.patch(UTILS_MODULE + '.ProgramProgressMeter', wraps=ProgramProgressMeter) as mock_meter:
+            get_program_progress(self.site, self.user)
+            self.assertTrue(mock_meter.called)
+
+        record.refresh_from_db()
+        self.assertTrue(record.is_fresh('v1', PROGRAM_PROGRESS_MAX_AGE))
+
+
 @ddt.ddt
 @override_settings(ECOMMERCE_PUBLIC_URL_ROOT=ECOMMERCE_URL_ROOT)
 @skip_unless_lms
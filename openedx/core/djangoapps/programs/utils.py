@@ -24,10 +24,15 @@ from lms.djangoapps.certificates import api as certificate_api
 from lms.djangoapps.commerce.utils import EcommerceService
 from lms.djangoapps.courseware.access import has_access
 from lms.djangoapps.grades.course_grade_factory import CourseGradeFactory
-from openedx.core.djangoapps.catalog.utils import get_programs, get_fulfillable_course_runs_for_entitlement
+from openedx.core.djangoapps.catalog.utils import (
+    get_fulfillable_course_runs_for_entitlement,
+    get_programs,
+    get_programs_version
+)
 from openedx.core.djangoapps.commerce.utils import ecommerce_api_client
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.credentials.utils import get_credentials
+from openedx.core.djangoapps.programs.models import ProgramProgress
 from student.models import CourseEnrollment
 from util.date_utils import strftime_localized
 from xmodule.modulestore.django import modulestore
@@ -35,6 +40,11 @@ from xmodule.modulestore.django import modulestore
 # The datetime module's strftime() methods require a year >= 1900.
 DEFAULT_ENROLLMENT_START_DATE = datetime.datetime(1900, 1, 1, tzinfo=utc)
 
+# Maximum age of a ProgramProgress record. Progress also depends on upgrade deadlines
+# and entitlement expiration, which don't signal changes, so records are recomputed
+# periodically even when nothing marks them stale.
+PROGRAM_PROGRESS_MAX_AGE = datetime.timedelta(days=1)
+
 log = logging.getLogger(__name__)
 
 
@@ -48,12 +58,16 @@ def attach_program_detail_url(programs, mobile_only=False):
 
     Facilitates the building of context to be passed to templates containing program data.
 
+    The given program dicts may be shared with the process-local copy of the programs
+    kept by get_programs, so they are left unchanged.
+
     Arguments:
         programs (list): Containing dicts representing programs.
 
     Returns:
-        list, containing extended program dicts
+        list, containing extended copies of the program dicts
     """
+    extended_programs = []
     for program in programs:
         if mobile_only:
             detail_fragment_url = reverse('program_details_fragment_view', kwargs={'program_uuid': program['uuid']})
@@ -62,9 +76,9 @@ def attach_program_detail_url(programs, mobile_only=False):
         else:
             detail_url = reverse('program_details_view', kwargs={'program_uuid': program['uuid']})
 
-        program['detail_url'] = detail_url
+        extended_programs.append(dict(program, detail_url=detail_url))
 
-    return programs
+    return extended_programs
 
 
 class ProgramProgressMeter(object):
@@ -394,6 +408,84 @@ class ProgramProgressMeter(object):
         return any(course_run['key'] in self.course_run_ids for course_run in course['course_runs'])
 
 
+def _compute_program_progress(site, user):
+    """Gauge the user's progress towards the site's programs, in the form stored by ProgramProgress."""
+    meter = ProgramProgressMeter(site, user)
+    return {
+        'engaged_programs': [program['uuid'] for program in meter.engaged_programs],
+        'completed_programs': meter.completed_programs,
+        'progress': meter.progress(),
+    }
+
+
+def update_program_progress(site, user):
+    """Recompute and store the user's progress towards the site's programs.
+
+    Arguments:
+        site (Site): The site whose programs to gauge progress against.
+        user (User): The user whose progress to gauge.
+
+    Returns:
+        ProgramProgress
+    """
+    # Read the version before computing so that programs re-cached in the
+    # meantime leave the record looking stale rather than fresh.
+    programs_version = get_programs_version(site) or ''
+    record, __ = ProgramProgress.objects.update_or_create(
+        user=user,
+        site=site,
+        defaults={
+            'programs_version': programs_version,
+            'data': _compute_program_progress(site, user),
+        }
+    )
+    return record
+
+
+def get_program_progress(site, user, mobile_only=False):
+    """Read the user's progress towards the site's programs.
+
+    Progress is read from the user's ProgramProgress record, which is recomputed
+    if it is stale. Progress is computed without being stored when the site's
+    programs have no cached version.
+
+    Arguments:
+        site (Site): The site whose programs to gauge progress against.
+        user (User): The user whose progress to gauge.
+
+    Keyword Arguments:
+        mobile_only (bool): Whether program detail URLs should point to mobile views.
+
+    Returns:
+        dict, containing the programs the user is engaged in ordered by most recent
+            enrollment, count-only progress towards each of these programs (as
+            returned by ProgramProgressMeter.progress), and the UUIDs of programs
+            the user has completed.
+    """
+    programs_version = get_programs_version(site)
+    if programs_version is None:
+        meter = ProgramProgressMeter(site, user, mobile_only=mobile_only)
+        return {
+            'programs': meter.engaged_programs,
+            'progress': meter.progress(),
+            'completed_programs': meter.completed_programs,
+        }
+
+    record = ProgramProgress.objects.filter(user=user, site=site).first()
+    if record is None or not record.is_fresh(programs_version, PROGRAM_PROGRESS_MAX_AGE):
+        record = update_program_progress(site, user)
+    data = record.data
+
+    programs_by_uuid = {program['uuid']: program for program in get_programs(site)}
+    engaged_programs = [programs_by_uuid[uuid] for uuid in data['engaged_programs'] if uuid in programs_by_uuid]
+
+    return {
+        'programs': attach_program_detail_url(engaged_programs, mobile_only),
+        'progress': data['progress'],
+        'completed_programs': data['completed_programs'],
+    }
+
+
 # pylint: disable=missing-docstring
 class ProgramDataExtender(object):
     """
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def index_site_configuration_orgs(apps, schema_editor):
+    """
+    Index the organizations of the existing site configurations.
+    """
+    SiteConfiguration = apps.get_model('site_configuration', 'SiteConfiguration')
+    SiteConfigurationOrg = apps.get_model('site_configuration', 'SiteConfigurationOrg')
+
+    for configuration in SiteConfiguration.objects.all():
+        try:
+            course_org_filter = configuration.values.get('course_org_filter', [])
+        except AttributeError:
+            continue
+        if not isinstance(course_org_filter, list):
+            course_org_filter = [course_org_filter]
+        SiteConfigurationOrg.objects.bulk_create(
+            SiteConfigurationOrg(site_configuration=configuration, org=org)
+            for org in set(course_org_filter) if isinstance(org, basestring)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('site_configuration', '0002_auto_20160720_0231'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteConfigurationOrg',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('org', models.CharField(max_length=255, db_index=True)),
+                ('site_configuration', models.ForeignKey(related_name='orgs', to='site_configuration.SiteConfiguration', on_delete=django.db.models.deletion.CASCADE)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='siteconfigurationorg',
+            unique_together=set([('site_configuration', 'org')]),
+        ),
+        migrations.RunPython(index_site_configuration_orgs, migrations.RunPython.noop),
+    ]
@@ -60,6 +60,21 @@ class SiteConfiguration(models.Model):
 
         return default
 
+    def get_course_org_filter(self):
+        """
+        Return the list of organizations in the configuration's `course_org_filter`,
+        whether or not the configuration is enabled.
+        """
+        try:
+            course_org_filter = self.values.get('course_org_filter', [])  # pylint: disable=no-member
+        except AttributeError:
+            return []
+        # The value of 'course_org_filter' can be configured as a string representing
+        # a single organization or a list of strings representing multiple organizations.
+        if not isinstance(course_org_filter, list):
+            course_org_filter = [course_org_filter]
+        return course_org_filter
+
     @classmethod
     def get_value_for_org(cls, org, name, default=None):
         """
@@ -74,15 +89,10 @@ class SiteConfiguration(models.Model):
         Returns:
             Configuration value for the given key.
         """
-        for configuration in cls.objects.filter(values__contains=org, enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            # The value of 'course_org_filter' can be configured as a string representing
-            # a single organization or a list of strings representing multiple organizations.
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            if org in course_org_filter:
-                return configuration.get_value(name, default)
-        return default
+        configuration = cls.objects.filter(orgs__org=org, enabled=True).first()
+        if configuration is None:
+            return default
+        return configuration.get_value(name, default)
 
     @classmethod
     def get_all_orgs(cls):
@@ -93,14 +103,9 @@ class SiteConfiguration(models.Model):
         Returns:
             A list of all organizations present in site configuration.
         """
-        org_filter_set = set()
-
-        for configuration in cls.objects.filter(values__contains='course_org_filter', enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            org_filter_set.update(course_org_filter)
-        return org_filter_set
+        return set(
+            SiteConfigurationOrg.objects.filter(site_configuration__enabled=True).values_list('org', flat=True)
+        )
 
     @classmethod
     def has_org(cls, org):
@@ -113,6 +118,29 @@ class SiteConfiguration(models.Model):
         return org in cls.get_all_orgs()
 
 
+class SiteConfigurationOrg(models.Model):
+    """
+    Index of the organizations in the `course_org_filter` of each site configuration,
+    so that the configuration of an organization can be looked up without scanning the
+    values of every configuration. Kept up to date when site configurations are saved.
+
+    Fields:
+        site_configuration (ForeignKey): foreign-key to SiteConfiguration
+        org (CharField): an organization in the configuration's course_org_filter
+    """
+    site_configuration = models.ForeignKey(SiteConfiguration, related_name='orgs', on_delete=models.CASCADE)
+    org = models.CharField(max_length=255, db_index=True)
+
+    class Meta:
+        unique_together = ('site_configuration', 'org')
+
+    def __unicode__(self):
+        return u"<SiteConfigurationOrg: {org}, {site_configuration} >".format(
+            org=self.org,
+            site_configuration=self.site_configuration,
+        )
+
+
 class SiteConfigurationHistory(TimeStampedModel):
     """
     This is an archive table for SiteConfiguration, so that we can maintain a history of
@@ -159,3 +187,23 @@ def update_site_configuration_history(sender, instance, **kwargs):  # pylint: di
         values=instance.values,
         enabled=instance.enabled,
     )
+
+
+@receiver(post_save, sender=SiteConfiguration)
+def update_site_configuration_orgs(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Update the organizations indexed for a site configuration when it is saved.
+
+    Args:
+        sender: sender of the signal i.e. SiteConfiguration model
+        instance: SiteConfiguration instance associated with the current signal
+        **kwargs: extra key word arguments
+    """
+    orgs = set(org for org in instance.get_course_org_filter() if isinstance(org, basestring))
+    indexed_orgs = set(instance.orgs.values_list('org', flat=True))
+
+    if indexed_orgs - orgs:
+        instance.orgs.filter(org__in=indexed_orgs - orgs).delete()
+    SiteConfigurationOrg.objects.bulk_create(
+        SiteConfigurationOrg(site_configuration=instance, org=org) for org in orgs - indexed_orgs
+    )
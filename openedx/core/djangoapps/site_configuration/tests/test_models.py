@@ -317,3 +317,48 @@ class SiteConfigurationTests(TestCase):
             list(SiteConfiguration.get_all_orgs()),
             expected_orgs,
         )
+
+    def test_org_index_updated_on_save(self):
+        """
+        Test that the indexed orgs of a site configuration follow changes to its course_org_filter.
+        """
+        site_configuration = SiteConfigurationFactory.create(
+            site=self.site,
+            values=self.test_config1,
+        )
+        self.assertEqual(
+            SiteConfiguration.get_value_for_org('TestX', 'university'),
+            'Test University',
+        )
+
+        site_configuration.values = dict(self.test_config1, course_org_filter=['TestY', 'TestZ'])
+        site_configuration.save()
+
+        self.assertIsNone(SiteConfiguration.get_value_for_org('TestX', 'university'))
+        self.assertEqual(
+            SiteConfiguration.get_value_for_org('TestZ', 'university'),
+            'Test University',
+        )
+        self.assertSetEqual(
+            set(site_configuration.orgs.values_list('org', flat=True)),
+            {'TestY', 'TestZ'},
+        )
+
+    def test_get_value_for_org_query_count(self):
+        """
+        Test that get_value_for_org does not scan every site configuration.
+        """
+        SiteConfigurationFactory.create(
+            site=self.site,
+            values=self.test_config1,
+        )
+        SiteConfigurationFactory.create(
+            site=self.site2,
+            values=self.test_config2,
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                SiteConfiguration.get_value_for_org('TestAnotherX', 'university'),
+                'Test Another University',
+            )
@@ -1,5 +1,6 @@
 
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ThemingConfig(AppConfig):
@@ -9,3 +10,9 @@ class ThemingConfig(AppConfig):
     def ready(self):
         # settings validations related to theming.
         from . import checks
+
+        # List the templates of all the themes up front, so that no request has to.
+        from .helpers import get_theme_base_dirs_unchecked, get_theme_template_names, get_themes_unchecked
+        if settings.ENABLE_COMPREHENSIVE_THEMING:
+            for theme in get_themes_unchecked(get_theme_base_dirs_unchecked(), settings.PROJECT_ROOT):
+                get_theme_template_names(theme)
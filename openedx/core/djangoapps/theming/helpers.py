@@ -23,6 +23,13 @@ from request_cache.middleware import RequestCache, request_cached
 
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# Directory containing each theme, keyed by the configured theme base directories and the theme's directory name.
+_theme_base_dirs = {}
+
+# Templates in each theme's templates directory, keyed by that directory. Each entry is a
+# (modification times of the directories, frozenset of template paths relative to the directory) tuple.
+_theme_templates = {}
+
 
 @request_cached
 def get_template_path(relative_path, **kwargs):
@@ -82,14 +89,57 @@ def get_template_path_with_theme(relative_path):
     # strip `/` if present at the start of relative_path
     template_name = re.sub(r'^/+', '', relative_path)
 
-    template_path = theme.template_path / template_name
-    absolute_path = theme.path / "templates" / template_name
-    if absolute_path.exists():
-        return str(template_path)
+    if template_name in get_theme_template_names(theme):
+        return str(theme.template_path / template_name)
     else:
         return relative_path
 
 
+def get_theme_template_names(theme):
+    """
+    Returns the paths, relative to the theme's templates directory, of all the templates in the given theme.
+
+    The templates directory of each theme is scanned once per process, so that resolving the templates of a
+    theme does not touch the filesystem. When settings.DEBUG is set, the directory is scanned again whenever
+    a template is added to or removed from it.
+
+    Parameters:
+        theme (Theme): the theme whose templates to list
+
+    Returns:
+        (frozenset): template paths relative to the theme's templates directory e.g. 'footer.html'
+    """
+    templates_dir = theme.path / "templates"
+    entry = _theme_templates.get(templates_dir)
+    if entry is None or (settings.DEBUG and entry[0] != _get_directory_mtimes(templates_dir)):
+        entry = _theme_templates[templates_dir] = _scan_templates_dir(templates_dir)
+    return entry[1]
+
+
+def _get_directory_mtimes(templates_dir):
+    """
+    Returns the modification times of templates_dir and all of its subdirectories,
+    which change whenever a file is added to or removed from them.
+    """
+    return tuple(
+        os.path.getmtime(dir_path) for dir_path, __, __ in os.walk(templates_dir, followlinks=True)
+    )
+
+
+def _scan_templates_dir(templates_dir):
+    """
+    Returns a (directory modification times, template paths) tuple for templates_dir.
+    """
+    mtimes = []
+    template_names = set()
+    for dir_path, __, file_names in os.walk(templates_dir, followlinks=True):
+        mtimes.append(os.path.getmtime(dir_path))
+        relative_dir = os.path.relpath(dir_path, templates_dir)
+        for file_name in file_names:
+            template_names.add(os.path.normpath(os.path.join(relative_dir, file_name)))
+    return tuple(mtimes), frozenset(template_names)
+
+
 def get_all_theme_template_dirs():
     """
     Returns template directories for all the themes.
@@ -247,8 +297,14 @@ def get_theme_base_dir(theme_dir_name, suppress_error=False):
     Returns:
         (str): Base directory that contains the given theme
     """
-    for themes_dir in get_theme_base_dirs():
+    theme_base_dirs = get_theme_base_dirs()
+    cache_key = (tuple(theme_base_dirs), theme_dir_name)
+    if cache_key in _theme_base_dirs:
+        return _theme_base_dirs[cache_key]
+
+    for themes_dir in theme_base_dirs:
         if theme_dir_name in get_theme_dirs(themes_dir):
+            _theme_base_dirs[cache_key] = themes_dir
             return themes_dir
 
     if suppress_error:
@@ -2,6 +2,7 @@
 Test helpers for Comprehensive Theming.
 """
 from mock import patch, Mock
+from path import Path
 
 from django.test import TestCase, override_settings
 from django.conf import settings
@@ -12,6 +13,7 @@ from openedx.core.djangoapps.theming import helpers as theming_helpers
 from openedx.core.djangoapps.theming.helpers import get_template_path_with_theme, strip_site_theme_templates_path, \
     get_themes, Theme, get_theme_base_dir
 from openedx.core.djangolib.testing.utils import skip_unless_cms, skip_unless_lms
+from openedx.core.lib.tempdir import mkdtemp_clean
 from request_cache.middleware import RequestCache
 
 
@@ -206,6 +208,47 @@ class TestHelpers(TestCase):
                     self.assertEqual(theming_helpers.get_template_path("about.html"), "/microsite/about.html")
 
 
+class TestThemeTemplateNames(TestCase):
+    """Test the listing of the templates of a theme."""
+
+    def setUp(self):
+        super(TestThemeTemplateNames, self).setUp()
+        themes_dir = Path(mkdtemp_clean())
+        self.templates_dir = themes_dir / 'temp-theme' / 'lms' / 'templates'
+        self.templates_dir.makedirs()
+        (self.templates_dir / 'footer.html').write_text(u'<footer/>')
+        self.theme = Theme('temp-theme', 'temp-theme', themes_dir, settings.PROJECT_ROOT)
+
+    def add_template(self):
+        """
+        Adds a template in a new subdirectory of the theme's templates directory.
+        """
+        (self.templates_dir / 'courseware').makedirs()
+        (self.templates_dir / 'courseware' / 'courses.html').write_text(u'<div/>')
+
+    def test_template_names(self):
+        self.add_template()
+        self.assertEqual(
+            theming_helpers.get_theme_template_names(self.theme),
+            frozenset(['footer.html', 'courseware/courses.html']),
+        )
+
+    @override_settings(DEBUG=False)
+    def test_template_names_listed_once(self):
+        theming_helpers.get_theme_template_names(self.theme)
+        self.add_template()
+        self.assertEqual(theming_helpers.get_theme_template_names(self.theme), frozenset(['footer.html']))
+
+    @override_settings(DEBUG=True)
+    def test_template_names_listed_again_on_change_in_debug(self):
+        theming_helpers.get_theme_template_names(self.theme)
+        self.add_template()
+        self.assertEqual(
+            theming_helpers.get_theme_template_names(self.theme),
+            frozenset(['footer.html', 'courseware/courses.html']),
+        )
+
+
 @skip_unless_lms
 class TestHelpersLMS(TestCase):
     """Test comprehensive theming helper functions."""
@@ -226,6 +269,20 @@ class TestHelpersLMS(TestCase):
         template_path = get_template_path_with_theme('course.html')
         self.assertEqual(template_path, 'course.html')
 
+    @with_comprehensive_theme('red-theme')
+    def test_get_template_path_with_theme_does_not_touch_filesystem(self):
+        """
+        Tests themed template paths are resolved without listing or checking the theme's files.
+        """
+        get_template_path_with_theme('header.html')
+        with patch('os.walk') as mock_walk, patch('os.listdir') as mock_listdir:
+            with patch('path.Path.exists') as mock_exists:
+                self.assertEqual(get_template_path_with_theme('header.html'), 'red-theme/lms/templates/header.html')
+                self.assertEqual(get_template_path_with_theme('course.html'), 'course.html')
+        self.assertFalse(mock_walk.called)
+        self.assertFalse(mock_listdir.called)
+        self.assertFalse(mock_exists.called)
+
     def test_get_template_path_with_theme_disabled(self):
         """
         Tests default template paths are returned when theme is non theme is enabled.
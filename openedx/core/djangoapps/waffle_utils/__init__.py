@@ -3,6 +3,9 @@ Utilities for waffle.
 
 Includes namespacing, caching, and course overrides for waffle flags.
 
+Switches, flags and course overrides are read from a process-wide snapshot of
+their models, which is reloaded whenever any of them changes. See snapshot.py.
+
 Usage:
 
 For Waffle Flags, first set up the namespace, and then create flags using the
@@ -52,10 +55,11 @@ from contextlib import contextmanager
 
 import six
 from opaque_keys.edx.keys import CourseKey
-from waffle import flag_is_active, switch_is_active
 
 from request_cache import get_cache as get_request_cache
 
+from .snapshot import get_flag, is_flag_active, is_switch_active
+
 log = logging.getLogger(__name__)
 
 
@@ -118,7 +122,7 @@ class WaffleSwitchNamespace(WaffleNamespace):
         namespaced_switch_name = self._namespaced_name(switch_name)
         value = self._cached_switches.get(namespaced_switch_name)
         if value is None:
-            value = switch_is_active(namespaced_switch_name)
+            value = is_switch_active(namespaced_switch_name)
             self._cached_switches[namespaced_switch_name] = value
         return value
 
@@ -233,9 +237,6 @@ class WaffleFlagNamespace(WaffleNamespace):
             flag_undefined_default (Boolean): A default value to be returned if
                 the waffle flag is to be checked, but doesn't exist.
         """
-        # Import is placed here to avoid model import at project startup.
-        from waffle.models import Flag
-
         # validate arguments
         namespaced_flag_name = self._namespaced_name(flag_name)
         value = None
@@ -250,15 +251,13 @@ class WaffleFlagNamespace(WaffleNamespace):
 
                 if flag_undefined_default is not None:
                     # determine if the flag is undefined in waffle
-                    try:
-                        Flag.objects.get(name=namespaced_flag_name)
-                    except Flag.DoesNotExist:
+                    if get_flag(namespaced_flag_name) is None:
                         value = flag_undefined_default
 
                 if value is None:
                     request = crum.get_current_request()
                     if request:
-                        value = flag_is_active(request, namespaced_flag_name)
+                        value = is_flag_active(request, namespaced_flag_name)
                     else:
                         log.warn(u"%sFlag '%s' accessed without a request", self.log_prefix, namespaced_flag_name)
                         # Return the default value if not in a request context.
@@ -2,6 +2,8 @@
 Models for configuring waffle utils.
 """
 from django.db.models import CharField
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 from model_utils import Choices
 from six import text_type
@@ -9,6 +11,9 @@ from six import text_type
 from config_models.models import ConfigurationModel
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
 from request_cache.middleware import request_cached
+from waffle.models import Flag, Switch
+
+from .snapshot import get_course_override, invalidate_snapshot
 
 
 class WaffleFlagCourseOverrideModel(ConfigurationModel):
@@ -46,10 +51,7 @@ class WaffleFlagCourseOverrideModel(ConfigurationModel):
         if not course_id or not waffle_flag:
             return cls.ALL_CHOICES.unset
 
-        effective = cls.objects.filter(waffle_flag=waffle_flag, course_id=course_id).order_by('-change_date').first()
-        if effective and effective.enabled:
-            return effective.override_choice
-        return cls.ALL_CHOICES.unset
+        return get_course_override(waffle_flag, course_id) or cls.ALL_CHOICES.unset
 
     class Meta(object):
         app_label = "waffle_utils"
@@ -60,3 +62,16 @@ class WaffleFlagCourseOverrideModel(ConfigurationModel):
         enabled_label = "Enabled" if self.enabled else "Not Enabled"
         # pylint: disable=no-member
         return u"Course '{}': Persistent Grades {}".format(text_type(self.course_id), enabled_label)
+
+
+@receiver(post_save, sender=Switch)
+@receiver(post_delete, sender=Switch)
+@receiver(post_save, sender=Flag)
+@receiver(post_delete, sender=Flag)
+@receiver(post_save, sender=WaffleFlagCourseOverrideModel)
+@receiver(post_delete, sender=WaffleFlagCourseOverrideModel)
+def invalidate_waffle_snapshot(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Reloads the snapshot of waffle settings when any of them changes.
+    """
+    invalidate_snapshot()
@@ -0,0 +1,160 @@
+"""
+A process-wide snapshot of waffle switches, flags and course overrides of flags.
+
+Each kind of setting is loaded with a single query the first time it is
+needed, after which checking a switch, flag or course override costs a
+dictionary lookup. The snapshot is tagged with a generation stored in the
+django cache, which changes whenever any switch, flag or course override is
+saved or deleted, and it is reloaded when its generation is no longer the
+current one. The current generation is read from the cache at most once per
+request. If the cache does not keep the generation, as with a dummy cache,
+the settings are only kept for the duration of the request.
+"""
+import threading
+from uuid import uuid4
+
+from django.core.cache import cache
+
+from request_cache import get_cache as get_request_cache
+
+SNAPSHOT_GENERATION_CACHE_KEY = u'waffle_utils.snapshot.generation'
+
+_lock = threading.Lock()
+
+# The generation of the loaded settings, and the loaded settings keyed by kind.
+_snapshot = {'generation': None}
+
+
+def _get_request_cache():
+    """
+    Returns the request cache of the snapshot.
+    """
+    return get_request_cache('waffle_utils.snapshot')
+
+
+def _get_current_generation():
+    """
+    Returns the current generation of the snapshot, as read from the django
+    cache once per request, or None if the cache does not keep it.
+    """
+    request_cache = _get_request_cache()
+    if 'generation' not in request_cache:
+        generation = cache.get(SNAPSHOT_GENERATION_CACHE_KEY)
+        if generation is None:
+            # Another process may start a generation at the same time, in
+            # which case the first one to be stored wins.
+            cache.add(SNAPSHOT_GENERATION_CACHE_KEY, uuid4().hex, None)
+            generation = cache.get(SNAPSHOT_GENERATION_CACHE_KEY)
+        request_cache['generation'] = generation
+    return request_cache['generation']
+
+
+def _get_settings(kind, load):
+    """
+    Returns the snapshot of the given kind of settings, loading it with the
+    given function if it is not loaded for the current generation.
+    """
+    generation = _get_current_generation()
+    if generation is None:
+        request_cache = _get_request_cache()
+        if kind not in request_cache:
+            request_cache[kind] = load()
+        return request_cache[kind]
+
+    with _lock:
+        if _snapshot['generation'] != generation:
+            _snapshot.clear()
+            _snapshot['generation'] = generation
+        if kind not in _snapshot:
+            _snapshot[kind] = load()
+        return _snapshot[kind]
+
+
+def _load_switches():
+    """
+    Returns a dictionary mapping the name of every switch to whether it is active.
+    """
+    # Import is placed here to avoid model import at project startup.
+    from waffle.models import Switch
+    return dict(Switch.objects.values_list('name', 'active'))
+
+
+def _load_flags():
+    """
+    Returns a dictionary mapping the name of every flag to the flag.
+    """
+    # Import is placed here to avoid model import at project startup.
+    from waffle.models import Flag
+    return {flag.name: flag for flag in Flag.objects.all()}
+
+
+def _load_course_overrides():
+    """
+    Returns a dictionary mapping every (flag name, course id) pair that has a
+    course override to the choice of its current override, or to
+    ALL_CHOICES.unset if the current override is disabled.
+    """
+    # Import is placed here to avoid model import at project startup.
+    from .models import WaffleFlagCourseOverrideModel
+    overrides = {}
+    for override in WaffleFlagCourseOverrideModel.objects.order_by('change_date', 'id'):
+        key = (override.waffle_flag, override.course_id)
+        if override.enabled:
+            overrides[key] = override.override_choice
+        else:
+            overrides[key] = WaffleFlagCourseOverrideModel.ALL_CHOICES.unset
+    return overrides
+
+
+def is_switch_active(switch_name):
+    """
+    Returns whether the given waffle switch is active, falling back to
+    waffle's default for switches that do not exist.
+    """
+    switches = _get_settings('switches', _load_switches)
+    if switch_name in switches:
+        return switches[switch_name]
+
+    # Import is placed here to avoid model import at project startup.
+    from waffle.utils import get_setting
+    return get_setting('SWITCH_DEFAULT')
+
+
+def get_flag(flag_name):
+    """
+    Returns the waffle flag with the given name, or None if it does not exist.
+    """
+    return _get_settings('flags', _load_flags).get(flag_name)
+
+
+def is_flag_active(request, flag_name):
+    """
+    Returns whether the given waffle flag is active for the request, falling
+    back to waffle's default for flags that do not exist.
+    """
+    flag = get_flag(flag_name)
+    if flag is None:
+        # Import is placed here to avoid model import at project startup.
+        from waffle.models import Flag
+        flag = Flag(name=flag_name)
+    return flag.is_active(request)
+
+
+def get_course_override(flag_name, course_id):
+    """
+    Returns the choice of the current override of the given waffle flag for
+    the course, or None if the flag has never been overridden for the course.
+    """
+    return _get_settings('course_overrides', _load_course_overrides).get((flag_name, course_id))
+
+
+def invalidate_snapshot():
+    """
+    Starts a new generation of the snapshot, so that every process reloads
+    its settings, starting with this one.
+    """
+    with _lock:
+        _snapshot.clear()
+        _snapshot['generation'] = None
+    _get_request_cache().clear()
+    cache.set(SNAPSHOT_GENERATION_CACHE_KEY, uuid4().hex, None)
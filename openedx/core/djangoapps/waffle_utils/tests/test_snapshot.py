@@ -0,0 +1,117 @@
+"""
+Tests for the snapshot of waffle settings.
+"""
+from django.test.client import RequestFactory
+from opaque_keys.edx.keys import CourseKey
+from request_cache.middleware import RequestCache
+from waffle.models import Flag, Switch
+
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+
+from .. import snapshot
+from ..models import WaffleFlagCourseOverrideModel
+
+
+class SnapshotTests(CacheIsolationTestCase):
+    """
+    Tests of the process-wide snapshot of waffle switches, flags and course overrides.
+    """
+    ENABLED_CACHES = ['default']
+
+    TEST_COURSE_KEY = CourseKey.from_string("edX/DemoX/Demo_Course")
+
+    def setUp(self):
+        super(SnapshotTests, self).setUp()
+        snapshot.invalidate_snapshot()
+        RequestCache.clear_request_cache()
+
+    def test_switches_loaded_once(self):
+        Switch.objects.create(name='test.on', active=True)
+        Switch.objects.create(name='test.off', active=False)
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(snapshot.is_switch_active('test.on'))
+            self.assertFalse(snapshot.is_switch_active('test.off'))
+            self.assertFalse(snapshot.is_switch_active('test.undefined'))
+
+        # The snapshot is shared by later requests of the same generation.
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(0):
+            self.assertTrue(snapshot.is_switch_active('test.on'))
+
+    def test_flags_loaded_once(self):
+        Flag.objects.create(name='test.everyone', everyone=True)
+        RequestCache.clear_request_cache()
+        request = RequestFactory().request()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(snapshot.is_flag_active(request, 'test.everyone'))
+            self.assertIsNotNone(snapshot.get_flag('test.everyone'))
+            self.assertIsNone(snapshot.get_flag('test.undefined'))
+            self.assertFalse(snapshot.is_flag_active(request, 'test.undefined'))
+
+    def test_course_overrides_loaded_once(self):
+        course_2_key = CourseKey.from_string("edX/DemoX/Demo_Course_2")
+        for flag_name, course_key, enabled in (
+                ('test.flag', self.TEST_COURSE_KEY, True),
+                ('test.flag', course_2_key, True),
+                ('test.flag', course_2_key, False),
+        ):
+            WaffleFlagCourseOverrideModel.objects.create(
+                waffle_flag=flag_name,
+                course_id=course_key,
+                override_choice=WaffleFlagCourseOverrideModel.ALL_CHOICES.off,
+                enabled=enabled,
+            )
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                snapshot.get_course_override('test.flag', self.TEST_COURSE_KEY),
+                WaffleFlagCourseOverrideModel.ALL_CHOICES.off,
+            )
+            self.assertEqual(
+                snapshot.get_course_override('test.flag', course_2_key),
+                WaffleFlagCourseOverrideModel.ALL_CHOICES.unset,
+            )
+            self.assertIsNone(snapshot.get_course_override('test.other_flag', self.TEST_COURSE_KEY))
+
+    def test_reloaded_on_change(self):
+        switch = Switch.objects.create(name='test.switch', active=True)
+        RequestCache.clear_request_cache()
+        self.assertTrue(snapshot.is_switch_active('test.switch'))
+
+        # Changes are seen right away by the process that makes them.
+        switch.active = False
+        switch.save()
+        self.assertFalse(snapshot.is_switch_active('test.switch'))
+
+        switch.delete()
+        self.assertFalse(snapshot.is_switch_active('test.switch'))
+
+    def test_reloaded_on_new_generation(self):
+        Switch.objects.create(name='test.switch', active=True)
+        RequestCache.clear_request_cache()
+        self.assertTrue(snapshot.is_switch_active('test.switch'))
+
+        # Another process changes a switch.
+        Switch.objects.filter(name='test.switch').update(active=False)
+        snapshot.cache.set(snapshot.SNAPSHOT_GENERATION_CACHE_KEY, 'another generation', None)
+
+        # The generation is only checked once per request.
+        self.assertTrue(snapshot.is_switch_active('test.switch'))
+        RequestCache.clear_request_cache()
+        self.assertFalse(snapshot.is_switch_active('test.switch'))
+
+
+class WithoutCacheTests(CacheIsolationTestCase):
+    """
+    Tests of the snapshot when the django cache does not keep its generation.
+    """
+    def test_reloaded_every_request(self):
+        Switch.objects.create(name='test.switch', active=True)
+        for __ in range(2):
+            RequestCache.clear_request_cache()
+            with self.assertNumQueries(1):
+                self.assertTrue(snapshot.is_switch_active('test.switch'))
@@ -4,18 +4,23 @@ Tests for xblock_utils.py
 from __future__ import absolute_import, unicode_literals
 
 import uuid
+from functools import partial
 
 import ddt
+from django.core.cache import caches
+from mock import Mock, patch
 from django.test.client import RequestFactory
 from nose.plugins.attrib import attr
 from xblock.fragment import Fragment
 
+from openedx.core.djangoapps.contentserver.caching import del_cached_content, invalidate_assets_version
 from openedx.core.lib.url_utils import quote_slashes
 from openedx.core.lib.xblock_builtin import get_css_dependencies, get_js_dependencies
 from openedx.core.lib.xblock_utils import (
     replace_course_urls,
     replace_jump_to_id_urls,
     replace_static_urls,
+    replace_urls_with_cache,
     request_token,
     sanitize_html_id,
     wrap_fragment,
@@ -23,7 +28,7 @@ from openedx.core.lib.xblock_utils import (
 )
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
-from xmodule.modulestore.tests.factories import CourseFactory
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
 
 @attr(shard=2)
@@ -170,6 +175,52 @@ class TestXblockUtils(SharedModuleStoreTestCase):
         self.assertIsInstance(test_replace, Fragment)
         self.assertEqual(test_replace.content, anchor_tag)
 
+    def test_replace_urls_with_cache(self):
+        """
+        Verify that the rewritten html of an html block is cached.
+        """
+        content_cache_patcher = patch('openedx.core.djangoapps.contentserver.caching.CONTENT_CACHE', caches['default'])
+        content_cache_patcher.start()
+        self.addCleanup(content_cache_patcher.stop)
+
+        course = self.course_split
+        html_block = ItemFactory.create(parent=course, category='html', data='<a href="/static/id">')
+        url_rewriter = Mock(wraps=partial(replace_static_urls, None, course_id=course.id))
+
+        def render(content):
+            """
+            Returns the rewritten content of the html block.
+            """
+            return replace_urls_with_cache(
+                url_rewriters=[url_rewriter],
+                cache_key_parts=(course.id,),
+                block=html_block,
+                view='student_view',
+                frag=self.create_fragment(content),
+                context=None,
+            )
+
+        for __ in range(2):
+            test_replace = render(html_block.data)
+            self.assertEqual(test_replace.content, '<a href="/asset-v1:TestX+TS02+2015+type@asset+block/id">')
+            self.assertEqual(test_replace.resources[0].data, 'body {background-color:red;}')
+        self.assertEqual(url_rewriter.call_count, 1)
+
+        # Changing an asset of the course invalidates the cached html.
+        del_cached_content(course.id.make_asset_key('asset', 'id'))
+        render(html_block.data)
+        self.assertEqual(url_rewriter.call_count, 2)
+
+        # So does starting a new version of the course's assets, as publishing the course does.
+        invalidate_assets_version(course.id)
+        render(html_block.data)
+        self.assertEqual(url_rewriter.call_count, 3)
+
+        # Content that differs from the stored html is not cached.
+        for __ in range(2):
+            render('<p>Hi</p>' + html_block.data)
+        self.assertEqual(url_rewriter.call_count, 5)
+
     def test_sanitize_html_id(self):
         """
         Verify that colons and dashes are replaced.
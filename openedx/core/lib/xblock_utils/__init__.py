@@ -3,6 +3,7 @@ Functions that can are used to modify XBlock fragments for use in the LMS and St
 """
 
 import datetime
+import hashlib
 import json
 import logging
 import markupsafe
@@ -14,6 +15,7 @@ from contracts import contract
 
 from django.conf import settings
 from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from pytz import UTC
 from django.utils.html import escape
@@ -25,12 +27,16 @@ from xblock.exceptions import InvalidScopeError
 from xblock.fragment import Fragment
 from xblock.scorable import ScorableXBlockMixin
 
+from openedx.core.djangoapps.contentserver.caching import get_assets_version
+from xmodule.html_module import HtmlBlock
 from xmodule.seq_module import SequenceModule
 from xmodule.vertical_block import VerticalBlock
 from xmodule.x_module import shim_xmodule_js, XModuleDescriptor, XModule, PREVIEW_VIEWS, STUDIO_VIEW
 
 log = logging.getLogger(__name__)
 
+REWRITTEN_HTML_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+
 
 def wrap_fragment(fragment, new_content):
     """
@@ -253,6 +259,51 @@ def replace_static_urls(data_dir, block, view, frag, context, course_id=None, st
     ))
 
 
+def replace_urls_with_cache(url_rewriters, cache_key_parts, block, view, frag, context):
+    """
+    Applies the given url rewriting wrappers, such as replace_static_urls,
+    to the fragment in turn.
+
+    When the fragment of an html block holds its stored html unchanged, the
+    rewritten html is the same for every learner, so it is cached, keyed by
+    the stored html, the given cache_key_parts that the url_rewriters depend
+    on, such as the course id, the configuration of static assets and the
+    version of the course's assets, which changes whenever one of them is
+    saved, locked or deleted.
+    """
+    cache_key = None
+    if isinstance(block, HtmlBlock) and block.data and frag.content == block.data:
+        assets_version = get_assets_version(block.location.course_key)
+        if assets_version is not None:
+            cache_key = _rewritten_html_cache_key(frag.content, list(cache_key_parts) + [assets_version])
+            content = cache.get(cache_key)
+            if content is not None:
+                return wrap_fragment(frag, content)
+
+    for url_rewriter in url_rewriters:
+        frag = url_rewriter(block, view, frag, context)
+
+    if cache_key is not None:
+        cache.set(cache_key, frag.content, REWRITTEN_HTML_CACHE_TIMEOUT)
+    return frag
+
+
+def _rewritten_html_cache_key(content, cache_key_parts):
+    """
+    Returns the key of the cached rewritten html of the given content.
+    """
+    # Import is placed here to avoid model import at project startup.
+    from static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
+    key_parts = list(cache_key_parts) + [
+        settings.EDX_PLATFORM_REVISION,
+        AssetBaseUrlConfig.get_base_url(),
+        AssetExcludedExtensionsConfig.get_excluded_extensions(),
+    ]
+    key_hash = hashlib.sha1(repr(key_parts))
+    key_hash.update(content.encode('utf-8'))
+    return u'xblock_utils.rewritten_html.{}'.format(key_hash.hexdigest())
+
+
 def grade_histogram(module_id):
     '''
     Print out a histogram of grades on a given problem in staff member debug info.